@@ -7,17 +7,24 @@ from sdl_gui.window.window import Window
 from sdl_gui.layers.layer import Layer
 from sdl_gui.primitives.rectangle import Rectangle
 from sdl_gui import core
+import sdl2
 import sdl2.ext
 
+# Colors are immutable tuples built once; clicks swap references, never rebuild them.
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+HIGHLIGHT = (0, 255, 0, 255)
+
 def main():
     win = Window("Events Demo", 800, 600)
+    win.ignore_unused_events(text_input=False)  # No text input widgets here
     
     # Layer 1 (Bottom)
     layer1 = Layer(0, 0, "100%", "100%")
     rect1 = Rectangle(
         x="20%", y="20%", 
         width="40%", height="40%",
-        color=(255, 0, 0, 255), # Red
+        color=RED,
         id="rect_bottom",
         listen_events=[core.EVENT_CLICK]
     )
@@ -28,18 +35,23 @@ def main():
     rect2 = Rectangle(
         x="40%", y="40%", 
         width="40%", height="40%",
-        color=(0, 0, 255, 255), # Blue
+        color=BLUE,
         id="rect_top",
         listen_events=[core.EVENT_CLICK]
     )
     layer2.children = [rect2]
     
-    print("Click on rectangles. Blue is on top of Red.")
+    base_colors = {"rect_bottom": RED, "rect_top": BLUE}
+    rects = {"rect_bottom": rect1, "rect_top": rect2}
+
+    print("Click on rectangles. Blue is on top of Red. Clicked rectangles toggle green.")
+
+    # Display list with both layers (layer2 is drawn last -> on top).
+    # It is only rebuilt when a click actually changes a color.
+    display_list = [layer1.to_data(), layer2.to_data()]
 
     running = True
     while running:
-        # Display list with both layers (layer2 is drawn last -> on top)
-        display_list = [layer1.to_data(), layer2.to_data()]
         win.render(display_list)
         
         # Poll UI Events
@@ -51,12 +63,18 @@ def main():
                 target = event["target"]
                 print(f"Clicked: {target}")
                 
-                # Visual feedback
+                # Visual feedback: swap between the two precomputed tuples
                 if target == "rect_top":
                     print("  -> Top Blue Rect hit!")
                 elif target == "rect_bottom":
                     print("  -> Bottom Red Rect hit!")
 
+                rect = rects.get(target)
+                if rect is not None:
+                    base = base_colors[target]
+                    rect.color = HIGHLIGHT if rect.color is base else base
+                    display_list = [layer1.to_data(), layer2.to_data()]
+
         # Handle Quit manually (simple check)
         # Note: Window.get_ui_events() already drained events.
         # But just in case any residuals:
@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
 from sdl_gui.window.window import Window
 from sdl_gui.layers.layer import Layer
 from sdl_gui.layers.scrollable_layer import ScrollableLayer
+from sdl_gui import core
 from sdl_gui.layouts.vbox import VBox
 from sdl_gui.layouts.hbox import HBox
 from sdl_gui.primitives.rectangle import Rectangle
@@ -15,6 +16,7 @@ from sdl_gui.primitives.responsive_text import ResponsiveText
 def main():
     # Implicit parenting showcase
     with Window("Fake Wikipedia", 800, 600, debug=True) as window:
+        window.ignore_unused_events(text_input=False)  # No text input widgets here
 
         # Main Layout Layer
         with Layer(0, 0, "100%", "100%") as main_layer:
@@ -39,7 +41,8 @@ def main():
         # Layouts inside VBox would be better but let's assume we want a scrollable area below header.
         # Using VBox for main structure might be cleaner, let's try nesting.
         
-        with ScrollableLayer(0, 60, "100%", "90%", content_height=1200) as content:
+        with ScrollableLayer(0, 60, "100%", "90%", content_height=1200,
+                             id="content", listen_events=[core.EVENT_SCROLL]) as content:
             
             with VBox(0, 0, "100%", "auto", padding=20) as article:
                 
@@ -84,13 +87,22 @@ def main():
                             ResponsiveText(0, 0, "100%", "auto", text="First appeared: Feb 1991", size=12, margin=(0,0,5,0))
 
     # Render loop
+    # The page is static: walk the widget tree once and reuse the list.
+    # Scrolling only patches the scroll offset of the content layer in place.
+    root_list = window.get_root_display_list()
+    scroll_dict = next(d for d in root_list if d.get(core.KEY_ID) == "content")
+
     running = True
     while running:
-        window.render(window.get_root_display_list())
+        window.render(root_list)
         events = window.get_ui_events()
         for e in events:
             if e['type'] == 'quit':
                 running = False
+            elif e['type'] == core.EVENT_SCROLL and e['target'] == "content":
+                scroll_y = scroll_dict[core.KEY_SCROLL_Y] - e['delta'] * 20
+                content.scroll_y = max(0, min(scroll_y, content.content_height))
+                scroll_dict[core.KEY_SCROLL_Y] = content.scroll_y
                 
 if __name__ == "__main__":
     main()
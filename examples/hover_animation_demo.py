@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import ctypes
+import threading
 import sdl2
 import sdl2.ext
 
@@ -13,16 +14,27 @@ from sdl_gui.primitives.rectangle import Rectangle
 from sdl_gui.primitives.responsive_text import ResponsiveText
 from sdl_gui import core
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the helpers simply run as plain Python.
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
 def lerp(a, b, t):
     return a + (b - a) * t
 
-def lerp_color(c1, c2, t):
-    """Linear interpolation between two colors."""
+@njit(cache=True)
+def lerp_color(r1, g1, b1, a1, r2, g2, b2, a2, t):
+    """Linear interpolation between two colors given as unpacked RGBA channels."""
     return (
-        int(c1[0] + (c2[0] - c1[0]) * t),
-        int(c1[1] + (c2[1] - c1[1]) * t),
-        int(c1[2] + (c2[2] - c1[2]) * t),
-        int(c1[3] + (c2[3] - c1[3]) * t)
+        int(r1 + (r2 - r1) * t),
+        int(g1 + (g2 - g1) * t),
+        int(b1 + (b2 - b1) * t),
+        int(a1 + (a2 - a1) * t)
     )
 
 class AnimatedItem:
@@ -38,11 +50,18 @@ class AnimatedItem:
         self.target_color = kwargs.get('target_color', rect.color)
         self.kwargs = kwargs
 
+    def contains(self, mx, my):
+        # Stability is key. Base rect is safer.
+        return (self.base_x <= mx < self.base_x + self.base_w) and \
+               (self.base_y <= my < self.base_y + self.base_h)
+
+    def is_settled(self, mx, my):
+        """True when the item sits at rest at the end the mouse drives it to."""
+        return self.hover_t == (1.0 if self.contains(mx, my) else 0.0)
+
     def update(self, dt, mx, my):
         # Hit Test
-        # Stability is key. Base rect is safer.
-        is_hovered = (self.base_x <= mx < self.base_x + self.base_w) and \
-                     (self.base_y <= my < self.base_y + self.base_h)
+        is_hovered = self.contains(mx, my)
 
         # Update t
         direction = 1.0 if is_hovered else -1.0
@@ -58,7 +77,7 @@ class AnimatedItem:
             # Request: "transparent to given color"
             # So start color should have 0 alpha.
             # self.base_color is set in init.
-            current = lerp_color(self.base_color, self.target_color, t)
+            current = lerp_color(*self.base_color, *self.target_color, t)
             self.rect.color = current
 
         elif self.animation_type == 'scale':
@@ -84,9 +103,70 @@ class AnimatedItem:
             self.rect.y = int(self.base_y + offset)
 
 
+class FrameBuilder:
+    """
+    Fills display lists on a worker thread while the main thread renders.
+
+    Two lists are preallocated; the worker only mutates Python objects and
+    dicts, every SDL call stays on the main thread.
+    """
+
+    def __init__(self, background, items, labels):
+        self.background = background
+        self.items = items
+        self.labels = labels
+        self.lists = ([], [])
+        self.back = 0
+        self.frame = (0.0, 0, 0)
+        self.running = True
+        self.list_requested = threading.Event()
+        self.list_ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.list_requested.set()
+        self.thread.join()
+
+    def submit(self, dt, mx, my):
+        """Wake the worker to build the back list for this frame's input."""
+        self.frame = (dt, mx, my)
+        self.list_ready.clear()
+        self.list_requested.set()
+
+    def swap(self):
+        """Wait for the back list and return it as the new front list."""
+        self.list_ready.wait()
+        front = self.lists[self.back]
+        self.back ^= 1
+        return front
+
+    def _run(self):
+        while True:
+            self.list_requested.wait()
+            self.list_requested.clear()
+            if not self.running:
+                return
+            self._build(self.lists[self.back], *self.frame)
+            self.list_ready.set()
+
+    def _build(self, display_list, dt, mx, my):
+        display_list.clear()
+        display_list.append(self.background)
+        for item in self.items:
+            item.update(dt, mx, my)
+            display_list.append(item.rect.to_data())
+        for label in self.labels:
+            display_list.append(label.to_data())
+
+
 def main():
     width, height = 800, 400
     with Window("Advanced Hover Animations", width, height, debug=True) as win:
+        win.ignore_unused_events(text_input=False)  # No text input widgets here
         
         items = []
         
@@ -118,41 +198,52 @@ def main():
             ResponsiveText(600, 270, 100, "auto", text="Move", align="center", size=14),
         ]
 
-        running = True
-        last_time = time.time()
-        print("Starting main loop...")
+        # The background never changes: serialize it once.
+        background = Rectangle(0, 0, width, height, color=(30, 30, 30, 255)).to_data()
+        builder = FrameBuilder(background, items, labels)
+        builder.start()
+        try:
+            running = True
+            last_ns = time.monotonic_ns()
+            print("Starting main loop...")
+
+            # Mouse position buffers, allocated once and reused every frame
+            mouse_x, mouse_y = ctypes.c_int(0), ctypes.c_int(0)
+            mouse_x_ref, mouse_y_ref = ctypes.byref(mouse_x), ctypes.byref(mouse_y)
+
+            builder.submit(0.0, 0, 0)
+            display_list = builder.swap()
         
-        while running:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-            
-            # Events
-            events = sdl2.ext.get_events()
-            for event in events:
-                if event.type == sdl2.SDL_QUIT:
-                    running = False
-            
-            # Mouse
-            x, y = ctypes.c_int(0), ctypes.c_int(0)
-            sdl2.mouse.SDL_GetMouseState(ctypes.byref(x), ctypes.byref(y))
-            mx, my = x.value, y.value
-            
-            # Update Items
-            display_list = []
-            
-            # Bg
-            display_list.append(Rectangle(0, 0, width, height, color=(30, 30, 30, 255)).to_data())
+            while running:
+                now_ns = time.monotonic_ns()
+                dt = (now_ns - last_ns) * 1e-9
+                last_ns = now_ns
             
-            for item in items:
-                item.update(dt, mx, my)
-                display_list.append(item.rect.to_data())
-                
-            for label in labels:
-                display_list.append(label.to_data())
+                # Events
+                events = sdl2.ext.get_events()
+                for event in events:
+                    if event.type == sdl2.SDL_QUIT:
+                        running = False
             
-            win.render(display_list)
-            sdl2.SDL_Delay(8)
+                # Mouse
+                sdl2.mouse.SDL_GetMouseState(mouse_x_ref, mouse_y_ref)
+                mx, my = mouse_x.value, mouse_y.value
+
+                # Idle frames keep the current list and leave the worker asleep
+                dirty = not all(item.is_settled(mx, my) for item in items)
+                if dirty:
+                    builder.submit(dt, mx, my)
+
+                # Render the front list while the worker fills the back one.
+                # The renderer keeps the list it drew for diffing, so hand it a
+                # shallow snapshot rather than a buffer the worker will reuse.
+                win.render(list(display_list))
+                if dirty:
+                    display_list = builder.swap()
+                sdl2.SDL_Delay(8)
+        finally:
+            # Also on an error, or the worker thread keeps running
+            builder.stop()
 
     sdl2.ext.quit()
 
@@ -25,13 +25,14 @@ THEME_ACCENT = (187, 134, 252, 255)
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 
 def create_image_card(image_path: str, title: str, subtitle: str) -> VBox:
+    """Build a gallery card. `image_path` must already be an absolute asset path."""
     # Card Container
     card = VBox(x=0, y=0, width=300, height=320, padding=(0, 0, 0, 0), margin=(10, 10, 10, 10))
     
     # Image Area
     # Assuming Image primitive takes width/height
     img = Image(
-        source=os.path.join(ASSETS_DIR, image_path),
+        source=image_path,
         x=0, y=0, width=300, height=200,
         scale_mode="fit",
         margin=(0, 0, 10, 0)
@@ -67,6 +68,7 @@ def create_image_card(image_path: str, title: str, subtitle: str) -> VBox:
 def main():
     width, height = 1024, 768
     win = Window("Lumen Gallery Showcase", width, height)
+    win.ignore_unused_events(text_input=False)  # No text input widgets here
     
     # Gallery Data
     gallery_items = [
@@ -78,6 +80,10 @@ def main():
         ("arch.png", "Structural Design", "Repeating patterns in concrete"),
     ]
     
+    # Resolve every asset path once; cards reuse the same absolute strings,
+    # which also keeps the renderer's image cache keys identical.
+    resolved_paths = {path: os.path.join(ASSETS_DIR, path) for path, _, _ in gallery_items}
+
     # --- Build UI Structure ---
     
     # Root Layer Structure: Background + Header + Scrollable
@@ -111,7 +117,7 @@ def main():
         row = HBox(x=0, y=0, width="100%", height=350, margin=(0, 0, 20, 0)) # Fixed height for row
         
         for img_path, title, sub in chunk:
-            card = create_image_card(img_path, title, sub)
+            card = create_image_card(resolved_paths[img_path], title, sub)
             row.add_child(card)
             
         content_vbox.add_child(row)
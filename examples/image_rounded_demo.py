@@ -23,6 +23,7 @@ ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 def main():
     width, height = 1024, 768
     win = Window("Lumen Rounded Image Demo", width, height)
+    win.ignore_unused_events(text_input=False)  # No text input widgets here
     
     # Check for assets
     image_path = os.path.join(ASSETS_DIR, "nature.png")
@@ -1,12 +1,20 @@
 import sys
 import os
 import random
+from functools import lru_cache
 import sdl2.ext
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: posts are then drawn one by one with random.
+    np = None
+
 # Ensure src is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from sdl_gui.window.window import Window
+from sdl_gui.window.display_list import DisplayList
 from sdl_gui.layers.scrollable_layer import ScrollableLayer
 from sdl_gui.layouts.vbox import VBox
 from sdl_gui.layouts.hbox import HBox
@@ -38,66 +46,177 @@ POSTS = [
     ("Linux Desktop Year 2026", "This time for sure. Gnome 50 changes everything by removing all UI elements for maximum minimalism.")
 ]
 
-def create_post_card(index):
-    """Create a Reddit-style post card."""
+# --- VIRTUALIZATION ---
+# Every card occupies a fixed slot so the visible range follows from scroll_y
+CARD_H = 220
+CARD_GAP = 20
+VIEWPORT_H = 750
+FEED_WIDTH = 480
+POOL_SIZE = VIEWPORT_H // CARD_H + 2
+# More posts are loaded when the target comes this close to the end
+LOAD_AHEAD = POOL_SIZE * CARD_H
+
+
+# Label formatting is memoized: the same few values recur across cards
+@lru_cache(maxsize=1024)
+def vote_label(upvotes):
+    vote_str = f"{upvotes/1000:.1f}k" if upvotes > 1000 else str(upvotes)
+    return f" {vote_str}"
+
+
+@lru_cache(maxsize=None)
+def time_label(hours):
+    return f" {hours}h ago"
+
+
+@lru_cache(maxsize=None)
+def user_label(user):
+    return f"Posted by u/{user}"
+
+
+@lru_cache(maxsize=None)
+def bold_runs(text):
+    return (("bold", text),)
+
+
+@lru_cache(maxsize=1024)
+def comments_label(comments):
+    return f"[💬 {comments} Comments]"
+
+
+# Flyweights: identical in every card, so one instance is shared by all of
+# them. Created at module level, outside any parent context, and given no
+# id; primitives keep no per-parent state so sharing is safe.
+DOT = ResponsiveText(0, 0, 20, "100%", text="•", size=12, color=(129, 131, 132, 255), align="center", markup=False)
+ACTION_SPACER = Rectangle(0, 0, 30, "100%", color=(0, 0, 0, 0))
+
+
+def random_post():
+    """Draw the data of one post: a tuple, no widgets."""
     sub_name, sub_color = random.choice(SUBREDDITS)
-    user = random.choice(USERS)
-    hours = random.randint(1, 23)
     title_txt, body_txt = random.choice(POSTS)
-    upvotes = random.randint(0, 5000)
-    comments = random.randint(0, 500)
-    
-    card_id = f"post_{index}"
-    
-    # Main Card Container (Dark Theme)
-    with VBox(0, 0, "100%", "auto", padding=(0, 0, 0, 0), margin=(10, 0, 10, 0), id=card_id) as card:
-        card.set_background_color(35, 35, 35, 255) # Neutral Grey
-        card.set_radius(10)
-        card.set_border_width(1)
-        card.set_border_color(60, 60, 60, 255)
-        
-        # --- META HEADER ---
-        with HBox(0, 0, "100%", 30, padding=(10, 10, 5, 20), id=f"{card_id}_meta") as meta_box:
-            # Subreddit
-            ResponsiveText(0, 0, "auto", "100%", text=f"**{sub_name}**", size=12, color=sub_color, markup=True, id=f"{card_id}_sub")
-            # Dot
-            ResponsiveText(0, 0, 20, "100%", text="•", size=12, color=(129, 131, 132, 255), align="center", id=f"{card_id}_dot")
-            # User
-            ResponsiveText(0, 0, "auto", "100%", text=f"Posted by u/{user}", size=12, color=(129, 131, 132, 255), id=f"{card_id}_user")
-            # Time
-            ResponsiveText(0, 0, "auto", "100%", text=f" {hours}h ago", size=12, color=(129, 131, 132, 255), id=f"{card_id}_time")
-        
-        # --- TITLE ---
-        with VBox(0, 0, "100%", "auto", padding=(10, 20, 5, 20), id=f"{card_id}_title_box") as title_box:
-            # Title Color: Light Gray D7DADC
-            ResponsiveText(0, 0, "100%", "auto", text=f"**{title_txt}**", size=18, color=(215, 218, 220, 255), markup=True, wrap=True, id=f"{card_id}_title")
-        
-        # --- BODY ---
-        with VBox(0, 0, "100%", "auto", padding=(5, 20, 10, 20), id=f"{card_id}_body_box") as body_box:
-            # Body Color: Slightly darker gray
-            ResponsiveText(0, 0, "100%", "auto", text=body_txt, size=14, color=(215, 218, 220, 255), wrap=True, id=f"{card_id}_body")
-        
-        # --- ACTION BAR ---
-        with HBox(0, 0, "100%", 35, padding=(10, 20, 10, 20), id=f"{card_id}_action_box") as action_box:
-            
-            # Upvotes (Orangeish)
-            ResponsiveText(0, 0, "auto", "100%", text="[▲]", size=14, color=(255, 69, 0, 255), markup=True, id=f"{card_id}_up")
-            vote_str = f"{upvotes/1000:.1f}k" if upvotes > 1000 else str(upvotes)
-            # Text Color
-            ResponsiveText(0, 0, "auto", "100%", text=f" {vote_str}", size=14, color=(215, 218, 220, 255), id=f"{card_id}_votes")
-            ResponsiveText(0, 0, "auto", "100%", text=" [▼]", size=14, color=(113, 147, 255, 255), markup=True, id=f"{card_id}_down")
-            
-            # Spacing
-            Rectangle(0, 0, 30, "100%", color=(0,0,0,0), id=f"{card_id}_space")
-            
-            # Comments
-            ResponsiveText(0, 0, "auto", "100%", text=f"[💬 {comments} Comments]", size=12, color=(129, 131, 132, 255), markup=True, id=f"{card_id}_comments")
-    
-    return card
+    return (sub_name, sub_color, random.choice(USERS), random.randint(1, 23),
+            title_txt, body_txt, random.randint(0, 5000), random.randint(0, 500))
+
+
+def bulk_random_posts(n):
+    """Draw n posts, sampling every field for the whole batch at once."""
+    if np is None:
+        return [random_post() for _ in range(n)]
+    rng = np.random.default_rng()
+    subs = rng.integers(0, len(SUBREDDITS), n)
+    users = rng.integers(0, len(USERS), n)
+    hours = rng.integers(1, 24, n)
+    texts = rng.integers(0, len(POSTS), n)
+    ups = rng.integers(0, 5001, n)
+    coms = rng.integers(0, 501, n)
+    # tolist() hands back plain ints, so labels and caches see no NumPy scalars
+    columns = (subs, users, hours, texts, ups, coms)
+    return [(*SUBREDDITS[s], USERS[u], h, *POSTS[p], uv, cm)
+            for s, u, h, p, uv, cm in zip(*(c.tolist() for c in columns))]
+
+
+class PostCard:
+    """A Reddit-style post card whose widgets are reused for any post."""
+
+    def __init__(self, x=0, y=0, width="100%", height="auto"):
+        self.index = None
+        self.widgets = {}
+
+        # Main Card Container (Dark Theme)
+        with VBox(x, y, width, height, padding=(0, 0, 0, 0), margin=(10, 0, 10, 0)) as card:
+            card.set_background_color(35, 35, 35, 255) # Neutral Grey
+            card.set_radius(10)
+            card.set_border_width(1)
+            card.set_border_color(60, 60, 60, 255)
+
+            # --- META HEADER ---
+            with HBox(0, 0, "100%", 30, padding=(10, 10, 5, 20)) as meta_box:
+                self.widgets["_meta"] = meta_box
+                # Subreddit
+                self.widgets["_sub"] = ResponsiveText(0, 0, "auto", "100%", text="", size=12, markup=True)
+                # Dot
+                meta_box.add_child(DOT)
+                # User
+                self.widgets["_user"] = ResponsiveText(0, 0, "auto", "100%", text="", size=12, color=(129, 131, 132, 255), markup=False)
+                # Time
+                self.widgets["_time"] = ResponsiveText(0, 0, "auto", "100%", text="", size=12, color=(129, 131, 132, 255), markup=False)
+
+            # --- TITLE ---
+            with VBox(0, 0, "100%", "auto", padding=(10, 20, 5, 20)) as title_box:
+                self.widgets["_title_box"] = title_box
+                # Title Color: Light Gray D7DADC
+                self.widgets["_title"] = ResponsiveText(0, 0, "100%", "auto", text="", size=18, color=(215, 218, 220, 255), markup=True, wrap=True)
+
+            # --- BODY ---
+            with VBox(0, 0, "100%", "auto", padding=(5, 20, 10, 20)) as body_box:
+                self.widgets["_body_box"] = body_box
+                # Body Color: Slightly darker gray
+                self.widgets["_body"] = ResponsiveText(0, 0, "100%", "auto", text="", size=14, color=(215, 218, 220, 255), wrap=True, markup=False)
+
+            # --- ACTION BAR ---
+            with HBox(0, 0, "100%", 35, padding=(10, 20, 10, 20)) as action_box:
+                self.widgets["_action_box"] = action_box
+                # Upvotes (Orangeish)
+                self.widgets["_up"] = ResponsiveText(0, 0, "auto", "100%", text="[▲]", size=14, color=(255, 69, 0, 255), markup=True)
+                # Text Color
+                self.widgets["_votes"] = ResponsiveText(0, 0, "auto", "100%", text="", size=14, color=(215, 218, 220, 255), markup=False)
+                self.widgets["_down"] = ResponsiveText(0, 0, "auto", "100%", text=" [▼]", size=14, color=(113, 147, 255, 255), markup=True)
+
+                # Spacing
+                action_box.add_child(ACTION_SPACER)
+
+                # Comments
+                self.widgets["_comments"] = ResponsiveText(0, 0, "auto", "100%", text="", size=12, color=(129, 131, 132, 255), markup=True)
+
+        self.card = card
+
+    def bind(self, index, post):
+        """Point the card's widgets at another post."""
+        sub_name, sub_color, user, hours, title_txt, body_txt, upvotes, comments = post
+        self.index = index
+        card_id = f"post_{index}"
+        self.card.id = card_id
+        # Ids change with the post so the renderer never reuses a stale layout
+        for suffix, widget in self.widgets.items():
+            widget.id = f"{card_id}{suffix}"
+
+        w = self.widgets
+        w["_sub"].runs = bold_runs(sub_name)
+        w["_sub"].color = sub_color
+        w["_user"].text = user_label(user)
+        w["_time"].text = time_label(hours)
+        w["_title"].runs = bold_runs(title_txt)
+        w["_body"].text = body_txt
+        w["_votes"].text = vote_label(upvotes)
+        w["_comments"].text = comments_label(comments)
+        return self
+
+
+def create_post_card(index):
+    """Create a Reddit-style post card."""
+    return PostCard().bind(index, random_post()).card
+
+
+def bind_visible_cards(pool, posts, scroll_y):
+    """
+    Rebind the pooled cards to the posts intersecting the viewport.
+    Post i always lives in pool[i % len(pool)], so scrolling by one card
+    only rebinds one card. Returns True if any card changed.
+    """
+    first = max(0, int(scroll_y) // CARD_H)
+    changed = False
+    for index in range(first, min(first + len(pool), len(posts))):
+        card = pool[index % len(pool)]
+        if card.index != index:
+            card.card.y = index * CARD_H
+            card.bind(index, posts[index])
+            changed = True
+    return changed
 
 def main():
     # Implicit API context usage
-    with Window("Lumen Reddit Clone", 500, 800, debug=True) as win:
+    with Window("Lumen Reddit Clone", 500, 800, debug=True, async_text=True) as win:
         
         # --- HEADER ---
         with FlexBox(0, 0, "100%", 50, padding=(0, 15, 0, 15), justify_content="space_between", align_items="center") as header:
@@ -109,7 +228,7 @@ def main():
                 with HBox(0, 0, 32, 32, margin=(0, 5, 0, 0)) as icon_box:
                     Rectangle(0, 0, 32, 32, color=(255, 69, 0, 255), radius=16)
                 
-                ResponsiveText(0, 0, "auto", "auto", text="**reddit**", size=20, color=(255, 255, 255, 255), markup=True)
+                ResponsiveText(0, 0, "auto", "auto", runs=[("bold", "reddit")], size=20, color=(255, 255, 255, 255))
 
             # 2. Search Bar
             with FlexBox(0, 0, "auto", 36, margin=(0, 20, 0, 20), align_items="center") as search_box:
@@ -139,40 +258,64 @@ def main():
                     ResponsiveText(0, 0, "auto", "auto", text="Sign Up", size=12, color=(26, 26, 27, 255), align="center")
 
         # --- CONTENT LAYER ---
-        with ScrollableLayer(0, 50, "100%", 750, id="feed", listen_events=[core.EVENT_SCROLL]) as scroll_layer:
-            with VBox(0, 0, "100%", "auto", padding=(0, 10, 0, 10)) as content_vbox:
-                # Initial Posts
-                for i in range(10):
-                   create_post_card(i) # Implicitly adds to content_vbox
+        # Only POOL_SIZE cards ever exist; they are recycled while scrolling
+        posts = bulk_random_posts(10)
+        with ScrollableLayer(0, 50, "100%", VIEWPORT_H, id="feed", listen_events=[core.EVENT_SCROLL],
+                             cull_offscreen=True) as scroll_layer:
+            pool = [PostCard(10, 0, FEED_WIDTH, CARD_H - CARD_GAP) for _ in range(POOL_SIZE)]
+        bind_visible_cards(pool, posts, 0)
+        # Running total: slots have a fixed height, so it is exact
+        scroll_layer.content_height = len(posts) * CARD_H
+
+        # Retained display list (Painter's Algorithm order): entries are
+        # only serialized again after they change
+        display_list = DisplayList([
+            Rectangle(0, 0, "100%", "100%", color=(3, 3, 3, 255)), # Global BG (Deep Black)
+            scroll_layer, # Content first
+            header, # Header on top
+            Rectangle(0, 49, "100%", 1, color=(52, 53, 54, 255)) # Header Border
+        ])
 
         # Render loop
         running = True
         target_scroll_y = 0.0
         current_scroll_y = 0.0
-        item_count = 10
-        
+        dirty = True
+        append_pending = False
+
         while running:
+            # Infinite scroll, checked once per frame however many wheel
+            # events arrived: append post data, never widgets
+            if append_pending:
+                append_pending = False
+                if target_scroll_y > scroll_layer.content_height - LOAD_AHEAD:
+                    posts.extend(bulk_random_posts(5))
+                    scroll_layer.content_height = len(posts) * CARD_H
+
             # Smooth Scroll Logic (Lerp)
             # Interpolate current towards target
             diff = target_scroll_y - current_scroll_y
-            if abs(diff) > 0.5:
+            animating = abs(diff) > 0.5
+            if animating:
                 current_scroll_y += diff * 0.1 # Smoothing factor (0.1 = slow, 0.5 = fast)
             else:
                 current_scroll_y = target_scroll_y
 
-            scroll_layer.scroll_y = int(current_scroll_y)
-            
-            # Manual Display List Assembly (for stacking Layers)
-            # We construct the list explicitly to control Z-order (Painter's Algorithm)
-            display_list = [
-                Rectangle(0, 0, "100%", "100%", color=(3, 3, 3, 255)).to_data(), # Global BG (Deep Black)
-                scroll_layer.to_data(), # Content first
-                header.to_data(), # Header on top
-                Rectangle(0, 49, "100%", 1, color=(52, 53, 54, 255)).to_data() # Header Border
-            ]
-            
-            win.render(display_list)
-            
+            if int(current_scroll_y) != scroll_layer.scroll_y:
+                scroll_layer.scroll_y = int(current_scroll_y)
+                dirty = True
+            # Rebound cards invalidate the layer's children themselves
+            bind_visible_cards(pool, posts, scroll_layer.scroll_y)
+
+            # Event-driven redraw: a static feed is not re-rendered
+            if dirty:
+                win.render(display_list)
+                dirty = False
+
+            # Sleep until input arrives; while scrolling, this paces frames
+            if sdl2.SDL_WaitEventTimeout(None, 8 if animating else 100):
+                dirty = True
+
             ui_events = win.get_ui_events()
             for event in ui_events:
                 if event["type"] == core.EVENT_QUIT:
@@ -186,17 +329,7 @@ def main():
                         
                         # Clamp Target
                         if target_scroll_y < 0: target_scroll_y = 0
-                        
-                        approx_height = item_count * 200 
-                        # Infinite scroll trigger based on target or current? Usually current.
-                        # But expanding bounds should happen if we scroll far enough.
-                        
-                        if target_scroll_y > approx_height - 1000:
-                             for _ in range(5):
-                                 item_count += 1
-                                 create_post_card(item_count) 
-                                 content_vbox.add_child(create_post_card(item_count))
-            sdl2.SDL_Delay(8)
+                        append_pending = True
         
     sdl2.ext.quit()
 
@@ -37,9 +37,12 @@ def main():
     # Note: VBox stacks them.
     vbox.add_child(Rectangle(0, 0, "100%", 50, (50, 50, 50, 255), margin=(20, 0, 0, 0)))
     
+    # The layout never changes: serialize it once
+    display_list = [layer.to_data()]
+
     running = True
     while running:
-        win.render([layer.to_data()])
+        win.render(display_list)
         for event in sdl2.ext.get_events():
             if event.type == sdl2.SDL_QUIT:
                 running = False
@@ -34,12 +34,11 @@ def main():
     header_box = VBox(0, 0, "100%", "auto", margin=(0, 0, 10, 0))
     
     title = ResponsiveText(0, 0, "100%", "auto", 
-        text="**THE PYTHON DAILY**", 
+        runs=[("bold", "THE PYTHON DAILY")], 
         size=56, 
         color=(20, 20, 20, 255), 
         font=SERIF_BOLD, 
-        align="center", 
-        markup=True
+        align="center"
     )
     
     # Date Line with Separators
@@ -66,7 +65,7 @@ def main():
     
     # Column 1 (Left Sidebar)
     col1 = VBox(0, 0, "25%", "auto", margin=(0, 20, 0, 0)) 
-    col1.add_child(ResponsiveText(0, 0, "100%", "auto", text="**LOCAL NEWS**", size=18, color=(100, 0, 0, 255), font=SERIF_BOLD, markup=True))
+    col1.add_child(ResponsiveText(0, 0, "100%", "auto", runs=[("bold", "LOCAL NEWS")], size=18, color=(100, 0, 0, 255), font=SERIF_BOLD))
     col1.add_child(Rectangle(0, 0, "100%", 1, color=(200, 200, 200, 255), margin=(2, 0, 10, 0)))
     
     col1.add_child(ResponsiveText(0, 0, "100%", "auto", 
@@ -80,7 +79,7 @@ def main():
     # Column 2 (Main Story)
     col2 = VBox(0, 0, "45%", "auto", margin=(0, 20, 0, 20))
     # Main Header
-    col2.add_child(ResponsiveText(0, 0, "100%", "auto", text="**MARKDOWN REVOLUTION**", size=32, color=(10, 10, 10, 255), font=SERIF_BOLD, align="center", markup=True))
+    col2.add_child(ResponsiveText(0, 0, "100%", "auto", runs=[("bold", "MARKDOWN REVOLUTION")], size=32, color=(10, 10, 10, 255), font=SERIF_BOLD, align="center"))
     
     col2.add_child(ResponsiveText(0, 0, "100%", "auto", 
         text="**By A. Developer**\n\n"
@@ -97,7 +96,7 @@ def main():
 
     # Column 3 (Right Sidebar)
     col3 = VBox(0, 0, "25%", "auto", margin=(0, 0, 0, 10))
-    col3.add_child(ResponsiveText(0, 0, "100%", "auto", text="**MARKET WATCH**", size=18, color=(0, 80, 0, 255), font=SERIF_BOLD, markup=True))
+    col3.add_child(ResponsiveText(0, 0, "100%", "auto", runs=[("bold", "MARKET WATCH")], size=18, color=(0, 80, 0, 255), font=SERIF_BOLD))
     col3.add_child(Rectangle(0, 0, "100%", 1, color=(200, 200, 200, 255), margin=(2, 0, 10, 0)))
     
     col3.add_child(ResponsiveText(0, 0, "100%", "auto", 
@@ -111,13 +110,10 @@ def main():
         size=14, color=(10, 10, 10, 255), font=SERIF_FONT, markup=True, wrap=True
     ))
 
-    columns_layout.add_child(col1)
-    columns_layout.add_child(col2)
-    columns_layout.add_child(col3)
+    columns_layout.extend_children([col1, col2, col3])
 
     # Assemble Page
-    content_layer.add_child(header_box)
-    content_layer.add_child(columns_layout)
+    content_layer.extend_children([header_box, columns_layout])
     
     # Root Structure
     # Since VBox writes on top of previous siblings in display list order (if they overlap?), 
@@ -131,10 +127,18 @@ def main():
     win.show()
     
     running = True
+    dirty = True
 
     while running:
-        win.render(root_elements)
-        
+        # Event-driven redraw: the page is static, render only after input
+        if dirty:
+            win.render(root_elements)
+            dirty = False
+
+        # Sleep until an event arrives instead of polling every few ms
+        if sdl2.SDL_WaitEventTimeout(None, 100):
+            dirty = True
+
         events = win.get_ui_events()
         for event in events:
             if event["type"] == core.EVENT_LINK_CLICK:
@@ -142,14 +146,6 @@ def main():
             elif event["type"] == core.EVENT_QUIT:
                 running = False
         
-        # Poll SDL events for quit
-        # Note: Window.get_ui_events() already drained events.
-        # But just in case any residuals:
-        for event in sdl2.ext.get_events():
-             pass # Already handled or consumed.
-        
-        win.window.refresh()
-        sdl2.SDL_Delay(8)
 
 if __name__ == "__main__":
     main()
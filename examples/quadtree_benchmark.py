@@ -12,38 +12,54 @@ import time
 import sdl2
 import sdl2.ext
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: the item grid is then computed in plain Python.
+    np = None
+
 from sdl_gui import core
 from sdl_gui.window.window import Window
 from sdl_gui.layers.layer import Layer
+from sdl_gui.primitives.rect_batch import RectBatch
 from sdl_gui.primitives.rectangle import Rectangle
 
 
+def _item_grid(count: int):
+    """Return per-item (x, y, r, g, b) columns for a 10-column grid."""
+    if np is not None:
+        i = np.arange(count, dtype=np.int32)
+        xs = (i % 10) * 80 + 10
+        ys = (i // 10) * 50 + 10
+        return (xs.tolist(), ys.tolist(), ((i * 37) & 255).tolist(),
+                ((i * 73) & 255).tolist(), ((i * 101) & 255).tolist())
+    i = range(count)
+    return ([(n % 10) * 80 + 10 for n in i], [(n // 10) * 50 + 10 for n in i],
+            [(n * 37) & 255 for n in i], [(n * 73) & 255 for n in i],
+            [(n * 101) & 255 for n in i])
+
+
 def create_many_items(count: int):
     """Create a layer with many child rectangles."""
     layer = Layer(0, 0, "100%", "100%")
     
-    for i in range(count):
-        row = i // 10
-        col = i % 10
-        color = (
-            (i * 37) % 256,
-            (i * 73) % 256,
-            (i * 101) % 256,
-            255
-        )
-        rect = Rectangle(
-            col * 80 + 10,
-            row * 50 + 10,
-            70,
-            40,
-            color=color
-        )
-        layer.add_child(rect)
+    for x, y, r, g, b in zip(*_item_grid(count)):
+        layer.add_child(Rectangle(x, y, 70, 40, color=(r, g, b, 255)))
     
     return layer
 
 
-def run_benchmark(item_count: int = 500, frames: int = 100):
+def create_packed_items(count: int):
+    """Create a layer holding the same rectangles as one packed RectBatch."""
+    layer = Layer(0, 0, "100%", "100%")
+    batch = RectBatch(0, 0, "100%", "100%")
+    for x, y, r, g, b in zip(*_item_grid(count)):
+        batch.add_rect(x, y, 70, 40, (r, g, b, 255))
+    layer.add_child(batch)
+    return layer
+
+
+def run_benchmark(item_count: int = 500, frames: int = 100, packed: bool = False):
     """Run the benchmark and return results."""
     sdl2.ext.init()
     
@@ -54,13 +70,13 @@ def run_benchmark(item_count: int = 500, frames: int = 100):
         window.renderer.enable_profiling(True)
         window.renderer._spatial_index.reset_stats()
         
-        layer = create_many_items(item_count)
+        layer = create_packed_items(item_count) if packed else create_many_items(item_count)
         display_list = [layer.to_data()]
         
         print(f"\n{'='*60}")
         print(f"Spatial Index Benchmark")
         print(f"{'='*60}")
-        print(f"Items: {item_count}")
+        print(f"Items: {item_count}{' (packed)' if packed else ''}")
         print(f"Frames: {frames}")
         print(f"{'='*60}\n")
         
@@ -148,7 +164,7 @@ def main():
         except ValueError:
             pass
     
-    run_benchmark(item_count, frames)
+    run_benchmark(item_count, frames, packed="packed" in sys.argv[3:])
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
+import ctypes
 import sys
 import os
 import random
-import time
+from collections import deque
 import sdl2
 import sdl2.ext
 
@@ -12,8 +13,47 @@ from sdl_gui.window.window import Window
 from sdl_gui import core
 from sdl_gui.primitives.vector_graphics import VectorGraphics
 
+# Custom SDL event type for new data, registered in main()
+DATA_EVENT = None
+
+UPDATE_INTERVAL_MS = 50
+
+
+def _push_data_event(interval, param):
+    """SDL timer callback: ask the main loop for a new data point."""
+    event = sdl2.SDL_Event()
+    event.type = DATA_EVENT
+    sdl2.SDL_PushEvent(event)
+    return interval
+
+
+def add_point(points):
+    """Append the next step of the random walk, clamped to [10, 90]."""
+    new_val = points[-1] + random.uniform(-5, 5)
+    points.append(max(10, min(90, new_val)))
+
+
+def draw_chart(chart, points, x_positions):
+    """Rebuild the chart commands from the points."""
+    chart.clear()
+
+    # Draw Grid
+    chart.stroke((50, 50, 50, 255), width=1)
+    chart.move_to("0%", "50%")
+    chart.line_to("100%", "50%")
+
+    # Draw Dynamic Line
+    chart.stroke((0, 255, 0, 255), width=3)
+    # Invert Y for screen coords
+    ys = [f"{100 - val}%" for val in points]
+    chart.move_to(x_positions[0], ys[0])
+    chart.poly_line(x_positions[1:len(ys)], ys[1:])
+
+
 def main():
-    # Initialize Window
+    global DATA_EVENT
+
+    # Initialize Window; it presents in sync with the display
     window = Window(title="Simple Dynamic Chart", width=800, height=600, debug=True)
     
     # Create VectorGraphics filling the window
@@ -23,62 +63,45 @@ def main():
     # Show window
     window.show()
     
-    running = True
-    points = [50 + random.random() * 50]
     max_points = 50
-    last_update = time.time()
-    
+    # Ring buffer: appending past max_points drops the oldest value in O(1)
+    points = deque([50 + random.random() * 50], maxlen=max_points)
+    # X positions only depend on the index, so their strings are built once
+    x_positions = [f"{(i / (max_points - 1)) * 100}%" for i in range(max_points)]
+    draw_chart(chart, points, x_positions)
+
+    # Data arrives from an SDL timer as events; the loop sleeps in between
+    # and only redraws when a point was added or the window changed
+    sdl2.SDL_InitSubSystem(sdl2.SDL_INIT_TIMER)
+    DATA_EVENT = sdl2.SDL_RegisterEvents(1)
+    timer_callback = sdl2.SDL_TimerCallback(_push_data_event)
+    timer = sdl2.SDL_AddTimer(UPDATE_INTERVAL_MS, timer_callback, None)
+
+    running = True
+    dirty = True
+    event = sdl2.SDL_Event()
     while running:
-        # Event Loop
-        events = sdl2.ext.get_events()
-        for event in events:
+        if dirty:
+            window.render(window.get_root_display_list())
+            dirty = False
+
+        if not sdl2.SDL_WaitEvent(ctypes.byref(event)):
+            continue
+        while True:
             if event.type == sdl2.SDL_QUIT:
                 running = False
-            if event.type == sdl2.SDL_KEYDOWN:
-                if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    running = False
-        
-        # Update Data randomly
-        now = time.time()
-        if now - last_update > 0.05: # Update every 50ms
-            last_update = now
-            
-            # Random walk
-            last_val = points[-1]
-            change = random.uniform(-5, 5)
-            new_val = last_val + change
-            # Clamp
-            new_val = max(10, min(90, new_val))
-            points.append(new_val)
-            if len(points) > max_points:
-                points.pop(0)
-            
-            # Re-draw chart
-            chart.clear()
-            
-            # Draw Grid
-            chart.stroke((50, 50, 50, 255), width=1)
-            chart.move_to("0%", "50%")
-            chart.line_to("100%", "50%")
-            
-            # Draw Dynamic Line
-            if points:
-                chart.stroke((0, 255, 0, 255), width=3)
-                
-                # Calculate points
-                path_points = []
-                for i, val in enumerate(points):
-                    x_pct = (i / (max_points - 1)) * 100
-                    y_pct = 100 - val # Invert Y for screen coords
-                    path_points.append((f"{x_pct}%", f"{y_pct}%"))
-                
-                chart.move_to(path_points[0][0], path_points[0][1])
-                for x, y in path_points[1:]:
-                    chart.line_to(x, y)
-
-        display_list = window.get_root_display_list()
-        window.render(display_list)
-        sdl2.SDL_Delay(16)
+            elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+                running = False
+            elif event.type == DATA_EVENT:
+                add_point(points)
+                draw_chart(chart, points, x_positions)
+                dirty = True
+            elif event.type == sdl2.SDL_WINDOWEVENT:
+                dirty = True
+            if not sdl2.SDL_PollEvent(ctypes.byref(event)):
+                break
+
+    sdl2.SDL_RemoveTimer(timer)
 
 if __name__ == "__main__":
     main()
@@ -42,13 +42,11 @@ def main():
     nav3 = ResponsiveText(0, 0, "25%", "100%", text="Pricing", size=18, color=(200, 200, 200, 255), align="center")
     nav4 = ResponsiveText(0, 0, "25%", "100%", text="Contact", size=18, color=(200, 200, 200, 255), align="center")
     
-    nav_box.add_child(nav1)
-    nav_box.add_child(nav2)
-    nav_box.add_child(nav3)
-    nav_box.add_child(nav4)
+    nav_box.extend_children([nav1, nav2, nav3, nav4])
     
-    header_layout.add_child(logo)
-    header_layout.add_child(nav_box)
+    header_layout.extend_children([logo, nav_box])
+    # Never changes: drawn from a baked texture after the first frame
+    header_layout.set_static(True)
     
     # --- Main Content ---
     # Start at Y=80 (use int)
@@ -62,44 +60,39 @@ def main():
     subtitle_text = "Responsive, native, and easy to use. This text is long enough to demonstrate the new wrapping capabilities of the ResponsiveText primitive. It should automatically break into multiple lines."
     subtitle = ResponsiveText(0, 0, "80%", 80, text=subtitle_text, size=18, color=(100, 100, 100, 255), align="center", margin=(0, "10%", 0, "10%"))
     
-    hero_section.add_child(headline)
-    hero_section.add_child(subtitle)
+    hero_section.extend_children([headline, subtitle])
     
     # Features Grid
     grid = HBox(0, 0, "100%", 300, padding=(20, 20, 20, 20))
     
     # Feature 1
     col1 = VBox(0, 0, "30%", "100%", margin="10px")
-    c1_title = ResponsiveText(0, 0, "100%", 40, text="**Fast**", size=20, color=(0, 120, 200, 255), align="center", markup=True)
+    c1_title = ResponsiveText(0, 0, "100%", 40, runs=[("bold", "Fast")], size=20, color=(0, 120, 200, 255), align="center")
     c1_desc = ResponsiveText(0, 0, "100%", 60, text="Optimized [rendering]{#FF0000}.", size=16, color=(60, 60, 60, 255), align="center", markup=True)
     
-    col1.add_child(c1_title)
-    col1.add_child(c1_desc)
+    col1.extend_children([c1_title, c1_desc])
 
     # Feature 2
     col2 = VBox(0, 0, "30%", "100%", margin="10px")
-    c2_title = ResponsiveText(0, 0, "100%", 40, text="**Flexible**", size=20, color=(0, 180, 100, 255), align="center", markup=True)
+    c2_title = ResponsiveText(0, 0, "100%", 40, runs=[("bold", "Flexible")], size=20, color=(0, 180, 100, 255), align="center")
     c2_desc = ResponsiveText(0, 0, "100%", 60, text="Nested [layouts](layouts).", size=16, color=(60, 60, 60, 255), align="center", markup=True)
-    col2.add_child(c2_title)
-    col2.add_child(c2_desc)
+    col2.extend_children([c2_title, c2_desc])
     
     # Feature 3
     col3 = VBox(0, 0, "30%", "100%", margin=(0, 10, 0, 10))
     c3_title = ResponsiveText(0, 0, "100%", 40, text="Native", size=20, color=(200, 80, 0, 255), align="center")
     c3_desc = ResponsiveText(0, 0, "100%", 60, text="SDL2 power.", size=16, color=(60, 60, 60, 255), align="center")
-    col3.add_child(c3_title)
-    col3.add_child(c3_desc)
+    col3.extend_children([c3_title, c3_desc])
     
-    grid.add_child(col1)
-    grid.add_child(col2)
-    grid.add_child(col3)
+    grid.extend_children([col1, col2, col3])
     
-    main_layout.add_child(hero_section)
-    main_layout.add_child(grid)
+    main_layout.extend_children([hero_section, grid])
     
-    root.add_child(header_bg)     # Absolute pos 0,0
-    root.add_child(header_layout) # Absolute pos 0,0
-    root.add_child(main_layout)   # Absolute pos 0,80
+    root.extend_children([
+        header_bg,     # Absolute pos 0,0
+        header_layout, # Absolute pos 0,0
+        main_layout,   # Absolute pos 0,80
+    ])
 
     running = True
     display_list = [root.to_data()]
@@ -5,7 +5,6 @@ Runs the demo for 3 seconds with cProfile and outputs analysis.
 """
 import cProfile
 import pstats
-import io
 import sys
 import os
 import time
@@ -71,38 +70,23 @@ if __name__ == "__main__":
     run_profile(3.0)
     profiler.disable()
     
-    # Analyze results
-    s = io.StringIO()
-    stats = pstats.Stats(profiler, stream=s)
+    # One Stats object serves every report, printed straight to stdout
+    stats = pstats.Stats(profiler, stream=sys.stdout)
     stats.strip_dirs()
-    stats.sort_stats('cumulative')
     
     print("\n" + "="*60)
     print("TOP 50 FUNCTIONS BY CUMULATIVE TIME")
     print("="*60)
-    stats.print_stats(50)
-    print(s.getvalue())
+    stats.sort_stats('cumulative').print_stats(50)
     
     # Also print by total time
-    s2 = io.StringIO()
-    stats2 = pstats.Stats(profiler, stream=s2)
-    stats2.strip_dirs()
-    stats2.sort_stats('tottime')
-    
     print("\n" + "="*60)
     print("TOP 50 FUNCTIONS BY TOTAL TIME")
     print("="*60)
-    stats2.print_stats(50)
-    print(s2.getvalue())
+    stats.sort_stats('tottime').print_stats(50)
     
     # Print callers for top functions
-    s3 = io.StringIO()
-    stats3 = pstats.Stats(profiler, stream=s3)
-    stats3.strip_dirs()
-    stats3.sort_stats('cumulative')
-    
     print("\n" + "="*60)
     print("CALLERS - Who calls the top functions?")
     print("="*60)
-    stats3.print_callers(20)
-    print(s3.getvalue())
+    stats.sort_stats('cumulative').print_callers(20)
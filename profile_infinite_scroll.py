@@ -4,7 +4,6 @@ Exécute la démo pendant 3 secondes avec cProfile.
 """
 import cProfile
 import pstats
-import io
 import sys
 import os
 import time
@@ -17,6 +16,7 @@ import random
 import sdl2.ext
 import sdl2
 
+from sdl_gui.window.display_list import DisplayList
 from sdl_gui.window.window import Window
 from sdl_gui.layers.scrollable_layer import ScrollableLayer
 from sdl_gui.layouts.vbox import VBox
@@ -63,34 +63,52 @@ def create_post_card(index):
         card.set_border_width(1)
         card.set_border_color(60, 60, 60, 255)
         
-        with HBox(0, 0, "100%", 30, padding=(10, 10, 5, 20), id=f"{card_id}_meta") as meta_box:
-            ResponsiveText(0, 0, "auto", "100%", text=f"**{sub_name}**", size=12, color=sub_color, markup=True, id=f"{card_id}_sub")
-            ResponsiveText(0, 0, 20, "100%", text="•", size=12, color=(129, 131, 132, 255), align="center", id=f"{card_id}_dot")
-            ResponsiveText(0, 0, "auto", "100%", text=f"Posted by u/{user}", size=12, color=(129, 131, 132, 255), id=f"{card_id}_user")
-            ResponsiveText(0, 0, "auto", "100%", text=f" {hours}h ago", size=12, color=(129, 131, 132, 255), id=f"{card_id}_time")
+        with HBox(0, 0, "100%", 30, padding=(10, 10, 5, 20)) as meta_box:
+            ResponsiveText(0, 0, "auto", "100%", text=f"**{sub_name}**", size=12, color=sub_color, markup=True)
+            ResponsiveText(0, 0, 20, "100%", text="•", size=12, color=(129, 131, 132, 255), align="center")
+            ResponsiveText(0, 0, "auto", "100%", text=f"Posted by u/{user}", size=12, color=(129, 131, 132, 255))
+            ResponsiveText(0, 0, "auto", "100%", text=f" {hours}h ago", size=12, color=(129, 131, 132, 255))
         
-        with VBox(0, 0, "100%", "auto", padding=(10, 20, 5, 20), id=f"{card_id}_title_box") as title_box:
-            ResponsiveText(0, 0, "100%", "auto", text=f"**{title_txt}**", size=18, color=(215, 218, 220, 255), markup=True, wrap=True, id=f"{card_id}_title")
+        with VBox(0, 0, "100%", "auto", padding=(10, 20, 5, 20)) as title_box:
+            ResponsiveText(0, 0, "100%", "auto", text=f"**{title_txt}**", size=18, color=(215, 218, 220, 255), markup=True, wrap=True)
         
-        with VBox(0, 0, "100%", "auto", padding=(5, 20, 10, 20), id=f"{card_id}_body_box") as body_box:
-            ResponsiveText(0, 0, "100%", "auto", text=body_txt, size=14, color=(215, 218, 220, 255), wrap=True, id=f"{card_id}_body")
+        with VBox(0, 0, "100%", "auto", padding=(5, 20, 10, 20)) as body_box:
+            ResponsiveText(0, 0, "100%", "auto", text=body_txt, size=14, color=(215, 218, 220, 255), wrap=True)
         
-        with HBox(0, 0, "100%", 35, padding=(10, 20, 10, 20), id=f"{card_id}_action_box") as action_box:
-            ResponsiveText(0, 0, "auto", "100%", text="[▲]", size=14, color=(255, 69, 0, 255), markup=True, id=f"{card_id}_up")
+        with HBox(0, 0, "100%", 35, padding=(10, 20, 10, 20)) as action_box:
+            ResponsiveText(0, 0, "auto", "100%", text="[▲]", size=14, color=(255, 69, 0, 255), markup=True)
             vote_str = f"{upvotes/1000:.1f}k" if upvotes > 1000 else str(upvotes)
-            ResponsiveText(0, 0, "auto", "100%", text=f" {vote_str}", size=14, color=(215, 218, 220, 255), id=f"{card_id}_votes")
-            ResponsiveText(0, 0, "auto", "100%", text=" [▼]", size=14, color=(113, 147, 255, 255), markup=True, id=f"{card_id}_down")
-            Rectangle(0, 0, 30, "100%", color=(0,0,0,0), id=f"{card_id}_space")
-            ResponsiveText(0, 0, "auto", "100%", text=f"[💬 {comments} Comments]", size=12, color=(129, 131, 132, 255), markup=True, id=f"{card_id}_comments")
+            ResponsiveText(0, 0, "auto", "100%", text=f" {vote_str}", size=14, color=(215, 218, 220, 255))
+            ResponsiveText(0, 0, "auto", "100%", text=" [▼]", size=14, color=(113, 147, 255, 255), markup=True)
+            Rectangle(0, 0, 30, "100%", color=(0,0,0,0))
+            ResponsiveText(0, 0, "auto", "100%", text=f"[💬 {comments} Comments]", size=12, color=(129, 131, 132, 255), markup=True)
     
     return card
 
 
+def _tick(target: float, current: float, scroll_dir: int, frame_idx: int):
+    """
+    Advance the simulated scroll by one frame.
+
+    The target moves 5 px per frame, reversing every 60 frames, and the
+    current position eases a tenth of the way towards it.
+
+    Returns:
+        The new (target, current, scroll_dir).
+    """
+    if frame_idx % 60 == 0:
+        scroll_dir = -scroll_dir
+    target = max(0.0, target + scroll_dir * 5)
+    diff = target - current
+    current = current + diff * 0.1 if abs(diff) > 0.5 else target
+    return target, current, scroll_dir
+
+
 def run_demo_for_duration(duration_seconds: float):
     """Run the infinite scroll demo for a specified duration."""
     start_time = time.time()
     
-    with Window("Lumen Reddit Clone - Profiling", 500, 800, debug=False) as win:
+    with Window("Lumen Reddit Clone - Profiling", 500, 800, debug=False, async_text=True) as win:
         
         with FlexBox(0, 0, "100%", 50, padding=(0, 15, 0, 15), justify_content="space_between", align_items="center") as header:
             header.set_background_color(26, 26, 27, 255)
@@ -119,11 +137,20 @@ def run_demo_for_duration(duration_seconds: float):
                     signup_btn.set_radius(16)
                     ResponsiveText(0, 0, "auto", "auto", text="Sign Up", size=12, color=(26, 26, 27, 255), align="center")
 
+        # Never changes: drawn from a baked texture after the first frame
+        header.set_static(True)
+
         with ScrollableLayer(0, 50, "100%", 750, id="feed", listen_events=[core.EVENT_SCROLL]) as scroll_layer:
             with VBox(0, 0, "100%", "auto", padding=(0, 10, 0, 10)) as content_vbox:
                 for i in range(10):
                    create_post_card(i)
 
+        # Static entries are serialized once; the retained list only asks
+        # scroll_layer for new data, and only when it scrolled
+        background = Rectangle(0, 0, "100%", "100%", color=(3, 3, 3, 255)).to_data()
+        divider = Rectangle(0, 49, "100%", 1, color=(52, 53, 54, 255)).to_data()
+        display_list = DisplayList([background, scroll_layer, header, divider])
+
         running = True
         target_scroll_y = 0.0
         current_scroll_y = 0.0
@@ -140,27 +167,13 @@ def run_demo_for_duration(duration_seconds: float):
                 continue
             
             # Simulate smooth scrolling for profiling
-            if frame_count % 60 == 0:
-                scroll_direction = -scroll_direction
-            target_scroll_y += scroll_direction * 5
-            if target_scroll_y < 0:
-                target_scroll_y = 0
-            
-            diff = target_scroll_y - current_scroll_y
-            if abs(diff) > 0.5:
-                current_scroll_y += diff * 0.1
-            else:
-                current_scroll_y = target_scroll_y
+            target_scroll_y, current_scroll_y, scroll_direction = _tick(
+                target_scroll_y, current_scroll_y, scroll_direction, frame_count)
+
+            if int(current_scroll_y) != scroll_layer.scroll_y:
+                scroll_layer.scroll_y = int(current_scroll_y)
+                display_list.mark_dirty(scroll_layer)
 
-            scroll_layer.scroll_y = int(current_scroll_y)
-            
-            display_list = [
-                Rectangle(0, 0, "100%", "100%", color=(3, 3, 3, 255)).to_data(),
-                scroll_layer.to_data(),
-                header.to_data(),
-                Rectangle(0, 49, "100%", 1, color=(52, 53, 54, 255)).to_data()
-            ]
-            
             win.render(display_list)
             
             ui_events = win.get_ui_events()
@@ -169,7 +182,6 @@ def run_demo_for_duration(duration_seconds: float):
                     running = False
 
             frame_count += 1
-            sdl2.SDL_Delay(8)
         
         print(f"Profiling complete: {frame_count} frames in {elapsed:.2f}s ({frame_count/elapsed:.1f} FPS)")
     
@@ -190,41 +202,26 @@ def main():
     run_demo_for_duration(3.0)
     profiler.disable()
     
-    # Generate stats
+    # One Stats object serves every report, printed straight to stdout
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    stats.strip_dirs()
+
     print("\n" + "=" * 60)
     print("PROFILING RESULTS - TOP 50 by cumulative time")
     print("=" * 60)
-    
-    stream = io.StringIO()
-    stats = pstats.Stats(profiler, stream=stream)
-    stats.strip_dirs()
-    stats.sort_stats('cumulative')
-    stats.print_stats(50)
-    print(stream.getvalue())
+    stats.sort_stats('cumulative').print_stats(50)
     
     # Also print by total time
     print("\n" + "=" * 60)
     print("PROFILING RESULTS - TOP 30 by total time (self)")
     print("=" * 60)
-    
-    stream2 = io.StringIO()
-    stats2 = pstats.Stats(profiler, stream=stream2)
-    stats2.strip_dirs()
-    stats2.sort_stats('tottime')
-    stats2.print_stats(30)
-    print(stream2.getvalue())
+    stats.sort_stats('tottime').print_stats(30)
     
     # Print callers for key functions
     print("\n" + "=" * 60)
     print("CALLERS for render-related functions")
     print("=" * 60)
-    
-    stream3 = io.StringIO()
-    stats3 = pstats.Stats(profiler, stream=stream3)
-    stats3.strip_dirs()
-    stats3.print_callers('render', 20)
-    print(stream3.getvalue())
-
+    stats.sort_stats('cumulative').print_callers('render', 20)
 
 if __name__ == "__main__":
     main()
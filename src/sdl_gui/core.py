@@ -23,12 +23,14 @@ KEY_ALIGN = "align"
 KEY_WRAP = "wrap"
 KEY_ELLIPSIS = "ellipsis"
 KEY_MARKUP = "markup"
+KEY_RUNS = "runs"
 KEY_SCROLL_Y = "scroll_y"
 KEY_CONTENT_HEIGHT = "content_height"
 
 KEY_RADIUS = "radius"
 KEY_BORDER_COLOR = "border_color"
 KEY_BORDER_WIDTH = "border_width"
+KEY_STATIC = "static"
 
 EVENT_CLICK = "click"
 EVENT_LINK_CLICK = "link_click"
@@ -49,6 +51,11 @@ EVENT_TICK = "tick"
 
 TYPE_INPUT = "input"
 TYPE_FLEXBOX = "flexbox"
+TYPE_RECT_BATCH = "rect_batch"
+
+# Packed (x, y, w, h, r, g, b, a) records of a rect batch
+KEY_RECORDS = "records"
+RECT_RECORD_FORMAT = "<iiii4B"
 
 # Flexbox Keys
 KEY_FLEX_DIRECTION = "flex_direction"
@@ -69,6 +76,7 @@ KEY_CACHE_KEY = "cache_key"
 CMD_TYPE = "type"
 CMD_MOVE_TO = "move_to"
 CMD_LINE_TO = "line_to"
+CMD_POLYLINE = "polyline"
 CMD_CURVE_TO = "curve_to"
 CMD_ARC = "arc"
 CMD_RECT = "rect"
@@ -1,7 +1,8 @@
 import socket
-import json
 import time
-from typing import Any, Dict, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+from sdl_gui.debug.protocol import decode_message, encode_message
 
 class DebugClient:
     """
@@ -11,12 +12,19 @@ class DebugClient:
         self.host = host
         self.port = port
         self.sock: Optional[socket.socket] = None
+        self._rfile: Optional[BinaryIO] = None
+        self._event_acks = True
 
     def connect(self) -> None:
         """Connect to the DebugServer."""
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
             self.sock.connect((self.host, self.port))
+            # Requests are small and answered one by one: do not let Nagle hold them
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffered reads keep the bytes past a newline for the next response
+            self._rfile = self.sock.makefile('rb', buffering=65536)
+            self._event_acks = True
         except Exception as e:
             self.sock.close()
             self.sock = None
@@ -25,6 +33,9 @@ class DebugClient:
 
     def close(self) -> None:
         """Close the connection."""
+        if self._rfile:
+            self._rfile.close()
+            self._rfile = None
         if self.sock:
             try:
                 self.sock.close()
@@ -38,11 +49,38 @@ class DebugClient:
         cmd.update(kwargs)
         return self._send_and_receive(cmd)
 
-    def send_event(self, event_type: str, **kwargs: Any) -> Dict[str, Any]:
+    def send_commands(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several commands in a single write and return their responses.
+
+        Args:
+            commands: Command dicts, each with an "action" and its arguments.
+
+        Returns:
+            The responses, in the order of the commands.
+        """
+        payloads = [dict(cmd, type="command") for cmd in commands]
+        return self._send_and_receive_many(payloads)
+
+    def set_event_acks(self, enabled: bool) -> Dict[str, Any]:
+        """
+        Choose whether the server answers events on this connection.
+
+        Without acks, send_event() only writes the event and returns None,
+        which suits replaying long streams of input.
+        """
+        response = self._send_and_receive({"type": "hello", "ack": enabled})
+        self._event_acks = enabled
+        return response
+
+    def send_event(self, event_type: str, **kwargs: Any) -> Optional[Dict[str, Any]]:
         """Send an event to the server."""
         evt = {"type": event_type}
         evt.update(kwargs)
         payload = {"type": "event", "event": evt}
+        if not self._event_acks:
+            self._send(payload)
+            return None
         return self._send_and_receive(payload)
 
     def dump_display_list(self) -> Dict[str, Any]:
@@ -118,34 +156,39 @@ class DebugClient:
         payload = {"type": "get_spatial_stats"}
         return self._send_and_receive(payload)
 
+    def _send(self, payload: Dict[str, Any]) -> None:
+        """Send JSON without waiting for a response."""
+        if not self.sock:
+            raise ConnectionError("Not connected")
+        try:
+            self.sock.sendall(encode_message(payload))
+        except Exception as e:
+            raise ConnectionError(f"Error during communication: {e}") from e
+
     def _send_and_receive(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Internal method to send JSON and receive JSON response."""
+        return self._send_and_receive_many([payload])[0]
+
+    def _send_and_receive_many(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send JSON payloads pipelined in one write and receive a response for each."""
         if not self.sock:
             raise ConnectionError("Not connected")
 
         try:
-            data = json.dumps(payload) + "\n"
-            self.sock.sendall(data.encode('utf-8'))
-            
-            resp_str = self._recv_response()
-            if not resp_str:
-                raise ConnectionError("Connection closed or empty response")
-            
-            return json.loads(resp_str)
+            self.sock.sendall(b"".join(encode_message(payload) for payload in payloads))
+
+            responses = []
+            for _ in payloads:
+                resp_str = self._recv_response()
+                if not resp_str:
+                    raise ConnectionError("Connection closed or empty response")
+                responses.append(decode_message(resp_str))
+            return responses
         except Exception as e:
             raise ConnectionError(f"Error during communication: {e}") from e
 
     def _recv_response(self) -> str:
         """Receive a single line response."""
-        if not self.sock:
+        if not self._rfile:
             return ""
-        
-        data = b""
-        while True:
-            chunk = self.sock.recv(4096)
-            if not chunk:
-                break
-            data += chunk
-            if b"\n" in data:
-                break
-        return data.decode('utf-8').strip()
+        return self._rfile.readline().decode('utf-8').rstrip('\n')
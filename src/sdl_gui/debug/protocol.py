@@ -0,0 +1,33 @@
+"""
+Message encoding shared by DebugServer and DebugClient.
+
+Messages are JSON objects, one per line. orjson is used when installed,
+as it encodes straight to bytes and is several times faster than the
+standard library; json is the fallback. Both escape newlines inside
+strings, so a newline always ends a message.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError derives from it as well
+DecodeError = json.JSONDecodeError
+
+
+def encode_message(payload: Any) -> bytes:
+    """Encode a payload as one newline-terminated line."""
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def decode_message(line: Union[bytes, str]) -> Any:
+    """Decode one line, with or without its newline."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
@@ -1,10 +1,42 @@
 
-import json
 import logging
+import selectors
 import socket
 import threading
-from queue import Queue
-from typing import Any, List, Optional, Tuple
+from queue import Empty, Queue
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from sdl_gui.debug.protocol import DecodeError, decode_message, encode_message
+
+# Encoded responses without data, by (status, message). Bounded, as some
+# error messages embed an exception text.
+_FIXED_RESPONSES: Dict[Tuple[str, Optional[str]], bytes] = {}
+_FIXED_RESPONSES_MAX = 32
+
+
+class ResultSlot:
+    """
+    Carries one result from the main thread back to the request waiting for it.
+
+    It has the put()/get(timeout) pair of the Queue it stands in for, but
+    holds a single value behind a single Event.
+    """
+
+    __slots__ = ("_event", "_result")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result: Any = None
+
+    def put(self, result: Any) -> None:
+        self._result = result
+        self._event.set()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Return the result, raising queue.Empty if none came within timeout."""
+        if not self._event.wait(timeout):
+            raise Empty
+        return self._result
 
 
 class DebugServer:
@@ -24,6 +56,10 @@ class DebugServer:
         # Format: (type_str, data_dict)
         self.command_queue: Queue[Tuple[str, Any]] = Queue()
         self.display_list_provider: Optional[Callable[[], List[Dict[str, Any]]]] = None
+        # Clients are read into this one buffer, on the server thread only
+        self._recv_view = memoryview(bytearray(65536))
+        # Connections that asked not to be answered for events (see "hello")
+        self._unacked_clients: Set[socket.socket] = set()
 
     def start(self) -> None:
         """Start the debug server in a separate thread."""
@@ -57,59 +93,89 @@ class DebugServer:
         # but manual join is polite if we have time.
 
     def _run_server(self) -> None:
-        while self.running:
-            try:
-                # set timeout to allow checking self.running periodically
-                if not self.server_socket:
-                    break
-
-                self.server_socket.settimeout(1.0)
-                try:
-                    conn, addr = self.server_socket.accept()
-                except socket.timeout:
-                    continue
-                except OSError:
-                    # Socket closed
-                    break
-
-                logging.info(f"Debug client connected from {addr}")
-                self._handle_client(conn)
-            except Exception as e:
+        # The thread parks in select() until the listening socket or a
+        # client is readable; the timeout lets it notice stop().
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(self.server_socket, selectors.EVENT_READ)
+            while self.running:
+                for key, _ in selector.select(timeout=0.5):
+                    if key.fileobj is self.server_socket:
+                        self._accept_client(selector)
+                    elif not self._read_client(key.fileobj, key.data):
+                        selector.unregister(key.fileobj)
+                        self._unacked_clients.discard(key.fileobj)
+                        key.fileobj.close()
+        except Exception as e:
+            # Closing the listening socket in stop() ends up here as well
+            if self.running:
                 logging.error(f"Error in debug server loop: {e}")
-                if not self.running:
-                    break
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fileobj is not self.server_socket:
+                    key.fileobj.close()
+            self._unacked_clients.clear()
+            selector.close()
 
-    def _handle_client(self, conn: socket.socket) -> None:
-        with conn:
-            buffer = ""
-            while self.running:
-                try:
-                    data = conn.recv(4096)
-                    if not data:
-                        break
-
-                    buffer += data.decode('utf-8')
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        if line.strip():
-                            self._process_message(line.strip(), conn)
-                except Exception as e:
-                    logging.error(f"Connection error: {e}")
-                    break
+    def _accept_client(self, selector: selectors.BaseSelector) -> None:
+        conn, addr = self.server_socket.accept()
+        # Replies are sent with sendall, which needs a blocking socket
+        conn.setblocking(True)
+        logging.info(f"Debug client connected from {addr}")
+        selector.register(conn, selectors.EVENT_READ, bytearray())
+
+    def _read_client(self, conn: socket.socket, buffer: bytearray) -> bool:
+        """
+        Read what a readable client sent and process its complete lines.
+
+        Returns False once the client has disconnected or failed.
+        """
+        try:
+            received = conn.recv_into(self._recv_view)
+            if not received:
+                return False
+
+            # Lines are decoded from bytes, without a str round trip.
+            # Deleting from the front of a bytearray does not copy
+            # the rest, so a burst of lines costs linear time.
+            buffer.extend(self._recv_view[:received])
+            end = buffer.find(b'\n')
+            while end != -1:
+                line = bytes(buffer[:end])
+                del buffer[:end + 1]
+                end = buffer.find(b'\n')
+                if line.strip():
+                    self._process_message(line, conn)
+            return True
+        except Exception as e:
+            logging.error(f"Connection error: {e}")
+            return False
 
-    def _process_message(self, message: str, conn: socket.socket) -> None:
+    def _process_message(self, message: Union[bytes, str], conn: socket.socket) -> None:
         try:
-            payload = json.loads(message)
+            payload = decode_message(message)
             cmd_type = payload.get("type")
 
             if cmd_type == "event":
                 event_data = payload.get("event")
                 if event_data:
                     self.command_queue.put(("event", event_data))
+                # Replaying clients stream events without reading replies
+                if conn in self._unacked_clients:
+                    return
+                if event_data:
                     self._send_response(conn, "ok")
                 else:
                     self._send_response(conn, "error", "Missing event data")
 
+            elif cmd_type == "hello":
+                # {"type": "hello", "ack": false} turns off event replies
+                if payload.get("ack", True):
+                    self._unacked_clients.discard(conn)
+                else:
+                    self._unacked_clients.add(conn)
+                self._send_response(conn, "ok")
+
             elif cmd_type == "command":
                 # General command (resize, screenshot, etc.)
                 self.command_queue.put(("command", payload))
@@ -129,8 +195,8 @@ class DebugServer:
                 x = payload.get("x", 0)
                 y = payload.get("y", 0)
                 # We need to run this in the main thread.
-                # Use a small queue to get the result back from the main thread
-                res_queue = Queue()
+                # A one-shot slot carries the result back from the main thread
+                res_queue = ResultSlot()
                 self.command_queue.put(("get_pixel", (x, y, res_queue)))
                 try:
                     # Wait for the main thread to process and return the result
@@ -144,7 +210,7 @@ class DebugServer:
 
             elif cmd_type == "benchmark":
                 frames = payload.get("frames", 100)
-                res_queue = Queue()
+                res_queue = ResultSlot()
                 self.command_queue.put(("benchmark", (frames, res_queue)))
                 try:
                     result = res_queue.get(timeout=30.0)
@@ -156,7 +222,7 @@ class DebugServer:
                     self._send_response(conn, "error", f"Timeout waiting for benchmark: {e}")
 
             elif cmd_type == "get_perf_stats":
-                res_queue = Queue()
+                res_queue = ResultSlot()
                 self.command_queue.put(("get_perf_stats", res_queue))
                 try:
                     result = res_queue.get(timeout=2.0)
@@ -168,7 +234,7 @@ class DebugServer:
                     self._send_response(conn, "error", f"Timeout: {e}")
 
             elif cmd_type == "get_spatial_stats":
-                res_queue = Queue()
+                res_queue = ResultSlot()
                 self.command_queue.put(("get_spatial_stats", res_queue))
                 try:
                     result = res_queue.get(timeout=2.0)
@@ -182,25 +248,40 @@ class DebugServer:
             else:
                 self._send_response(conn, "error", "Unknown type")
 
-        except json.JSONDecodeError:
+        except DecodeError:
             self._send_response(conn, "error", "Invalid JSON")
         except Exception as e:
             self._send_response(conn, "error", str(e))
 
     def _send_response(self, conn: socket.socket, status: str, message: str = None, data: Any = None) -> None:
-        resp = {"status": status}
-        if message:
-            resp["message"] = message
-        if data is not None:
+        if data is None:
+            # Acks and errors are a handful of fixed messages: encode each once
+            encoded = _FIXED_RESPONSES.get((status, message))
+            if encoded is None:
+                resp = {"status": status}
+                if message:
+                    resp["message"] = message
+                encoded = encode_message(resp)
+                if len(_FIXED_RESPONSES) < _FIXED_RESPONSES_MAX:
+                    _FIXED_RESPONSES[(status, message)] = encoded
+        else:
+            resp = {"status": status}
+            if message:
+                resp["message"] = message
             resp["data"] = data
+            encoded = encode_message(resp)
         try:
-            conn.sendall((json.dumps(resp) + "\n").encode('utf-8'))
+            conn.sendall(encoded)
         except Exception:
             pass
 
     def get_pending_actions(self) -> List[Tuple[str, Any]]:
         """Consume all pending commands/events from the queue."""
-        actions = []
-        while not self.command_queue.empty():
-            actions.append(self.command_queue.get())
+        queue = self.command_queue
+        if not queue.queue:
+            return []
+        # Drained under one acquisition of the queue's lock, not two per item
+        with queue.mutex:
+            actions = list(queue.queue)
+            queue.queue.clear()
         return actions
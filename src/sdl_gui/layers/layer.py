@@ -7,6 +7,8 @@ from sdl_gui.primitives.container import Container
 class Layer(Container):
     """A container layer that manages a list of children elements."""
 
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_LAYER}
+
     def __init__(self, x: Union[int, str], y: Union[int, str],
                  width: Union[int, str], height: Union[int, str],
                  id: str = None,
@@ -17,11 +19,11 @@ class Layer(Container):
     def add_child(self, child: Any) -> None:
         """Add a child element to the layer."""
         self.children.append(child)
+        self._invalidate()
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data for this layer and its children."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_LAYER
-        data[core.KEY_CHILDREN] = [child.to_data() for child in self.children]
+        data = super()._build_data()
+        data[core.KEY_CHILDREN] = self._serialize_children()
         return data
 
@@ -1,26 +1,107 @@
-from typing import Any, Dict, List, Union
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from sdl_gui import core
 from sdl_gui.layers.layer import Layer
+from sdl_gui.primitives.base import BasePrimitive
 
 
 class ScrollableLayer(Layer):
-    """A layer that can be scrolled."""
+    """
+    A layer that can be scrolled.
+
+    Scrolling is by far its most frequent change, so the serialized children
+    are cached apart from the layer's own data: a scroll only rebuilds the
+    outer dict. The children cache is dropped when children are added or
+    report a change, and by mark_dirty().
+
+    With cull_offscreen, only the children overlapping the visible range
+    [scroll_y, scroll_y + height] are emitted. This needs a pixel height on
+    the layer; children without pixel y and height are always emitted.
+    """
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_SCROLLABLE_LAYER}
 
     def __init__(self, x: Union[int, str], y: Union[int, str],
                  width: Union[int, str], height: Union[int, str],
                  scroll_y: int = 0,
                  content_height: int = 0,
                  id: str = None,
-                 listen_events: List[str] = None):
+                 listen_events: List[str] = None,
+                 cull_offscreen: bool = False):
+        self._children_data: Optional[List[Dict[str, Any]]] = None
+        self._child_bounds: List[Optional[Tuple[int, int]]] = []
+        self._sorted_bounds: Optional[Tuple[List[int], List[int]]] = None
+        self._visible: Tuple[Any, List[Dict[str, Any]]] = (None, [])
         super().__init__(x, y, width, height, id=id, listen_events=listen_events)
         self.scroll_y = scroll_y
         self.content_height = content_height
+        self.cull_offscreen = cull_offscreen
+
+    def add_child(self, child: Any) -> None:
+        """Add a child element and invalidate the cached children data."""
+        super().add_child(child)
+        self._children_data = None
+
+    def extend_children(self, children: Iterable[Any]) -> None:
+        """Add several children, invalidating the cached children data once."""
+        self.children.extend(children)
+        self.mark_dirty()
 
-    def to_data(self) -> Dict[str, Any]:
+    def mark_dirty(self) -> None:
+        """Force the layer and its children to be serialized again on the next to_data()."""
+        self._children_data = None
+        super().mark_dirty()
+
+    def _child_changed(self) -> None:
+        """Drop the cached children data, then the layer's own."""
+        self._children_data = None
+        super()._child_changed()
+
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_SCROLLABLE_LAYER
+        if self._children_data is None:
+            self._children_data = self._serialize_children()
+            self._measure_children()
+        data = BasePrimitive._build_data(self)
+        if self.cull_offscreen and isinstance(self.height, int):
+            data[core.KEY_CHILDREN] = self._visible_children_data()
+        else:
+            data[core.KEY_CHILDREN] = self._children_data
         data[core.KEY_SCROLL_Y] = self.scroll_y
         data[core.KEY_CONTENT_HEIGHT] = self.content_height
         return data
+
+    def _measure_children(self) -> None:
+        """Record the (top, bottom) of each child, None when not in pixels."""
+        self._child_bounds = []
+        for child in self.children:
+            top, height = getattr(child, "y", None), getattr(child, "height", None)
+            known = isinstance(top, int) and isinstance(height, int)
+            self._child_bounds.append((top, top + height) if known else None)
+        self._visible = (None, [])
+        # Children stacked in order (a feed) are sliced by binary search
+        self._sorted_bounds = None
+        if all(self._child_bounds):
+            tops = [b[0] for b in self._child_bounds]
+            bottoms = [b[1] for b in self._child_bounds]
+            if tops == sorted(tops) and bottoms == sorted(bottoms):
+                self._sorted_bounds = (tops, bottoms)
+
+    def _visible_children_data(self) -> List[Dict[str, Any]]:
+        """Return the data of the children overlapping the visible range."""
+        top, bottom = self.scroll_y, self.scroll_y + self.height
+        if self._sorted_bounds is not None:
+            tops, bottoms = self._sorted_bounds
+            key = (bisect_right(bottoms, top), bisect_left(tops, bottom))
+        else:
+            key = tuple(i for i, b in enumerate(self._child_bounds)
+                        if b is None or (b[1] > top and b[0] < bottom))
+        # Scrolling within the same slice reuses the same list
+        if key != self._visible[0]:
+            if self._sorted_bounds is not None:
+                visible = self._children_data[key[0]:key[1]]
+            else:
+                visible = [self._children_data[i] for i in key]
+            self._visible = (key, visible)
+        return self._visible[1]
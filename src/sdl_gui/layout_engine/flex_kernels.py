@@ -0,0 +1,83 @@
+"""
+Compiled kernels for the flex layout pass.
+
+The grow and shrink factors of a container's children are packed into
+float64 columns once per measurement of the children, their main sizes
+on each pass, and distribute_free_space() runs the grow/shrink
+resolution over them in one native loop. Numba and NumPy are
+optional, as for the spatial kernels: without them the kernel runs as
+plain Python over array.array columns, which is no faster than the
+loop in FlexNode, so callers should keep using that one.
+"""
+
+from array import array
+from typing import Any, Callable, Iterable, Sequence, Tuple, TypeVar
+
+# A packed column: a NumPy array, or an array.array without NumPy
+Column = Any
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]:
+        """No-op stand-in for numba.njit."""
+        def decorator(func: _F) -> _F:
+            return func
+        return decorator
+
+
+def pack_factors(factors: Iterable[Tuple[float, float]]) -> Tuple[Column, Column]:
+    """Pack (grow, shrink) factors into contiguous grow and shrink columns."""
+    grow, shrink = array("d"), array("d")
+    for g, s in factors:
+        grow.append(g)
+        shrink.append(s)
+    if np is not None:
+        return np.frombuffer(grow, dtype=np.float64), np.frombuffer(shrink, dtype=np.float64)
+    return grow, shrink
+
+
+def pack_sizes(sizes: Sequence[float]) -> Column:
+    """Pack main sizes into a contiguous, writable column."""
+    main = array("d", sizes)
+    if np is not None:
+        return np.frombuffer(main, dtype=np.float64)
+    return main
+
+
+@njit(cache=True)
+def distribute_free_space(main: Column, grow: Column, shrink: Column,
+                          rem: float, grow_sum: float, shrink_sum: float) -> None:
+    """
+    Grow or shrink the main sizes in place to absorb rem.
+
+    Positive free space is shared by grow factor. Negative free space is
+    taken by shrink factor, repeatedly, as items reaching zero drop out;
+    this is the loop of FlexNode._resolve_flex, in the same order.
+    """
+    if rem > 0 and grow_sum > 0:
+        for i in range(len(main)):
+            if grow[i] > 0:
+                main[i] += rem * (grow[i] / grow_sum)
+    elif rem < 0 and shrink_sum > 0:
+        while abs(rem) > 0.001 and shrink_sum > 0:
+            total_shrunk = 0.0
+            next_shrink_sum = 0.0
+            for i in range(len(main)):
+                if shrink[i] > 0 and main[i] > 0:
+                    actual_shrink = min(main[i], abs(rem) * (shrink[i] / shrink_sum))
+                    main[i] -= actual_shrink
+                    total_shrunk += actual_shrink
+                    if main[i] > 0:
+                        next_shrink_sum += shrink[i]
+            rem += total_shrunk
+            shrink_sum = next_shrink_sum
+            if total_shrunk < 0.001:
+                break
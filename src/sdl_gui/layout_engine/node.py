@@ -1,31 +1,149 @@
-from typing import List, Tuple, Optional, Union
-from sdl_gui.layout_engine.definitions import FlexDirection, JustifyContent, AlignItems, FlexWrap
+import logging
+from typing import Dict, List, Tuple, Optional, Union
+from sdl_gui.layout_engine.definitions import JustifyContent, AlignItems, FlexWrap
+from sdl_gui.layout_engine import flex_kernels
 from sdl_gui.layout_engine.style import FlexStyle
 
+# The compiled flex kernel pays for packing the children's columns only
+# in wide containers
+USE_FLEX_KERNELS = flex_kernels.NUMBA_AVAILABLE
+FLEX_KERNEL_MIN_CHILDREN = 64
+
+# Enum members are read through a descriptor on each AlignItems.X
+# lookup; layout compares against these module-level aliases instead.
+_ALIGN_CENTER = AlignItems.CENTER
+_ALIGN_FLEX_END = AlignItems.FLEX_END
+_ALIGN_STRETCH = AlignItems.STRETCH
+
+# (start offset, gap) of the children on the main axis, by justify_content,
+# from the free space, the number of children and the style's gap
+def _justify_start(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Pack the children at the start."""
+    return 0, gap
+
+
+def _justify_center(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Center the children."""
+    return free / 2, gap
+
+
+def _justify_end(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Pack the children at the end."""
+    return free, gap
+
+
+def _justify_between(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Spread the free space between the children."""
+    return (0, free / (n - 1) + gap) if n > 1 else (0, gap)
+
+
+def _justify_around(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Give each child half a share of the free space on both sides."""
+    return (free / (n * 2), free / (n * 2) * 2 + gap) if n > 0 else (0, gap)
+
+
+def _justify_evenly(free: float, n: int, gap: float) -> Tuple[float, float]:
+    """Make the free space equal before, between and after the children."""
+    return (free / (n + 1), free / (n + 1) + gap) if n > 0 else (0, gap)
+
+
+_JUSTIFY = {
+    JustifyContent.FLEX_START: _justify_start,
+    JustifyContent.CENTER: _justify_center,
+    JustifyContent.FLEX_END: _justify_end,
+    JustifyContent.SPACE_BETWEEN: _justify_between,
+    JustifyContent.SPACE_AROUND: _justify_around,
+    JustifyContent.SPACE_EVENLY: _justify_evenly,
+}
+
 class FlexNode:
     def __init__(self, style: FlexStyle = None):
-        self.style = style or FlexStyle()
+        self.style = style if style is not None else FlexStyle.default()
+        # Lets style assignments invalidate this node's cached sizes
+        self.style._add_node(self)
         self.children: List['FlexNode'] = []
         self.measure_func = None
         self.layout_rect: Tuple[int, int, int, int] = (0, 0, 0, 0)
         self.parent: 'FlexNode' = None
-    
+        # Sizes measured for each (available_width, available_height), and
+        # the last _prepare_children() result with its arguments. Both hold
+        # until mark_dirty() is called on this node or a descendant.
+        self._measure_cache: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._prepared: Optional[Tuple[Tuple, Tuple]] = None
+        # Arguments of the last layout of this node; the subtree is left
+        # as is when laid out again with the same ones, until mark_dirty()
+        self._layout_key: Optional[Tuple] = None
+
     def add_child(self, child: 'FlexNode'):
         self.children.append(child)
         child.parent = self
+        self.mark_dirty()
+
+    def mark_dirty(self, sizes: bool = True) -> None:
+        """
+        Drop the layouts, and the sizes unless sizes is False, cached by this
+        node and its ancestors.
+
+        Style assignments and add_child() call it; call it directly when a
+        measure_func starts returning other sizes.
+        """
+        node = self
+        while node is not None:
+            if sizes:
+                node._measure_cache.clear()
+                node._prepared = None
+            node._layout_key = None
+            node = node.parent
 
     def measure(self, available_width: int, available_height: int) -> Tuple[int, int]:
-        w = self._resolve_dimension(self.style.width, available_width)
-        h = self._resolve_dimension(self.style.height, available_height)
+        w = self._resolve_dimension(self.style.width_dim, available_width)
+        h = self._resolve_dimension(self.style.height_dim, available_height)
         if w is not None and h is not None: return int(w), int(h)
         if not self.children:
              if self.measure_func: return self._measure_leaf(w, h, available_width, available_height)
              return int(w or 0), int(h or 0)
-        old_rect = self.layout_rect
-        self.calculate_layout(available_width, available_height, 0, 0, force_size=False)
-        _, _, final_w, final_h = self.layout_rect
-        self.layout_rect = old_rect
-        return int(final_w), int(final_h)
+        # A layout pass asks again for the same available size: reuse the
+        # size until the subtree changes. Only an exact size match is reused.
+        key = (available_width, available_height)
+        size = self._measure_cache.get(key)
+        if size is None:
+            size = self._measure_cache[key] = self._intrinsic_size(w, h, available_width, available_height)
+        return size
+
+    def _intrinsic_size(self, w, h, available_width, available_height) -> Tuple[int, int]:
+        """
+        Size a container as calculate_layout() would, without positioning.
+
+        Only the children's sizes are needed: their layout, and this
+        node's layout_rect, are left alone.
+        """
+        is_row, axes = self.style.is_row, self.style.axes
+        main_auto, cross_auto = (w is None) if is_row else (h is None), (h is None) if is_row else (w is None)
+        calc_w, calc_h = w if w is not None else available_width, h if h is not None else available_height
+        p = self.style.padding
+        inner_w, inner_h = max(0, calc_w - p[3] - p[1]), max(0, calc_h - p[0] - p[2])
+        main_cap, cross_cap = (inner_w if is_row else inner_h), (inner_h if is_row else inner_w)
+        child_main, child_cross, _, _, _, _, spacing = self._prepare_children(main_cap, cross_cap, is_row, axes)
+        # An auto main size is not flexed, so the flex pass is not needed
+        if main_auto: main_cap = self._calc_auto_main(child_main, spacing)
+        if cross_auto: cross_cap = self._resolve_cross(child_cross, cross_cap, cross_auto, is_row, axes)[1]
+        return (int((main_cap if is_row else cross_cap) + p[3] + p[1]), int((cross_cap if is_row else main_cap) + p[0] + p[2]))
+
+    def _measure_cross(self, available_width, available_height, is_row) -> int:
+        """
+        The cross size measure() gives for a node whose cross size is set,
+        without measuring the main size: height if is_row, else width.
+        """
+        w = self._resolve_dimension(self.style.width_dim, available_width)
+        h = self._resolve_dimension(self.style.height_dim, available_height)
+        size = h if is_row else w
+        if (w is not None and h is not None) or not (self.children or self.measure_func):
+            return int(size)
+        p = self.style.padding
+        pad = p[0] + p[2] if is_row else p[3] + p[1]
+        if not self.children:
+            return int(size + pad)
+        return int(max(0, size - pad) + pad)
 
     def _measure_leaf(self, w, h, available_width, available_height):
         mw, mh = self.measure_func(available_width, available_height)
@@ -33,9 +151,28 @@ class FlexNode:
         return int((w if w is not None else mw) + p[3] + p[1]), int((h if h is not None else mh) + p[0] + p[2])
 
     def calculate_layout(self, available_width: int, available_height: int, x_offset: int = 0, y_offset: int = 0, force_size: bool = False):
+        # The subtree is walked from an explicit stack rather than by
+        # recursion: a node only places its children, whose layouts are
+        # independent of each other. They are popped in child order.
+        stack = [(self, available_width, available_height, x_offset, y_offset, force_size)]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node, available_width, available_height, x_offset, y_offset, force_size = pop()
+            placed = node._layout_node(available_width, available_height, x_offset, y_offset, force_size)
+            if placed:
+                extend(reversed(placed))
+
+    def _layout_node(self, available_width, available_height, x_offset, y_offset, force_size):
+        """Lay out this node alone; return the (child, w, h, x, y, True) layouts still to do."""
+        # Only the exact same arguments are reused: a layout done with more
+        # room is not valid for less
+        key = (available_width, available_height, x_offset, y_offset, force_size)
+        if key == self._layout_key:
+            return None
+        self._layout_key = key
         if force_size: w, h = available_width, available_height
-        else: w, h = self._resolve_dimension(self.style.width, available_width), self._resolve_dimension(self.style.height, available_height)
-        is_row = self.style.direction in (FlexDirection.ROW, FlexDirection.ROW_REVERSE)
+        else: w, h = self._resolve_dimension(self.style.width_dim, available_width), self._resolve_dimension(self.style.height_dim, available_height)
+        is_row, axes = self.style.is_row, self.style.axes
         main_auto, cross_auto = (is_row and w is None) or (not is_row and h is None), (is_row and h is None) or (not is_row and w is None)
         calc_w, calc_h = w if w is not None else available_width, h if h is not None else available_height
         if not self.children:
@@ -43,73 +180,117 @@ class FlexNode:
              final_h = h if force_size else None
              if final_w is not None and final_h is not None:
                  self.layout_rect = (int(x_offset), int(y_offset), int(final_w), int(final_h))
-                 import logging
-                 parent_str = f"P:{self.parent.style.direction.value}" if self.parent else "ROOT"
-                 logging.debug(f"Leaf layout: rect={self.layout_rect} {parent_str} force={force_size}")
+                 # Leaves are laid out thousands of times: format only when shown
+                 if logging.root.isEnabledFor(logging.DEBUG):
+                     parent_str = f"P:{self.parent.style.direction.value}" if self.parent else "ROOT"
+                     logging.debug(f"Leaf layout: rect={self.layout_rect} {parent_str} force={force_size}")
              else:
                  bw, bh = self.measure(available_width, available_height)
                  self.layout_rect = (int(x_offset), int(y_offset), int(bw), int(bh))
-             return
+             return None
         p = self.style.padding
         inner_w, inner_h = max(0, calc_w - p[3] - p[1]), max(0, calc_h - p[0] - p[2])
         main_cap, cross_cap = (inner_w if is_row else inner_h), (inner_h if is_row else inner_w)
-        child_main, child_cross, total_main, grow_sum, shrink_sum = self._prepare_children(main_cap, cross_cap, is_row)
-        child_main = self._resolve_flex(child_main, main_cap, total_main, grow_sum, shrink_sum, main_auto)
-        final_child_cross, max_cross = self._resolve_cross(child_cross, cross_cap, cross_auto, is_row)
-        if main_auto: main_cap = self._calc_auto_main(child_main, is_row)
+        child_main, child_cross, total_main, grow_sum, shrink_sum, flexible, spacing = self._prepare_children(main_cap, cross_cap, is_row, axes)
+        child_main = self._resolve_flex(child_main, main_cap, total_main, grow_sum, shrink_sum, main_auto, flexible)
+        final_child_cross, max_cross = self._resolve_cross(child_cross, cross_cap, cross_auto, is_row, axes)
+        if main_auto: main_cap = self._calc_auto_main(child_main, spacing)
         if cross_auto: cross_cap = max_cross
         self.layout_rect = (int(x_offset), int(y_offset), int((main_cap if is_row else cross_cap) + p[3] + p[1]), int((cross_cap if is_row else main_cap) + p[0] + p[2]))
-        self._set_positions(x_offset + p[3], y_offset + p[0], main_cap, cross_cap, child_main, final_child_cross, is_row)
+        return self._set_positions(x_offset + p[3], y_offset + p[0], main_cap, cross_cap, child_main, final_child_cross, is_row, axes, spacing)
+
+    def _prepare_children(self, main_cap, cross_cap, is_row, axes):
+        key = (main_cap, cross_cap, is_row)
+        prepared = self._prepared
+        if prepared is not None and prepared[0] == key:
+            cm, cc, tm, gs, ss, flexible, spacing = prepared[1]
+            # The flex pass adjusts the main sizes in place
+            return list(cm), cc, tm, gs, ss, flexible, spacing
+        result = self._measure_children(main_cap, cross_cap, is_row, axes)
+        self._prepared = (key, result)
+        cm, cc, tm, gs, ss, flexible, spacing = result
+        return list(cm), cc, tm, gs, ss, flexible, spacing
 
-    def _prepare_children(self, main_cap, cross_cap, is_row):
+    def _measure_children(self, main_cap, cross_cap, is_row, axes):
         cm, cc, tm, gs, ss = [], [], 0, 0, 0
+        # Indices of the children that can grow and shrink, so the flex
+        # pass skips the static ones
+        grow_idx, shrink_idx = [], []
+        ml, mt = axes[0], axes[1]
         tm += self.style.gap * (len(self.children) - 1) if len(self.children) > 1 else 0
-        for child in self.children:
-            basis = self._get_flex_basis(child, main_cap, cross_cap)
-            m = child.style.margin; m_main = m[3] + m[1] if is_row else m[0] + m[2]
-            av_w, av_h = (main_cap, cross_cap) if is_row else (cross_cap, main_cap)
-            cw, ch = child.measure(av_w, av_h)
-            cm.append(basis); cc.append(ch if is_row else cw)
-            tm += basis + m_main; gs += child.style.grow; ss += child.style.shrink
-        return cm, cc, tm, gs, ss
-
-    def _resolve_flex(self, child_main: List[float], main_cap: float, total_main: float, grow_sum: float, shrink_sum: float, main_is_auto: bool):
+        # Main-axis space taken besides the children: gaps and margins
+        spacing = tm
+        av_w, av_h = (main_cap, cross_cap) if is_row else (cross_cap, main_cap)
+        for i, child in enumerate(self.children):
+            style = child.style
+            if style.basis != "auto" and (style.height_dim if is_row else style.width_dim) is not None:
+                # Both sizes are set: nothing to measure
+                basis = self._get_flex_basis(child, main_cap, cross_cap, is_row)
+                cc.append(child._measure_cross(av_w, av_h, is_row))
+            else:
+                # Measured once: for a container, measure() sizes its subtree
+                cw, ch = child.measure(av_w, av_h)
+                basis = self._get_flex_basis(child, main_cap, cross_cap, is_row, (cw, ch))
+                cc.append(ch if is_row else cw)
+            m = style.margin; m_main = m[ml] + m[mt]
+            cm.append(basis)
+            tm += basis + m_main; spacing += m_main; gs += child.style.grow; ss += child.style.shrink
+            if child.style.grow > 0: grow_idx.append(i)
+            if child.style.shrink > 0: shrink_idx.append(i)
+        # Wide containers flex through the kernel, from columns packed here
+        factors = None
+        if USE_FLEX_KERNELS and len(self.children) >= FLEX_KERNEL_MIN_CHILDREN:
+            factors = flex_kernels.pack_factors((c.style.grow, c.style.shrink) for c in self.children)
+        return cm, cc, tm, gs, ss, (grow_idx, shrink_idx, factors), spacing
+
+    def _resolve_flex(self, child_main: List[float], main_cap: float, total_main: float, grow_sum: float, shrink_sum: float, main_is_auto: bool,
+                      flexible: Tuple[List[int], List[int], Optional[Tuple]]):
         rem = main_cap - total_main
         if main_is_auto or abs(rem) < 0.001: return child_main
-        
+        grow_idx, shrink_idx, factors = flexible
+        children = self.children
+        if factors is not None:
+            main = flex_kernels.pack_sizes(child_main)
+            flex_kernels.distribute_free_space(main, *factors, rem, grow_sum, shrink_sum)
+            child_main[:] = main.tolist()
+            return child_main
+
         if rem > 0 and grow_sum > 0:
-            for i, child in enumerate(self.children):
-                if child.style.grow > 0:
-                    child_main[i] += rem * (child.style.grow / grow_sum)
+            for i in grow_idx:
+                child_main[i] += rem * (children[i].style.grow / grow_sum)
         elif rem < 0 and shrink_sum > 0:
             # Iterative shrinking to handle items reaching 0
             while abs(rem) > 0.001 and shrink_sum > 0:
                 total_shrunk = 0
                 next_shrink_sum = 0
-                for i, child in enumerate(self.children):
-                    if child.style.shrink > 0 and child_main[i] > 0:
+                for i in shrink_idx:
+                    if child_main[i] > 0:
+                        shrink = children[i].style.shrink
                         # Ratio based on current total shrink sum of active items
-                        potential_shrink = abs(rem) * (child.style.shrink / shrink_sum)
+                        potential_shrink = abs(rem) * (shrink / shrink_sum)
                         actual_shrink = min(child_main[i], potential_shrink)
                         child_main[i] -= actual_shrink
                         total_shrunk += actual_shrink
                         if child_main[i] > 0:
-                            next_shrink_sum += child.style.shrink
+                            next_shrink_sum += shrink
                 rem += total_shrunk
                 shrink_sum = next_shrink_sum
                 if total_shrunk < 0.001: break # Prevent infinite loops if progress stalls
         return child_main
 
-    def _resolve_cross(self, child_cross: List[float], cross_cap: float, cross_is_auto: bool, is_row: bool):
+    def _resolve_cross(self, child_cross: List[float], cross_cap: float, cross_is_auto: bool, is_row: bool, axes: Tuple[int, int, int, int]):
         final, max_c = [], 0.0
+        cl, ct = axes[2], axes[3]
         for i, child in enumerate(self.children):
-            m = child.style.margin; m_cross = m[0] + m[2] if is_row else m[3] + m[1]
+            m = child.style.margin; m_cross = m[cl] + m[ct]
             c_cross = child_cross[i]
-            req = child.style.height if is_row else child.style.width
-            
-            if req is not None and req != "auto" and not (isinstance(req, (int, float)) and req == 0): 
-                c_cross = self._resolve_dimension(req, cross_cap)
-            elif self.style.align_items == AlignItems.STRETCH and not cross_is_auto: 
+            dim = child.style.height_dim if is_row else child.style.width_dim
+
+            # A set size other than a plain 0 wins; dim[1] is only 0 for
+            # an absolute value when it was given as 0 or unparseable
+            if dim is not None and (dim[0] is not None or dim[1] != 0 or not isinstance(child.style.height if is_row else child.style.width, (int, float))):
+                c_cross = dim[1] if dim[0] is None else dim[0] * cross_cap
+            elif self.style.align_items is _ALIGN_STRETCH and not cross_is_auto: 
                 c_cross = cross_cap - m_cross
             
             # Robustness: clamp to available cross capacity if parent has fixed size
@@ -119,58 +300,47 @@ class FlexNode:
             final.append(c_cross); max_c = max(max_c, c_cross + m_cross)
         return final, max_c
 
-    def _calc_auto_main(self, child_main, is_row):
-        main = sum(child_main) + (self.style.gap * (len(self.children) - 1) if len(self.children) > 1 else 0)
-        for child in self.children:
-             m = child.style.margin; main += (m[3] + m[1] if is_row else m[0] + m[2])
-        return main
+    def _calc_auto_main(self, child_main, spacing):
+        return sum(child_main) + spacing
 
-    def _set_positions(self, ctx_x, ctx_y, main_cap, cross_cap, child_main, final_cross, is_row):
-        tm_with_m = sum(child_main) + (self.style.gap * (len(self.children) - 1) if len(self.children) > 1 else 0)
-        for c in self.children: m = c.style.margin; tm_with_m += (m[3] + m[1] if is_row else m[0] + m[2])
-        free = main_cap - tm_with_m
+    def _set_positions(self, ctx_x, ctx_y, main_cap, cross_cap, child_main, final_cross, is_row, axes, spacing):
+        free = main_cap - self._calc_auto_main(child_main, spacing)
         start, gap = self._get_justify_params(free)
         curr_m = start
+        ml, mt, cl, ct = axes
+        # Cross-axis alignment, decided once for all the children
+        align = self.style.align_items
+        center, end = align is _ALIGN_CENTER, align is _ALIGN_FLEX_END
+        placed = []
         for i, child in enumerate(self.children):
             m = child.style.margin; c_m, c_c = child_main[i], final_cross[i]
-            ms, me = (m[3], m[1]) if is_row else (m[0], m[2])
-            cs = self._get_align_pos(child, cross_cap, c_c, is_row)
+            ms, me = m[ml], m[mt]
+            if center: cs = (cross_cap - (c_c + m[cl] + m[ct])) / 2 + m[cl]
+            elif end: cs = cross_cap - c_c - m[ct]
+            else: cs = m[cl]
             if is_row: cx, cy, cw, ch = ctx_x + curr_m + ms, ctx_y + cs, c_m, c_c
             else: cx, cy, cw, ch = ctx_x + cs, ctx_y + curr_m + ms, c_c, c_m
-            child.calculate_layout(cw, ch, cx, cy, force_size=True)
+            placed.append((child, cw, ch, cx, cy, True))
             curr_m += (c_m + ms + me) + gap
+        return placed
 
     def _get_justify_params(self, free):
-        start, gap = 0, self.style.gap
-        jc = self.style.justify_content
-        if jc == JustifyContent.CENTER: start = free / 2
-        elif jc == JustifyContent.FLEX_END: start = free
-        elif jc == JustifyContent.SPACE_BETWEEN and len(self.children) > 1: gap = free / (len(self.children) - 1) + gap
-        elif jc == JustifyContent.SPACE_AROUND and len(self.children) > 0: unit = free / (len(self.children) * 2); start, gap = unit, unit * 2 + gap
-        elif jc == JustifyContent.SPACE_EVENLY and len(self.children) > 0: gap = free / (len(self.children) + 1) + gap; start = free / (len(self.children) + 1)
-        return start, gap
-
-    def _get_align_pos(self, child, cross_cap, c_c, is_row):
-        m = child.style.margin; ms, me = (m[0], m[2]) if is_row else (m[3], m[1])
-        if self.style.align_items == AlignItems.CENTER: return (cross_cap - (c_c + ms + me)) / 2 + ms
-        if self.style.align_items == AlignItems.FLEX_END: return cross_cap - c_c - me
-        return ms
-
-    def _resolve_dimension(self, val, available):
-        if val is None or val == "auto": return None
-        if isinstance(val, (int, float)): return val
-        if isinstance(val, str) and val.endswith("%"):
-            try: return float(val[:-1]) / 100.0 * available
-            except: return 0
-        return 0
-
-    def _get_flex_basis(self, child, main_cap, cross_cap):
-        basis = child.style.basis
-        if basis == "auto":
-            is_row = self.style.direction in (FlexDirection.ROW, FlexDirection.ROW_REVERSE)
-            req = child.style.width if is_row else child.style.height
-            if req is not None and req != "auto": return self._resolve_dimension(req, main_cap) or 0
-            av_w, av_h = (main_cap, cross_cap) if is_row else (cross_cap, main_cap)
-            cw, ch = child.measure(av_w, av_h)
+        return _JUSTIFY.get(self.style.justify_content, _justify_start)(free, len(self.children), self.style.gap)
+
+    def _resolve_dimension(self, dim, available):
+        """Resolve a dimension parsed by FlexStyle against the available size."""
+        if dim is None: return None
+        fraction, pixels = dim
+        return pixels if fraction is None else fraction * available
+
+    def _get_flex_basis(self, child, main_cap, cross_cap, is_row, measured=None):
+        style = child.style
+        if style.basis == "auto":
+            dim = style.width_dim if is_row else style.height_dim
+            if dim is not None: return (dim[1] if dim[0] is None else dim[0] * main_cap) or 0
+            if measured is None:
+                av_w, av_h = (main_cap, cross_cap) if is_row else (cross_cap, main_cap)
+                measured = child.measure(av_w, av_h)
+            cw, ch = measured
             return cw if is_row else ch
-        return self._resolve_dimension(basis, main_cap) or 0
+        return self._resolve_dimension(style.basis_dim, main_cap) or 0
@@ -1,6 +1,46 @@
-from dataclasses import dataclass
-from typing import Union, Optional
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Union, Optional, Tuple
 from sdl_gui.layout_engine.definitions import FlexDirection, JustifyContent, AlignItems, FlexWrap
+from sdl_gui.utils import parse_dimension
+
+# A dimension parsed for layout: (fraction of the available size, or None
+# for an absolute value; pixels). None stands for "auto".
+ParsedDimension = Optional[Tuple[Optional[float], Union[int, float]]]
+
+# Fields kept parsed alongside their value, as <name>_dim
+_DIMENSION_FIELDS = frozenset(("width", "height", "basis"))
+
+# Margin and padding indices (top, right, bottom, left) of the leading
+# and trailing edges of the main axis, then of the cross axis
+_ROW_AXES = (3, 1, 0, 2)
+_COLUMN_AXES = (0, 2, 3, 1)
+AXIS_TABLE = {
+    FlexDirection.ROW: _ROW_AXES,
+    FlexDirection.ROW_REVERSE: _ROW_AXES,
+    FlexDirection.COLUMN: _COLUMN_AXES,
+    FlexDirection.COLUMN_REVERSE: _COLUMN_AXES,
+}
+
+# Fields that move children without changing any size
+_POSITION_ONLY_FIELDS = frozenset(("justify_content",))
+
+# Nodes using each style, by id(style). Kept out of the instances so that
+# copies of a style do not share them; weak so they do not keep nodes alive.
+_STYLE_NODES: Dict[int, "weakref.WeakSet[Any]"] = {}
+
+
+def parse_flex_dimension(val: Any) -> ParsedDimension:
+    """Parse a width, height or basis value; strings that do not parse give 0 pixels."""
+    if val is None or val == "auto":
+        return None
+    if isinstance(val, (int, float)):
+        return (None, val)
+    if isinstance(val, str) and val.endswith("%"):
+        fraction, _ = parse_dimension(val)
+        return (None, 0) if fraction is None else (fraction, 0)
+    return (None, 0)
+
 
 @dataclass
 class FlexStyle:
@@ -9,14 +49,60 @@ class FlexStyle:
     align_items: AlignItems = AlignItems.STRETCH
     wrap: FlexWrap = FlexWrap.NOWRAP
     gap: int = 0
-    
+
     # Item properties
     grow: float = 0.0
     shrink: float = 1.0
     basis: Union[int, str] = "auto"
-    
+
     # Box Model for layout calculations
     width: Union[int, str, None] = None
     height: Union[int, str, None] = None
     margin: tuple = (0, 0, 0, 0) # top, right, bottom, left
     padding: tuple = (0, 0, 0, 0)
+
+    # Parsed width, height and basis, set along with them by __setattr__
+    width_dim: ParsedDimension = field(init=False, repr=False, compare=False)
+    height_dim: ParsedDimension = field(init=False, repr=False, compare=False)
+    basis_dim: ParsedDimension = field(init=False, repr=False, compare=False)
+    # Main axis and margin/padding edge indices, set along with direction
+    is_row: bool = field(init=False, repr=False, compare=False)
+    axes: Tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+
+    @classmethod
+    def default(cls) -> "FlexStyle":
+        """
+        Return a new style with the default values.
+
+        Same as FlexStyle(), but copied from a shared default instance
+        rather than built field by field through __setattr__.
+        """
+        style = object.__new__(cls)
+        style.__dict__.update(_DEFAULT_STATE)
+        return style
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field; dimensions and the main axis are derived here rather than on every layout pass."""
+        object.__setattr__(self, name, value)
+        # The layouts cached by the nodes using this style, and by their
+        # ancestors, no longer hold; so may their sizes
+        sizes = name not in _POSITION_ONLY_FIELDS
+        for node in _STYLE_NODES.get(id(self), ()):
+            node.mark_dirty(sizes)
+        if name in _DIMENSION_FIELDS:
+            object.__setattr__(self, name + "_dim", parse_flex_dimension(value))
+        elif name == "direction":
+            object.__setattr__(self, "is_row", value in (FlexDirection.ROW, FlexDirection.ROW_REVERSE))
+            object.__setattr__(self, "axes", AXIS_TABLE.get(value, _COLUMN_AXES))
+
+    def _add_node(self, node: Any) -> None:
+        """Register a node whose cached layout depends on this style."""
+        nodes = _STYLE_NODES.get(id(self))
+        if nodes is None:
+            nodes = _STYLE_NODES[id(self)] = weakref.WeakSet()
+            weakref.finalize(self, _STYLE_NODES.pop, id(self), None)
+        nodes.add(node)
+
+
+# Fields of a default style, derived ones included, for FlexStyle.default()
+_DEFAULT_STATE = dict(FlexStyle().__dict__)
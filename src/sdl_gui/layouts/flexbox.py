@@ -8,6 +8,8 @@ class FlexBox(Container):
     Uses the FlexLayout engine to position children.
     """
 
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_FLEXBOX}
+
     def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
                  flex_direction: str = "row",
                  justify_content: str = "flex_start",
@@ -25,18 +27,19 @@ class FlexBox(Container):
         self.gap = gap
         self.children: List[Any] = []
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate FlexBox data."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_FLEXBOX
-        
+        data = super()._build_data()
+
         data[core.KEY_FLEX_DIRECTION] = self.flex_direction
         data[core.KEY_JUSTIFY_CONTENT] = self.justify_content
         data[core.KEY_ALIGN_ITEMS] = self.align_items
         data[core.KEY_FLEX_WRAP] = self.flex_wrap
         data[core.KEY_GAP] = self.gap
         
-        if self.children:
-            data[core.KEY_CHILDREN] = [child.to_data() for child in self.children]
+        # Serialized even when empty, to unlink the removed children
+        children = self._serialize_children()
+        if children:
+            data[core.KEY_CHILDREN] = children
         
         return data
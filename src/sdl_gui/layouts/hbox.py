@@ -7,6 +7,10 @@ from sdl_gui.primitives.container import Container
 class HBox(Container):
     """Horizontal Box Layout."""
 
+    __slots__ = ("children",)
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_HBOX}
+
     def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
                  padding: tuple = (0, 0, 0, 0), margin: tuple = (0, 0, 0, 0),
                  id: str = None,
@@ -17,11 +21,13 @@ class HBox(Container):
     def add_child(self, child: Any) -> None:
         """Add a child to the layout."""
         self.children.append(child)
+        self._invalidate()
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate HBox data."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_HBOX
-        if self.children:
-            data[core.KEY_CHILDREN] = [child.to_data() for child in self.children]
+        data = super()._build_data()
+        # Serialized even when empty, to unlink the removed children
+        children = self._serialize_children()
+        if children:
+            data[core.KEY_CHILDREN] = children
         return data
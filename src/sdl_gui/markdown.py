@@ -1,3 +1,5 @@
+import functools
+import re
 from typing import List, Optional, Tuple
 
 
@@ -19,8 +21,14 @@ class TextSegment:
                 self.color == other.color and
                 self.link_target == other.link_target)
 
+# Text color of segments when none is given
+_DEFAULT_COLOR = (0, 0, 0, 255)
+
+
+# Bounded: color strings come from markup, which may be user content
+@functools.lru_cache(maxsize=512)
 def parse_color(color_str: str) -> Optional[Tuple[int, int, int, int]]:
-    """Parse hex color string (#RRGGBB or #RRGGBBAA) to tuple."""
+    """Parse hex color string (#RRGGBB or #RRGGBBAA) to tuple, memoized."""
     if not color_str.startswith("#"):
         return None
 
@@ -44,8 +52,31 @@ def parse_color(color_str: str) -> Optional[Tuple[int, int, int, int]]:
             return None
     return None
 
+# Compiled once. A token is, in order of preference: a closed bold run, a
+# bracket block without nested brackets (with its (target) or {#color}
+# suffix, if any), or a lone marker - an unclosed "**", or a "[" whose
+# brackets nest or never close, left to the balanced bracket scan.
+_TOKEN_RE = re.compile(
+    r"\*\*(.*?)\*\*"
+    r"|\[([^\[\]]*)\](?:\(([^)]*)\)|\{([^}]*)\})?"
+    r"|\*\*|\[",
+    re.DOTALL,
+)
+_SUFFIX_RE = re.compile(r"\(([^)]*)\)|\{([^}]*)\}")
+_BRACKET_RE = re.compile(r"[\[\]]")
+
+
+def _find_closing_bracket(text: str, start: int) -> int:
+    """Return the index of the bracket closing the one at start, or -1."""
+    depth = 0
+    for match in _BRACKET_RE.finditer(text, start):
+        depth += 1 if match.group() == "[" else -1
+        if depth == 0:
+            return match.start()
+    return -1
+
 class MarkdownParser:
-    def __init__(self, default_color: Tuple[int, int, int, int] = (0, 0, 0, 255)):
+    def __init__(self, default_color: Tuple[int, int, int, int] = _DEFAULT_COLOR):
         self.default_color = default_color
 
     def parse(self, text: str) -> List[TextSegment]:
@@ -73,132 +104,92 @@ class MarkdownParser:
     def _parse_recursive(self, text: str, bold: bool, color: Tuple[int, int, int, int], link: Optional[str]) -> List[TextSegment]:
         segments = []
 
-        # Patterns
-        # We need to find the *first* match of any of these.
-
-        # Bold: **...**
-        # Link/Color: [...]...
-
-        # We can't just regex distinct patterns because they might overlap or be nested incorrectly if we are not careful.
-        # But for valid input:
-        # [ ... ] is a distinct start.
-        # ** is a distinct start.
-
-        # Search for next special char: '[' or '*'
-
+        # Each token is found, and in the common case fully delimited, by
+        # one regex search; only the text inside a bold run or a bracket
+        # block is parsed again.
         i = 0
-        while i < len(text):
-            # scan for next marker
-            next_bold = text.find("**", i)
-            next_bracket = text.find("[", i)
-
-            # Determine which comes first
-            candidates = []
-            if next_bold != -1: candidates.append((next_bold, "bold"))
-            if next_bracket != -1: candidates.append((next_bracket, "bracket"))
-
-            if not candidates:
-                # No more markers
-                remaining = text[i:]
-                if remaining:
-                    segments.append(TextSegment(remaining, bold, color, link))
+        while True:
+            token = _TOKEN_RE.search(text, i)
+            if not token:
                 break
 
-            candidates.sort(key=lambda x: x[0])
-            first_idx, type_ = candidates[0]
-
-            # Add text before marker
+            first_idx = token.start()
+            # Add text before the token
             if first_idx > i:
                 segments.append(TextSegment(text[i:first_idx], bold, color, link))
 
-            if type_ == "bold":
-                # Find closing **
-                end_bold = text.find("**", first_idx + 2)
-                if end_bold != -1:
-                    # Found bold block
-                    inner_text = text[first_idx+2 : end_bold]
-                    # Recurse for inner text with bold=True
-                    inner_segments = self._parse_recursive(inner_text, not bold, color, link) # Toggle bold? typically force True.
-                    # Markdown ** toggles? Usually enables. Nested **? **a **b** c** -> a b c (bold).
-                    # Standard markdown: **a** is bold. **a **b** c** is ambiguous or valid.
-                    # Simple toggle approach or sets to True.
-                    # "Text **Bold** Text" -> Regular, Bold, Regular.
-                    # "Text **Bold **Nested** Bold**" -> usually parsing fails or unbolds?
-                    # Set bold=True for inner.
-
-                    segments.extend(self._parse_recursive(inner_text, True, color, link))
-                    i = end_bold + 2
-                else:
-                    # No closing **, treat as literal **
-                    segments.append(TextSegment("**", bold, color, link))
-                    i = first_idx + 2
-
-            elif type_ == "bracket":
-                # Found [, look for closing ] to capture content
-                # This needs to handle nested brackets if we support them?
-                # Simple balanced bracket finder.
-                bracket_depth = 0
-                close_bracket = -1
-                for j in range(first_idx, len(text)):
-                    if text[j] == "[":
-                        bracket_depth += 1
-                    elif text[j] == "]":
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            close_bracket = j
-                            break
-
-                if close_bracket != -1:
-                    inner_content = text[first_idx+1 : close_bracket]
-                    # Check what follows: (url) or {color}
-                    next_char_idx = close_bracket + 1
-
-                    processed = False
-
-                    if next_char_idx < len(text):
-                        suffix_char = text[next_char_idx]
-                        if suffix_char == "(":
-                            # Link: find closing )
-                            close_paren = text.find(")", next_char_idx)
-                            if close_paren != -1:
-                                target = text[next_char_idx+1 : close_paren]
-                                # Recurse inner content with link target
-                                # (Inner content can have formatting, but links usually don't nest links)
-                                segments.extend(self._parse_recursive(inner_content, bold, color, target))
-                                i = close_paren + 1
-                                processed = True
-
-                        elif suffix_char == "{":
-                            # Color: find closing }
-                            close_brace = text.find("}", next_char_idx)
-                            if close_brace != -1:
-                                attr = text[next_char_idx+1 : close_brace]
-                                # Expect #RRGGBB
-                                new_color = parse_color(attr)
-                                if new_color:
-                                    segments.extend(self._parse_recursive(inner_content, bold, new_color, link))
-                                else:
-                                    # Invalid color, treat as text or fallback?
-                                    # Fallback: just recurse with old color?
-                                    segments.extend(self._parse_recursive(inner_content, bold, color, link))
-
-                                i = close_brace + 1
-                                processed = True
-
-                    if not processed:
-                        # Just brackets [], treat as literal text or recurse inner?
-                        # [Text] -> just "Text" or "[Text]"?
-                        # Markdown: [Text] is text if not followed by link.
-                        # We return "[", recurse inner, "]"?
-                        # Or just treats as text.
-                        # Simple approach: It's text.
-                        segments.append(TextSegment("[", bold, color, link))
-                        segments.extend(self._parse_recursive(inner_content, bold, color, link))
-                        segments.append(TextSegment("]", bold, color, link))
-                        i = close_bracket + 1
-                else:
+            bold_text, inner_content, target, attr = token.groups()
+            if bold_text is not None:
+                # "Text **Bold** Text" -> Regular, Bold, Regular.
+                segments.extend(self._parse_recursive(bold_text, True, color, link))
+                i = token.end()
+            elif inner_content is not None:
+                self._parse_block(segments, inner_content, target, attr, bold, color, link)
+                i = token.end()
+            elif token.group() == "**":
+                # No closing **, treat as literal **
+                segments.append(TextSegment("**", bold, color, link))
+                i = first_idx + 2
+            else:
+                # Nested brackets: find the one closing this [ by depth
+                close_bracket = _find_closing_bracket(text, first_idx)
+                if close_bracket == -1:
                     # No closing bracket
                     segments.append(TextSegment("[", bold, color, link))
                     i = first_idx + 1
+                    continue
+                inner_content = text[first_idx+1 : close_bracket]
+                suffix = _SUFFIX_RE.match(text, close_bracket + 1)
+                if suffix:
+                    target, attr = suffix.groups()
+                    i = suffix.end()
+                else:
+                    target = attr = None
+                    i = close_bracket + 1
+                self._parse_block(segments, inner_content, target, attr, bold, color, link)
 
+        # No more markers
+        if i < len(text):
+            segments.append(TextSegment(text[i:], bold, color, link))
         return segments
+
+    def _parse_block(self, segments: List[TextSegment], inner_content: str, target: Optional[str], attr: Optional[str],
+                     bold: bool, color: Tuple[int, int, int, int], link: Optional[str]) -> None:
+        """Append the segments of a [...] block, given its (target) or {attr} suffix if any."""
+        if target is not None:
+            # Link: inner content can have formatting, but links usually don't nest links
+            segments.extend(self._parse_recursive(inner_content, bold, color, target))
+        elif attr is not None:
+            # Color: expect #RRGGBB; an invalid color keeps the current one
+            new_color = parse_color(attr)
+            segments.extend(self._parse_recursive(inner_content, bold, new_color or color, link))
+        else:
+            # Markdown: [Text] is text if not followed by a link or color
+            segments.append(TextSegment("[", bold, color, link))
+            segments.extend(self._parse_recursive(inner_content, bold, color, link))
+            segments.append(TextSegment("]", bold, color, link))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_markup(text: str, default_color: Tuple[int, int, int, int] = _DEFAULT_COLOR) -> Tuple[TextSegment, ...]:
+    """
+    Parse markup once per distinct (text, default_color) pair.
+
+    UIs repeat the same markup strings across many widgets (labels, vote
+    buttons, ...), so the segments are memoized. They are shared between
+    callers and must be treated as read-only.
+    """
+    return tuple(MarkdownParser(default_color=default_color).parse(text))
+
+
+@functools.lru_cache(maxsize=4096)
+def segments_from_runs(runs: Tuple[Tuple[str, str], ...],
+                       default_color: Tuple[int, int, int, int] = _DEFAULT_COLOR) -> Tuple[TextSegment, ...]:
+    """
+    Build segments from pre-styled (style, text) runs, skipping the parser.
+
+    The only style is "bold"; any other style gives regular text. Like
+    parse_markup(), results are memoized and must be treated as read-only.
+    """
+    return tuple(TextSegment(text, bold=(style == "bold"), color=default_color)
+                 for style, text in runs)
@@ -1,5 +1,6 @@
 from .container import Container
 from .image import Image
 from .input import Input
+from .rect_batch import RectBatch
 from .rectangle import Rectangle
 from .responsive_text import ResponsiveText
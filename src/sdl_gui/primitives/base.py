@@ -1,21 +1,59 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, FrozenSet, List, Tuple, Union
 
 from sdl_gui import context, core
+from sdl_gui.utils import intern_tuple
+
+_ZERO_SPACING = intern_tuple((0, 0, 0, 0))
+
+# Normalized spacing by the value given, for the hashable forms. Lookups
+# are limited to these exact types: 1.0 and True hash like 1 but do not
+# normalize alike.
+_SPACING_CACHE: Dict[Any, Tuple[Any, Any, Any, Any]] = {0: _ZERO_SPACING, _ZERO_SPACING: _ZERO_SPACING}
+_SPACING_CACHE_LIMIT = 1024
+_SPACING_KEY_TYPES = frozenset((int, str, tuple))
 
 
 class BasePrimitive(ABC):
-    """Abstract base class for all display primitives."""
+    """
+    Abstract base class for all display primitives.
+
+    to_data() output is cached and only rebuilt after a change. Assigning
+    any public attribute drops the cache of the primitive and of the
+    containers that serialized it, so a static subtree is serialized once;
+    attributes listed in _UNRENDERED_FIELDS are the exception.
+    Subclasses build their data in _build_data(). In-place mutations
+    (list.append on an attribute, ...) are not seen: call mark_dirty().
+    """
+
+    __slots__ = ("x", "y", "width", "height", "padding", "margin", "id",
+                 "listen_events", "extra", "_cached_data", "_parents", "_rect_data")
+
+    # Constant entries every display list item of this class starts from.
+    # Subclasses override it (typically with their KEY_TYPE) and to_data()
+    # copies it instead of building a literal dict on every call.
+    _DATA_TEMPLATE: Dict[str, Any] = {}
+
+    # Attributes making up the KEY_RECT list, kept across rebuilds
+    _RECT_FIELDS = frozenset(("x", "y", "width", "height"))
+
+    # Public attributes left out of the data (interaction state, callbacks):
+    # assigning them keeps the cache
+    _UNRENDERED_FIELDS: FrozenSet[str] = frozenset()
 
     def __init__(self,
                  x: Union[int, str],
                  y: Union[int, str],
                  width: Union[int, str],
                  height: Union[int, str],
-                 padding: Union[int, str, Tuple[int, int, int, int], List[int]] = (0, 0, 0, 0),
-                 margin: Union[int, str, Tuple[int, int, int, int], List[int]] = (0, 0, 0, 0),
+                 padding: Union[int, str, Tuple[int, int, int, int], List[int]] = _ZERO_SPACING,
+                 margin: Union[int, str, Tuple[int, int, int, int], List[int]] = _ZERO_SPACING,
                  id: str = None,
                  listen_events: List[str] = None):
+        # Set first: the public assignments below already invalidate it
+        self._cached_data = None
+        self._rect_data = None
+        self._parents: List["BasePrimitive"] = []
         self.x = x
         self.y = y
         self.width = width
@@ -41,23 +79,99 @@ class BasePrimitive(ABC):
 
     def _normalize_spacing(self, val: Union[int, str, Tuple, List]) -> Tuple[Any, Any, Any, Any]:
         """Normalize spacing value to (top, right, bottom, left)."""
+        cacheable = type(val) in _SPACING_KEY_TYPES
+        if cacheable:
+            try:
+                spacing = _SPACING_CACHE.get(val)
+            except TypeError:  # Unhashable member
+                cacheable = False
+            else:
+                if spacing is not None:
+                    return spacing
+        spacing = self._spacing_tuple(val)
+        if cacheable and len(_SPACING_CACHE) < _SPACING_CACHE_LIMIT:
+            _SPACING_CACHE[val] = spacing
+        return spacing
+
+    @staticmethod
+    def _spacing_tuple(val: Union[int, str, Tuple, List]) -> Tuple[Any, Any, Any, Any]:
         if isinstance(val, (int, str)):
-            return (val, val, val, val)
+            return intern_tuple((val, val, val, val))
         elif isinstance(val, (tuple, list)):
             if len(val) == 4:
-                return tuple(val)
+                return intern_tuple(tuple(val))
             elif len(val) == 2:
                 # Top/Bottom, Right/Left
-                return (val[0], val[1], val[0], val[1])
+                return intern_tuple((val[0], val[1], val[0], val[1]))
             elif len(val) == 1:
-                return (val[0], val[0], val[0], val[0])
-        return (0, 0, 0, 0)
+                return intern_tuple((val[0], val[0], val[0], val[0]))
+        return _ZERO_SPACING
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute; public attributes invalidate the cached data."""
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and name not in self._UNRENDERED_FIELDS:
+            if name in self._RECT_FIELDS:
+                object.__setattr__(self, "_rect_data", None)
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the cached data of this primitive and of its ancestors."""
+        self._cached_data = None
+        for parent in self._parents:
+            parent._child_changed()
+
+    def _child_changed(self) -> None:
+        """Called by a serialized child whose data changed."""
+        # Ancestors of a primitive with no cached data have none either
+        if self._cached_data is not None:
+            self._invalidate()
+
+    def _add_parent(self, parent: "BasePrimitive") -> None:
+        """Register a container that embeds this primitive's data."""
+        parents = self._parents
+        for p in parents:
+            if p is parent:
+                return
+        parents.append(parent)
+
+    def _remove_parent(self, parent: "BasePrimitive") -> None:
+        """Unregister a container that no longer embeds this primitive's data."""
+        parents = self._parents
+        for i, p in enumerate(parents):
+            if p is parent:
+                del parents[i]
+                return
+
+    def mark_dirty(self) -> None:
+        """Force the data to be built again on the next to_data()."""
+        self._invalidate()
 
     def to_data(self) -> Dict[str, Any]:
+        """
+        Return the display list data, rebuilt only after a change.
+
+        The top-level dict is a fresh copy; nested values (children, ...)
+        are shared with the cache and must be treated as read-only.
+        """
+        return self._get_data().copy()
+
+    def _get_data(self) -> Dict[str, Any]:
+        """Return the cached data itself, building it if needed."""
+        data = self._cached_data
+        if data is None:
+            data = self._build_data()
+            self._cached_data = data
+        return data
+
+    def _build_data(self) -> Dict[str, Any]:
         """Generate common data fields."""
-        data = {
-            core.KEY_RECT: [self.x, self.y, self.width, self.height]
-        }
+        data = self._DATA_TEMPLATE.copy()
+        # Rebuilds caused by other changes (a child, a color) reuse the list
+        rect = self._rect_data
+        if rect is None:
+            rect = self._rect_data = [self.x, self.y, self.width, self.height]
+        data[core.KEY_RECT] = rect
         if self.padding != (0, 0, 0, 0):
             data[core.KEY_PADDING] = self.padding
         if self.margin != (0, 0, 0, 0):
@@ -92,47 +206,21 @@ class BasePrimitive(ABC):
         'justify_content',
         'align_items',
         'flex_wrap',
-        'gap'
+        'gap',
+        'static'
     }
 
     def __getattr__(self, name: str):
         """
         Generic setter mechanism.
-        Intercepts calls to set_xxx and validates xxx against ALLOWED_PROPERTIES.
+        The set_xxx methods of ALLOWED_PROPERTIES are defined on the class;
+        this only serves properties a subclass adds, and refuses the others.
         """
         if name.startswith("set_"):
             prop_name = name[4:]
 
             if prop_name in self.ALLOWED_PROPERTIES:
-                # Helper to handle the actual setting
-                def setter(*args):
-                    key = prop_name
-                    # Map Alias
-                    if prop_name == 'background_color':
-                        key = 'color'
-
-                    # Determine value
-                    if len(args) == 1:
-                        val = args[0]
-                    else:
-                        val = args # tuple
-
-                    # Normalize Spacing
-                    if key in ('padding', 'margin'):
-                         val = self._normalize_spacing(val)
-
-                    # Normalize Color
-                    if key in ('color', 'background_color', 'border_color'):
-                         if isinstance(val, (tuple, list)):
-                             if len(val) == 3:
-                                 val = (val[0], val[1], val[2], 255)
-                             elif len(val) == 4:
-                                 val = tuple(val)
-
-                    self.extra[key] = val
-                    return self
-
-                return setter
+                return _property_setter(prop_name).__get__(self)
             else:
                  raise AttributeError(f"Property '{prop_name}' is not allowed or does not exist.")
 
@@ -140,3 +228,42 @@ class BasePrimitive(ABC):
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
 
+def _property_setter(prop_name: str):
+    """Build the set_<prop_name> method, storing the value in extra."""
+    # Map Alias
+    key = 'color' if prop_name == 'background_color' else prop_name
+    is_spacing = key in ('padding', 'margin')
+    is_color = key in ('color', 'background_color', 'border_color')
+
+    def setter(self, *args):
+        # Determine value
+        if len(args) == 1:
+            val = args[0]
+        else:
+            val = args # tuple
+
+        # Normalize Spacing
+        if is_spacing:
+             val = self._normalize_spacing(val)
+
+        # Normalize Color
+        if is_color:
+             if isinstance(val, (tuple, list)):
+                 if len(val) == 3:
+                     val = (val[0], val[1], val[2], 255)
+                 elif len(val) == 4:
+                     val = tuple(val)
+             val = intern_tuple(val)
+
+        self.extra[key] = val
+        self._invalidate()
+        return self
+
+    setter.__name__ = setter.__qualname__ = f"set_{prop_name}"
+    return setter
+
+
+# Defined once on the class rather than built by __getattr__ on every call
+for _prop_name in BasePrimitive.ALLOWED_PROPERTIES:
+    setattr(BasePrimitive, f"set_{_prop_name}", _property_setter(_prop_name))
+del _prop_name
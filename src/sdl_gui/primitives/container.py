@@ -1,8 +1,10 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List
 
 from sdl_gui import context
 from sdl_gui.primitives.base import BasePrimitive
 
+_BASE_TO_DATA = BasePrimitive.to_data
+
 
 class Container(BasePrimitive):
     """
@@ -11,6 +13,9 @@ class Container(BasePrimitive):
     created within its context.
     """
 
+    # Primitive children registered with at the last serialization
+    __slots__ = ("_linked_children",)
+
     def __enter__(self):
         context.push_parent(self)
         return self
@@ -26,5 +31,53 @@ class Container(BasePrimitive):
         """
         if hasattr(self, 'children') and isinstance(self.children, list):
             self.children.append(child)
+            self._invalidate()
+        else:
+            raise NotImplementedError(f"{type(self).__name__} does not support adding children or lacks a 'children' list.")
+
+    def extend_children(self, children: Iterable[Any]) -> None:
+        """
+        Add several children in one call.
+        Subclasses with per-insertion bookkeeping override this to do it
+        once for the whole batch.
+        """
+        if hasattr(self, 'children') and isinstance(self.children, list):
+            self.children.extend(children)
+            self._invalidate()
         else:
             raise NotImplementedError(f"{type(self).__name__} does not support adding children or lacks a 'children' list.")
+
+    def _serialize_children(self) -> List[Dict[str, Any]]:
+        """
+        Serialize the children, registering as their parent for invalidation.
+
+        Children removed or replaced since the previous call are unlinked,
+        so they no longer invalidate this container.
+        """
+        data = []
+        append = data.append
+        linked = []
+        for child in self.children:
+            if isinstance(child, BasePrimitive):
+                linked.append(child)
+                # Usually already linked to this one parent, with its data
+                # cached: check both inline rather than with two calls
+                parents = child._parents
+                if not parents or parents[0] is not self:
+                    child._add_parent(self)
+                if type(child).to_data is not _BASE_TO_DATA:
+                    # The override may change the data: it has to run
+                    append(child.to_data())
+                    continue
+                child_data = child._cached_data
+                append(child_data if child_data is not None else child._get_data())
+            else:
+                append(child.to_data())
+        previous = getattr(self, "_linked_children", ())
+        if previous:
+            current = {id(child) for child in linked}
+            for child in previous:
+                if id(child) not in current:
+                    child._remove_parent(self)
+        self._linked_children = linked
+        return data
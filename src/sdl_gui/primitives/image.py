@@ -7,6 +7,10 @@ from sdl_gui.primitives.base import BasePrimitive
 class Image(BasePrimitive):
     """An image primitive."""
 
+    __slots__ = ("source", "radius", "scale_mode")
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_IMAGE}
+
     def __init__(self,
                  source: Union[str, bytes, Callable],
                  x: Union[int, str],
@@ -24,10 +28,9 @@ class Image(BasePrimitive):
         self.radius = radius
         self.scale_mode = scale_mode
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data for this image."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_IMAGE
+        data = super()._build_data()
         data[core.KEY_SOURCE] = self.source
         if self.radius > 0:
             data[core.KEY_RADIUS] = self.radius
@@ -1,3 +1,5 @@
+import functools
+from bisect import bisect_right
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import sdl2
@@ -6,9 +8,46 @@ from sdl_gui import core
 from sdl_gui.primitives.base import BasePrimitive
 
 
+@functools.lru_cache(maxsize=8)
+def _line_starts(text: str) -> Tuple[int, ...]:
+    """
+    Offsets at which the lines of text start.
+
+    Cursor moves and drags convert positions many times per text, so the
+    last few texts are memoized.
+    """
+    starts = [0]
+    newline = text.find('\n')
+    while newline != -1:
+        starts.append(newline + 1)
+        newline = text.find('\n', newline + 1)
+    return tuple(starts)
+
+
+def _line_end(text: str, starts: Tuple[int, ...], line_idx: int) -> int:
+    """Offset just past the last character of a line, its newline excluded."""
+    return starts[line_idx + 1] - 1 if line_idx + 1 < len(starts) else len(text)
+
+
 class Input(BasePrimitive):
     """A text input primitive."""
 
+    __slots__ = ("text", "placeholder", "font", "size", "color", "background_color",
+                 "border_color", "border_width", "radius", "max_length", "multiline",
+                 "cursor_pos", "selection_start", "focused", "scroll_x", "scroll_y",
+                 "dragging", "last_click_time", "click_count", "last_mouse_x",
+                 "last_mouse_y", "cursor_visible", "history", "redo_stack",
+                 "on_change", "on_submit")
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_INPUT}
+
+    # Interaction and editing state that is not drawn
+    _UNRENDERED_FIELDS = frozenset((
+        "max_length", "dragging", "last_click_time", "click_count",
+        "last_mouse_x", "last_mouse_y", "history", "redo_stack",
+        "on_change", "on_submit",
+    ))
+
     def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
                  text: str = "",
                  placeholder: str = "",
@@ -49,7 +88,7 @@ class Input(BasePrimitive):
 
         # Internal State
         self.cursor_pos = len(text)
-        self.selection_start = None
+        self.selection_start: Optional[int] = None
         self.focused = False
         self.scroll_x = 0
         self.scroll_y = 0
@@ -68,13 +107,12 @@ class Input(BasePrimitive):
         self.redo_stack = []
 
         # Callbacks
-        self.on_change: Callable[[str], None] = None
-        self.on_submit: Callable[[str], None] = None
+        self.on_change: Optional[Callable[[str], None]] = None
+        self.on_submit: Optional[Callable[[str], None]] = None
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data for this input."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_INPUT
+        data = super()._build_data()
         data[core.KEY_TEXT] = self.text
         if self.placeholder:
             data["placeholder"] = self.placeholder
@@ -119,283 +157,295 @@ class Input(BasePrimitive):
         Handle events dispatched to this component.
         Context usually contains helpers like 'measure_text_width'.
         """
-        evt_type = event.get("type")
+        # Motion and tick events arrive every frame: look the handler up
+        # rather than testing each event type in turn
+        name = self._DISPATCH.get(event.get("type"))
+        if name is not None:
+            getattr(self, name)(event, context)
 
-        if evt_type == core.EVENT_FOCUS:
-            self.focused = True
-        elif evt_type == core.EVENT_BLUR:
-            self.focused = False
-            self.selection_start = None
-            self.dragging = False
+    def _on_focus(self, event: Dict[str, Any], context: Any) -> None:
+        self.focused = True
+
+    def _on_blur(self, event: Dict[str, Any], context: Any) -> None:
+        self.focused = False
+        self.selection_start = None
+        self.dragging = False
 
-        elif evt_type == core.EVENT_TEXT_INPUT and self.focused:
+    def _on_text_input(self, event: Dict[str, Any], context: Any) -> None:
+        if self.focused:
             text = event.get("text", "")
             self._insert_text(text, context)
 
-        elif evt_type == core.EVENT_KEY_DOWN and self.focused:
+    def _on_key_down(self, event: Dict[str, Any], context: Any) -> None:
+        if self.focused:
             key_sym = event.get("key_sym")
             mod = event.get("mod", 0)
             self._handle_key(key_sym, mod, context)
 
-        elif evt_type == core.EVENT_CLICK:
-             if context and "local_x" in event:
-                 local_x = event.get("local_x", 0)
-                 local_y = event.get("local_y", 0)
-
-                 # Double/Triple Click Logic
-                 now = sdl2.SDL_GetTicks()
-                 if self.click_count > 0 and now - self.last_click_time < 500:
-                     self.click_count += 1
-                 else:
-                     self.click_count = 1
-                 self.last_click_time = now
-
-                 self.focused = True
-                 self.dragging = True
-                 self.last_mouse_x = local_x
-                 self.last_mouse_y = local_y
-
-                 if self.click_count == 2:
-                     # Double click: Select Word
-                     self._set_cursor_from_mouse(local_x, local_y, context)
-                     self._select_word_at_cursor()
-                     # Double click selects word, subsequent drag extends char by char or word by word.
-                     # Drag selection is the standard behavior.
-                     self.dragging = False # Stop dragging on double click to avoid immediate override?
-                 elif self.click_count == 3:
-                     # Triple click: Select All
-                     self.selection_start = 0
-                     self.cursor_pos = len(self.text)
-                     self.dragging = False
-                 else:
-                     # Single click
-                     shift = (sdl2.SDL_GetModState() & sdl2.KMOD_SHIFT)
-                     if shift:
-                         if self.selection_start is None: self.selection_start = self.cursor_pos
-                     else:
-                         self.selection_start = self.cursor_pos # Start selection anchor
-
-                     self._set_cursor_from_mouse(local_x, local_y, context)
-                     if not shift:
-                         self.selection_start = self.cursor_pos # If not shift, anchor = cursor
-
-        elif evt_type == core.EVENT_MOUSE_UP:
-            self.dragging = False
-
-        elif evt_type == core.EVENT_MOUSE_MOTION:
-            if self.dragging and context and "local_x" in event:
-                 local_x = event.get("local_x", 0)
-                 local_y = event.get("local_y", 0)
-                 self.last_mouse_x = local_x
-                 self.last_mouse_y = local_y
-
-                 # Update selection
-                 # We keep selection_start (anchor) fixed, move cursor_pos.
-                 self._set_cursor_from_mouse(local_x, local_y, context)
-                 # Ensure selection_start was set on click (it was).
-
-        elif evt_type == core.EVENT_TICK:
-            # Blink Logic
-            ticks = event.get("ticks", sdl2.SDL_GetTicks())
-            self.cursor_visible = (ticks // 500) % 2 == 0
-
-            if self.dragging and self.focused and context:
-                 # Autoscroll
-                 scroll_speed = 5
-                 changed = False
-
-                 # Horizontal
-                 if not self.multiline:
-                     if self.last_mouse_x < 0:
-                         self.scroll_x -= scroll_speed
-                         changed = True
-                     elif self.last_mouse_x > self.width: # approx width
-                         self.scroll_x += scroll_speed
-                         changed = True
-                     if self.scroll_x < 0: self.scroll_x = 0
-
-                 # Vertical
-                 if self.multiline:
-                     if self.last_mouse_y < 0:
-                         self.scroll_y -= scroll_speed
-                         changed = True
-                     elif self.last_mouse_y > self.height:
-                         self.scroll_y += scroll_speed
-                         changed = True
-                     if self.scroll_y < 0: self.scroll_y = 0
-
-                 if changed:
-                     # Re-eval cursor pos based on new scroll
-                     self._set_cursor_from_mouse(self.last_mouse_x, self.last_mouse_y, context)
-
-    def _insert_text(self, text, context=None):
-        if self.max_length and len(self.text) + len(text) > self.max_length:
-             # Truncate
-             allowed = self.max_length - len(self.text)
-             if allowed <= 0: return
-             text = text[:allowed]
+    def _on_click(self, event: Dict[str, Any], context: Any) -> None:
+        if not (context and "local_x" in event):
+            return
+        local_x = event.get("local_x", 0)
+        local_y = event.get("local_y", 0)
 
-        # Delete selection first if any
-        if self.selection_start is not None:
-             self._delete_selection()
+        # Double/Triple Click Logic
+        now = sdl2.SDL_GetTicks()
+        if self.click_count > 0 and now - self.last_click_time < 500:
+            self.click_count += 1
+        else:
+            self.click_count = 1
+        self.last_click_time = now
+
+        self.focused = True
+        self.dragging = True
+        self.last_mouse_x = local_x
+        self.last_mouse_y = local_y
+
+        if self.click_count == 2:
+            # Double click: Select Word
+            self._set_cursor_from_mouse(local_x, local_y, context)
+            self._select_word_at_cursor()
+            # Double click selects word, subsequent drag extends char by char or word by word.
+            # Drag selection is the standard behavior.
+            self.dragging = False # Stop dragging on double click to avoid immediate override?
+        elif self.click_count == 3:
+            # Triple click: Select All
+            self.selection_start = 0
+            self.cursor_pos = len(self.text)
+            self.dragging = False
+        else:
+            # Single click
+            shift = (sdl2.SDL_GetModState() & sdl2.KMOD_SHIFT)
+            if shift:
+                if self.selection_start is None: self.selection_start = self.cursor_pos
+            else:
+                self.selection_start = self.cursor_pos # Start selection anchor
 
-        self.text = self.text[:self.cursor_pos] + text + self.text[self.cursor_pos:]
-        self.cursor_pos += len(text)
+            self._set_cursor_from_mouse(local_x, local_y, context)
+            if not shift:
+                self.selection_start = self.cursor_pos # If not shift, anchor = cursor
 
-        if context: self._update_scroll(context)
-        if self.on_change: self.on_change(self.text)
+    def _on_mouse_up(self, event: Dict[str, Any], context: Any) -> None:
+        self.dragging = False
 
-    def _delete_selection(self):
-        if self.selection_start is None: return
+    def _on_mouse_motion(self, event: Dict[str, Any], context: Any) -> None:
+        if self.dragging and context and "local_x" in event:
+            local_x = event.get("local_x", 0)
+            local_y = event.get("local_y", 0)
+            self.last_mouse_x = local_x
+            self.last_mouse_y = local_y
+
+            # Update selection
+            # We keep selection_start (anchor) fixed, move cursor_pos.
+            self._set_cursor_from_mouse(local_x, local_y, context)
+            # Ensure selection_start was set on click (it was).
+
+    def _on_tick(self, event: Dict[str, Any], context: Any) -> None:
+        # Blink Logic
+        ticks = event.get("ticks", sdl2.SDL_GetTicks())
+        # Assigned only on a change, as it rebuilds the data
+        cursor_visible = (ticks // 500) % 2 == 0
+        if cursor_visible != self.cursor_visible:
+            self.cursor_visible = cursor_visible
+
+        if self.dragging and self.focused and context:
+            # Autoscroll
+            scroll_speed = 5
+            changed = False
+
+            # Horizontal
+            if not self.multiline:
+                if self.last_mouse_x < 0:
+                    self.scroll_x -= scroll_speed
+                    changed = True
+                # Percentage sizes are not known here: no autoscroll past them
+                elif isinstance(self.width, int) and self.last_mouse_x > self.width:
+                    self.scroll_x += scroll_speed
+                    changed = True
+                if self.scroll_x < 0: self.scroll_x = 0
+
+            # Vertical
+            if self.multiline:
+                if self.last_mouse_y < 0:
+                    self.scroll_y -= scroll_speed
+                    changed = True
+                elif isinstance(self.height, int) and self.last_mouse_y > self.height:
+                    self.scroll_y += scroll_speed
+                    changed = True
+                if self.scroll_y < 0: self.scroll_y = 0
+
+            if changed:
+                # Re-eval cursor pos based on new scroll
+                self._set_cursor_from_mouse(self.last_mouse_x, self.last_mouse_y, context)
+
+    # Event handler names by type, looked up on the instance so that a
+    # subclass overriding a handler is called
+    _DISPATCH = {
+        core.EVENT_FOCUS: "_on_focus",
+        core.EVENT_BLUR: "_on_blur",
+        core.EVENT_TEXT_INPUT: "_on_text_input",
+        core.EVENT_KEY_DOWN: "_on_key_down",
+        core.EVENT_CLICK: "_on_click",
+        core.EVENT_MOUSE_UP: "_on_mouse_up",
+        core.EVENT_MOUSE_MOTION: "_on_mouse_motion",
+        core.EVENT_TICK: "_on_tick",
+    }
+
+    def _handle_key(self, key_sym: Optional[int], mod: int, context: Any) -> None:
+        ctrl = (mod & sdl2.KMOD_CTRL)
+        shift = (mod & sdl2.KMOD_SHIFT)
 
-        start = min(self.cursor_pos, self.selection_start)
-        end = max(self.cursor_pos, self.selection_start)
+        # Keys acting with any modifiers first, then the Ctrl shortcuts
+        handler = self._KEY_HANDLERS.get(key_sym)
+        if handler is None and ctrl:
+            handler = self._CTRL_KEY_HANDLERS.get(key_sym)
+        if handler is not None:
+            handler(self, ctrl, shift, context)
+
+    def _anchor_selection(self, shift: int) -> None:
+        """Before a cursor move: Shift extends the selection, no Shift clears it."""
+        if shift:
+            if self.selection_start is None: self.selection_start = self.cursor_pos
+        else:
+            self.selection_start = None
 
-        self.text = self.text[:start] + self.text[end:]
-        self.cursor_pos = start
-        self.selection_start = None
+    def _text_deleted(self, context: Any) -> None:
+        """After a deletion: scroll to the cursor and report the new text."""
+        if context: self._update_scroll(context)
         if self.on_change: self.on_change(self.text)
 
-    def _handle_key(self, key_sym, mod, context):
-        ctrl = (mod & sdl2.KMOD_CTRL)
-        shift = (mod & sdl2.KMOD_SHIFT)
+    def _key_backspace(self, ctrl: int, shift: int, context: Any) -> None:
+        if self.selection_start is not None:
+            self._delete_selection()
+        elif ctrl:
+            # Delete Word Left
+            target = self._find_prev_word_start(self.cursor_pos)
+            self._splice(target, self.cursor_pos)
+            self.cursor_pos = target
+            self._text_deleted(context)
+        elif self.cursor_pos > 0:
+            self._splice(self.cursor_pos - 1, self.cursor_pos)
+            self.cursor_pos -= 1
+            self._text_deleted(context)
+
+    def _key_delete(self, ctrl: int, shift: int, context: Any) -> None:
+        if self.selection_start is not None:
+            self._delete_selection()
+        elif self.cursor_pos < len(self.text):
+            self._splice(self.cursor_pos, self.cursor_pos + 1)
+            self._text_deleted(context)
+
+    def _key_left(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        if ctrl:
+            self.cursor_pos = self._find_prev_word_start(self.cursor_pos)
+            if context: self._update_scroll(context)
+        elif self.cursor_pos > 0:
+            self.cursor_pos -= 1
+            if context: self._update_scroll(context)
 
-        if key_sym == sdl2.SDLK_BACKSPACE:
-            if self.selection_start is not None:
-                self._delete_selection()
-            elif ctrl:
-                 # Delete Word Left
-                 target = self._find_prev_word_start(self.cursor_pos)
-                 self.text = self.text[:target] + self.text[self.cursor_pos:]
-                 self.cursor_pos = target
-                 if context: self._update_scroll(context)
-                 if self.on_change: self.on_change(self.text)
-            elif self.cursor_pos > 0:
-                self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
-                self.cursor_pos -= 1
-                if context: self._update_scroll(context)
-                if self.on_change: self.on_change(self.text)
+    def _key_right(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        if ctrl:
+            self.cursor_pos = self._find_next_word_start(self.cursor_pos)
+            if context: self._update_scroll(context)
+        elif self.cursor_pos < len(self.text):
+            self.cursor_pos += 1
+            if context: self._update_scroll(context)
 
-        elif key_sym == sdl2.SDLK_DELETE:
-            if self.selection_start is not None:
-                self._delete_selection()
-            elif self.cursor_pos < len(self.text):
-                self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
+    def _key_up(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        if self.multiline:
+            line, col = self._get_line_col(self.text, self.cursor_pos)
+            if line > 0:
+                self.cursor_pos = self._get_cursor_from_line_col(self.text, line - 1, col)
                 if context: self._update_scroll(context)
-                if self.on_change: self.on_change(self.text)
 
-        elif key_sym == sdl2.SDLK_LEFT:
-            if shift:
-                if self.selection_start is None: self.selection_start = self.cursor_pos
-            else:
-                self.selection_start = None
-
-            if ctrl:
-                self.cursor_pos = self._find_prev_word_start(self.cursor_pos)
-                if context: self._update_scroll(context)
-            elif self.cursor_pos > 0:
-                self.cursor_pos -= 1
+    def _key_down(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        if self.multiline:
+            line, col = self._get_line_col(self.text, self.cursor_pos)
+            total_lines = len(_line_starts(self.text))
+            if line < total_lines - 1:
+                self.cursor_pos = self._get_cursor_from_line_col(self.text, line + 1, col)
                 if context: self._update_scroll(context)
-            elif not shift and self.selection_start is None:
-                pass
 
-        elif key_sym == sdl2.SDLK_RIGHT:
-            if shift:
-                 if self.selection_start is None: self.selection_start = self.cursor_pos
-            else:
-                 self.selection_start = None
+    def _key_home(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        self.cursor_pos = 0
+        if context: self._update_scroll(context)
 
-            if ctrl:
-                self.cursor_pos = self._find_next_word_start(self.cursor_pos)
-                if context: self._update_scroll(context)
-            elif self.cursor_pos < len(self.text):
-                self.cursor_pos += 1
-                if context: self._update_scroll(context)
+    def _key_end(self, ctrl: int, shift: int, context: Any) -> None:
+        self._anchor_selection(shift)
+        self.cursor_pos = len(self.text)
+        if context: self._update_scroll(context)
 
-        elif key_sym == sdl2.SDLK_UP:
-            if shift:
-                if self.selection_start is None: self.selection_start = self.cursor_pos
-            else:
-                self.selection_start = None
+    def _key_return(self, ctrl: int, shift: int, context: Any) -> None:
+        if self.multiline:
+            self._snapshot_history()
+            self._insert_text("\n", context, snapshot=False) # already snapshotted
+        elif self.on_submit:
+            self.on_submit(self.text)
 
-            if self.multiline:
-                line, col = self._get_line_col(self.text, self.cursor_pos)
-                if line > 0:
-                    self.cursor_pos = self._get_cursor_from_line_col(self.text, line - 1, col)
-                    if context: self._update_scroll(context)
+    def _key_select_all(self, ctrl: int, shift: int, context: Any) -> None:
+        self.selection_start = 0
+        self.cursor_pos = len(self.text)
 
-        elif key_sym == sdl2.SDLK_DOWN:
-             if shift:
-                if self.selection_start is None: self.selection_start = self.cursor_pos
-             else:
-                self.selection_start = None
+    def _key_copy(self, ctrl: int, shift: int, context: Any) -> None:
+        if self.selection_start is not None:
+            start = min(self.cursor_pos, self.selection_start)
+            end = max(self.cursor_pos, self.selection_start)
+            clipboard_text = self.text[start:end]
+            sdl2.SDL_SetClipboardText(clipboard_text.encode('utf-8'))
 
-             if self.multiline:
-                line, col = self._get_line_col(self.text, self.cursor_pos)
-                total_lines = self.text.count('\n') + 1
-                if line < total_lines - 1:
-                    self.cursor_pos = self._get_cursor_from_line_col(self.text, line + 1, col)
-                    if context: self._update_scroll(context)
+    def _key_paste(self, ctrl: int, shift: int, context: Any) -> None:
+        if sdl2.SDL_HasClipboardText():
+            text = sdl2.SDL_GetClipboardText().decode('utf-8')
+            if text: self._insert_text(text, context)
 
-        elif key_sym == sdl2.SDLK_HOME:
-            if shift:
-                if self.selection_start is None: self.selection_start = self.cursor_pos
-            else:
-                self.selection_start = None
-            self.cursor_pos = 0
+    def _key_cut(self, ctrl: int, shift: int, context: Any) -> None:
+        if self.selection_start is not None:
+            self._snapshot_history()
+            start = min(self.cursor_pos, self.selection_start)
+            end = max(self.cursor_pos, self.selection_start)
+            clipboard_text = self.text[start:end]
+            sdl2.SDL_SetClipboardText(clipboard_text.encode('utf-8'))
+            self._delete_selection()
             if context: self._update_scroll(context)
 
-        elif key_sym == sdl2.SDLK_END:
-             if shift:
-                 if self.selection_start is None: self.selection_start = self.cursor_pos
-             else:
-                 self.selection_start = None
-             self.cursor_pos = len(self.text)
-             if context: self._update_scroll(context)
-
-        elif key_sym == sdl2.SDLK_a and ctrl:
-            self.selection_start = 0
-            self.cursor_pos = len(self.text)
-
-        elif key_sym == sdl2.SDLK_c and ctrl:
-            if self.selection_start is not None:
-                start = min(self.cursor_pos, self.selection_start)
-                end = max(self.cursor_pos, self.selection_start)
-                clipboard_text = self.text[start:end]
-                sdl2.SDL_SetClipboardText(clipboard_text.encode('utf-8'))
-
-        elif key_sym == sdl2.SDLK_v and ctrl:
-             if  sdl2.SDL_HasClipboardText():
-                 text = sdl2.SDL_GetClipboardText().decode('utf-8')
-                 if text: self._insert_text(text, context)
-
-        elif key_sym == sdl2.SDLK_x and ctrl:
-            if self.selection_start is not None:
-                self._snapshot_history()
-                start = min(self.cursor_pos, self.selection_start)
-                end = max(self.cursor_pos, self.selection_start)
-                clipboard_text = self.text[start:end]
-                sdl2.SDL_SetClipboardText(clipboard_text.encode('utf-8'))
-                self._delete_selection()
-                if context: self._update_scroll(context)
-
-        elif key_sym == sdl2.SDLK_z and ctrl:
-            if shift: # Redo
-                self._redo()
-            else: # Undo
-                self._undo()
-            if context: self._update_scroll(context)
+    def _key_undo(self, ctrl: int, shift: int, context: Any) -> None:
+        if shift: # Redo
+            self._redo()
+        else: # Undo
+            self._undo()
+        if context: self._update_scroll(context)
 
-        elif key_sym == sdl2.SDLK_y and ctrl:
-             self._redo()
-             if context: self._update_scroll(context)
+    def _key_redo(self, ctrl: int, shift: int, context: Any) -> None:
+        self._redo()
+        if context: self._update_scroll(context)
 
-        elif key_sym == sdl2.SDLK_RETURN or key_sym == sdl2.SDLK_KP_ENTER:
-            if self.multiline:
-                self._snapshot_history()
-                self._insert_text("\n", context, snapshot=False) # already snapshotted
-            elif self.on_submit:
-                self.on_submit(self.text)
+    # Key handlers by key symbol, called with the Ctrl and Shift states
+    _KEY_HANDLERS = {
+        sdl2.SDLK_BACKSPACE: _key_backspace,
+        sdl2.SDLK_DELETE: _key_delete,
+        sdl2.SDLK_LEFT: _key_left,
+        sdl2.SDLK_RIGHT: _key_right,
+        sdl2.SDLK_UP: _key_up,
+        sdl2.SDLK_DOWN: _key_down,
+        sdl2.SDLK_HOME: _key_home,
+        sdl2.SDLK_END: _key_end,
+        sdl2.SDLK_RETURN: _key_return,
+        sdl2.SDLK_KP_ENTER: _key_return,
+    }
+    # Shortcuts only acting with Ctrl held
+    _CTRL_KEY_HANDLERS = {
+        sdl2.SDLK_a: _key_select_all,
+        sdl2.SDLK_c: _key_copy,
+        sdl2.SDLK_v: _key_paste,
+        sdl2.SDLK_x: _key_cut,
+        sdl2.SDLK_z: _key_undo,
+        sdl2.SDLK_y: _key_redo,
+    }
 
     def _snapshot_history(self):
         # Limit history size?
@@ -434,7 +484,7 @@ class Input(BasePrimitive):
         if self.selection_start is not None:
              self._delete_selection(snapshot=False)
 
-        self.text = self.text[:self.cursor_pos] + text + self.text[self.cursor_pos:]
+        self._splice(self.cursor_pos, self.cursor_pos, text)
         self.cursor_pos += len(text)
 
         if context: self._update_scroll(context)
@@ -447,11 +497,16 @@ class Input(BasePrimitive):
         start = min(self.cursor_pos, self.selection_start)
         end = max(self.cursor_pos, self.selection_start)
 
-        self.text = self.text[:start] + self.text[end:]
+        self._splice(start, end)
         self.cursor_pos = start
         self.selection_start = None
         if self.on_change: self.on_change(self.text)
 
+    def _splice(self, start: int, end: int, insert: str = "") -> None:
+        """Replace text[start:end] with insert, copying the text once rather than once per concatenation."""
+        text = self.text
+        self.text = "".join((text[:start], insert, text[end:]))
+
     def _select_word_at_cursor(self):
         # Find start
         # Scan back from cursor_pos.
@@ -548,30 +603,19 @@ class Input(BasePrimitive):
             if self.scroll_y < 0: self.scroll_y = 0
 
     def _get_line_col(self, text, cursor_pos):
-        # Determine line and col of cursor
-        lines = text.split('\n')
-        curr = 0
-        for i, line in enumerate(lines):
-            line_len = len(line) + 1 # +1 for newline
-            if curr + line_len > cursor_pos: # Cursor in this line (or before newline)
-                return i, cursor_pos - curr
-            elif curr + line_len == cursor_pos and i == len(lines) - 1:
-                # End of last line
-                return i, len(line)
-            curr += line_len
-        return len(lines)-1, len(lines[-1])
+        # Determine line and col of cursor: the last line starting at or
+        # before it (a cursor before a newline is in that newline's line)
+        starts = _line_starts(text)
+        line = max(0, bisect_right(starts, cursor_pos) - 1)
+        # Past the end of the text: end of last line
+        return line, min(cursor_pos - starts[line], _line_end(text, starts, line) - starts[line])
 
     def _get_cursor_from_line_col(self, text, line_idx, col_idx):
-        lines = text.split('\n')
-        clamp_line = max(0, min(line_idx, len(lines)-1))
-        target_line = lines[clamp_line]
-        clamp_col = max(0, min(col_idx, len(target_line)))
-
-        # Calculate pos
-        curr = 0
-        for i in range(clamp_line):
-             curr += len(lines[i]) + 1
-        return curr + clamp_col
+        starts = _line_starts(text)
+        clamp_line = max(0, min(line_idx, len(starts)-1))
+        line_len = _line_end(text, starts, clamp_line) - starts[clamp_line]
+        clamp_col = max(0, min(col_idx, line_len))
+        return starts[clamp_line] + clamp_col
 
     def _set_cursor_from_mouse(self, local_x: int, local_y: int, context):
         if not hasattr(context, 'measure_text_width'): return
@@ -590,32 +634,33 @@ class Input(BasePrimitive):
             if rel_y < 0: rel_y = 0
             target_line_idx = int(rel_y // line_height)
 
-        lines = self.text.split('\n')
+        starts = _line_starts(self.text)
         # Clamp line index
-        if target_line_idx >= len(lines):
-            target_line_idx = len(lines) - 1
+        if target_line_idx >= len(starts):
+            target_line_idx = len(starts) - 1
         if target_line_idx < 0: target_line_idx = 0
 
-        target_line = lines[target_line_idx]
+        target_line = self.text[starts[target_line_idx]:_line_end(self.text, starts, target_line_idx)]
 
-        # Scan char in this line
-        best_col = 0
-        min_diff = float('inf')
+        # Prefix widths grow with the column: binary search the first
+        # column reaching effective_x, measuring O(log n) prefixes instead
+        # of every prefix up to the cursor
+        def prefix_width(col):
+            return context.measure_text_width(target_line[:col], self.font, self.size)
 
-        for i in range(len(target_line) + 1):
-            sub = target_line[:i]
-            w = context.measure_text_width(sub, self.font, self.size)
-            diff = abs(w - effective_x)
-            if diff < min_diff:
-                min_diff = diff
-                best_col = i
+        lo, hi = 0, len(target_line)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if prefix_width(mid) < effective_x:
+                lo = mid + 1
             else:
-                break
+                hi = mid
+        best_col = lo
+        # The column before is closer (or as close) when x is nearer its edge
+        if lo > 0 and effective_x - prefix_width(lo - 1) <= prefix_width(lo) - effective_x:
+            best_col = lo - 1
 
         # Convert line/col to absolute cursor pos
-        # Count chars before this line
-        abs_pos = 0
-        for i in range(target_line_idx):
-            abs_pos += len(lines[i]) + 1 # +1 for newline
+        abs_pos = starts[target_line_idx]
 
         self.cursor_pos = abs_pos + best_col
@@ -0,0 +1,60 @@
+import struct
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from sdl_gui import core
+from sdl_gui.primitives.base import BasePrimitive
+
+
+class RectBatch(BasePrimitive):
+    """
+    Many solid rectangles packed into a single display list item.
+
+    Each rectangle is a fixed-size record (x, y, w, h, r, g, b, a) in one
+    bytearray, positioned relative to the batch origin, instead of a dict
+    per rectangle. Records have no radius, border or id: the batch is laid
+    out, culled and hit-tested as one item.
+    """
+
+    __slots__ = ("records",)
+
+    RECORD = struct.Struct(core.RECT_RECORD_FORMAT)
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_RECT_BATCH}
+
+    def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
+                 id: str = None,
+                 listen_events: List[str] = None):
+        super().__init__(x, y, width, height, id=id, listen_events=listen_events)
+        self.records = bytearray()
+
+    def add_rect(self, x: int, y: int, width: int, height: int,
+                 color: Tuple[int, int, int, int]) -> None:
+        """Append a rectangle record, drawn above the previous ones."""
+        self.add_rects(((x, y, width, height, color),))
+
+    def add_rects(self, rects: Iterable[Tuple[int, int, int, int, Tuple[int, ...]]]) -> None:
+        """
+        Append (x, y, width, height, color) rectangles, in drawing order.
+
+        The records are packed and appended at once, and the data
+        invalidated once, rather than per rectangle.
+        """
+        pack = self.RECORD.pack
+        packed = []
+        for x, y, width, height, color in rects:
+            r, g, b = color[:3]
+            a = color[3] if len(color) > 3 else 255
+            packed.append(pack(x, y, width, height, r, g, b, a))
+        if packed:
+            self.records += b"".join(packed)
+            self._invalidate()
+
+    def __len__(self) -> int:
+        """Return the number of rectangles."""
+        return len(self.records) // self.RECORD.size
+
+    def _build_data(self) -> Dict[str, Any]:
+        """Generate the display list data for this batch."""
+        data = super()._build_data()
+        data[core.KEY_RECORDS] = bytes(self.records)
+        return data
@@ -2,11 +2,15 @@ from typing import Any, Dict, List, Tuple, Union
 
 from sdl_gui import core
 from sdl_gui.primitives.base import BasePrimitive
+from sdl_gui.utils import intern_tuple
 
 
 class Rectangle(BasePrimitive):
     """A basic rectangle primitive."""
 
+    __slots__ = ("color", "radius", "border_color", "border_width")
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_RECT}
 
     def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
                  color: Tuple[int, int, int, int],
@@ -18,15 +22,14 @@ class Rectangle(BasePrimitive):
                  id: str = None,
                  listen_events: List[str] = None):
         super().__init__(x, y, width, height, padding, margin, id, listen_events)
-        self.color = color
+        self.color = intern_tuple(color)
         self.radius = radius
-        self.border_color = border_color
+        self.border_color = intern_tuple(border_color)
         self.border_width = border_width
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data for this rectangle."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_RECT
+        data = super()._build_data()
         data["color"] = self.color
         if self.radius > 0:
             data[core.KEY_RADIUS] = self.radius
@@ -1,14 +1,26 @@
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from sdl_gui import core
 from sdl_gui.primitives.base import BasePrimitive
+from sdl_gui.utils import intern_tuple
 
 
 class ResponsiveText(BasePrimitive):
-    """A responsive text primitive."""
+    """
+    A responsive text primitive.
+
+    Styled text is given either as markup in text, or as runs: a sequence of
+    (style, text) pairs such as [("bold", title)] that the renderer uses
+    as-is, without parsing. Runs take precedence over text.
+    """
+
+    __slots__ = ("text", "font", "size", "color", "align", "wrap", "ellipsis",
+                 "markup", "runs")
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_TEXT}
 
     def __init__(self, x: Union[int, str], y: Union[int, str], width: Union[int, str], height: Union[int, str],
-                 text: str,
+                 text: str = "",
                  font: str = None,
                  size: Union[int, str] = 16,
                  color: Tuple[int, int, int, int] = (0, 0, 0, 255),
@@ -19,22 +31,27 @@ class ResponsiveText(BasePrimitive):
                  padding: Tuple[int, int, int, int] = (0, 0, 0, 0),
                  margin: Tuple[int, int, int, int] = (0, 0, 0, 0),
                  id: str = None,
-                 listen_events: List[str] = None):
+                 listen_events: List[str] = None,
+                 runs: Optional[Sequence[Tuple[str, str]]] = None):
         super().__init__(x, y, width, height, padding, margin, id, listen_events)
         self.text = text
         self.font = font
         self.size = size
-        self.color = color
+        self.color = intern_tuple(color)
         self.align = align
         self.wrap = wrap
         self.ellipsis = ellipsis
         self.markup = markup
+        self.runs = tuple(tuple(run) for run in runs) if runs else None
 
-    def to_data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """Generate the display list data for this text."""
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_TEXT
-        data[core.KEY_TEXT] = self.text
+        data = super()._build_data()
+        if self.runs:
+            data[core.KEY_TEXT] = "".join(text for _, text in self.runs)
+            data[core.KEY_RUNS] = self.runs
+        else:
+            data[core.KEY_TEXT] = self.text
         if self.font:
             data[core.KEY_FONT] = self.font
         if self.size != 16:
@@ -47,6 +64,6 @@ class ResponsiveText(BasePrimitive):
             data[core.KEY_WRAP] = self.wrap
         if not self.ellipsis:
             data[core.KEY_ELLIPSIS] = self.ellipsis
-        if not self.markup: # Default is True now
+        if not self.markup and not self.runs: # Default is True now
             data[core.KEY_MARKUP] = self.markup
         return data
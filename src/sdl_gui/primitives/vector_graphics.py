@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, Union, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from sdl_gui import core
 from sdl_gui.primitives.base import BasePrimitive
 
@@ -8,6 +8,8 @@ class VectorGraphics(BasePrimitive):
     Uses a command list to record drawing operations which are then executed by the renderer.
     Supports caching via a unique cache_key to avoid re-drawing static content.
     """
+
+    _DATA_TEMPLATE = {core.KEY_TYPE: core.TYPE_VECTOR_GRAPHICS}
     
     def __init__(self, x: Union[int, str], y: Union[int, str], 
                  width: Union[int, str], height: Union[int, str],
@@ -24,6 +26,7 @@ class VectorGraphics(BasePrimitive):
     def set_cache_key(self, key: str):
         """Set a custom cache key. If set, renderer uses this to cache the texture."""
         self._custom_cache_key = key
+        self._invalidate()
         return self
         
     def clear(self):
@@ -31,16 +34,33 @@ class VectorGraphics(BasePrimitive):
         self.commands = []
         self.commands.append({core.CMD_TYPE: core.CMD_CLEAR})
         self._content_version += 1
+        self._invalidate()
         return self
 
     def move_to(self, x: Union[int, str], y: Union[int, str]):
         self.commands.append({core.CMD_TYPE: core.CMD_MOVE_TO, "x": x, "y": y})
         self._content_version += 1
+        self._invalidate()
         return self
 
     def line_to(self, x: Union[int, str], y: Union[int, str]):
         self.commands.append({core.CMD_TYPE: core.CMD_LINE_TO, "x": x, "y": y})
         self._content_version += 1
+        self._invalidate()
+        return self
+
+    def poly_line(self, xs: Sequence[Union[int, str]], ys: Sequence[Union[int, str]]):
+        """
+        Draw connected lines through the points (xs[i], ys[i]) from the current point.
+
+        Equivalent to a line_to() per point, recorded as a single command.
+        Array types with tolist() (e.g. numpy arrays) are converted once.
+        """
+        xs = xs.tolist() if hasattr(xs, "tolist") else list(xs)
+        ys = ys.tolist() if hasattr(ys, "tolist") else list(ys)
+        self.commands.append({core.CMD_TYPE: core.CMD_POLYLINE, "xs": xs, "ys": ys})
+        self._content_version += 1
+        self._invalidate()
         return self
 
     def curve_to(self, cx1: Union[int, str], cy1: Union[int, str], cx2: Union[int, str], cy2: Union[int, str], x: Union[int, str], y: Union[int, str]):
@@ -52,6 +72,7 @@ class VectorGraphics(BasePrimitive):
             "x": x, "y": y
         })
         self._content_version += 1
+        self._invalidate()
         return self
 
     def arc(self, x: Union[int, str], y: Union[int, str], r: Union[int, str], start: int, end: int):
@@ -61,11 +82,13 @@ class VectorGraphics(BasePrimitive):
             "start": start, "end": end
         })
         self._content_version += 1
+        self._invalidate()
         return self
         
     def circle(self, x: Union[int, str], y: Union[int, str], r: Union[int, str]):
         self.commands.append({core.CMD_TYPE: core.CMD_CIRCLE, "x": x, "y": y, "r": r})
         self._content_version += 1
+        self._invalidate()
         return self
 
     def pie(self, x: Union[int, str], y: Union[int, str], r: Union[int, str], start: int, end: int):
@@ -75,6 +98,7 @@ class VectorGraphics(BasePrimitive):
             "start": start, "end": end
         })
         self._content_version += 1
+        self._invalidate()
         return self
 
     def rect(self, x: Union[int, str], y: Union[int, str], w: Union[int, str], h: Union[int, str], r: Union[int, str] = 0):
@@ -83,6 +107,7 @@ class VectorGraphics(BasePrimitive):
             "x": x, "y": y, "w": w, "h": h, "r": r
         })
         self._content_version += 1
+        self._invalidate()
         return self
 
     def stroke(self, color: Tuple[int, int, int, int], width: int = 1):
@@ -95,6 +120,7 @@ class VectorGraphics(BasePrimitive):
             "width": width
         })
         self._content_version += 1
+        self._invalidate()
         return self
 
     def fill(self, color: Tuple[int, int, int, int]):
@@ -105,11 +131,11 @@ class VectorGraphics(BasePrimitive):
             "color": color
         })
         self._content_version += 1
+        self._invalidate()
         return self
 
-    def to_data(self) -> Dict[str, Any]:
-        data = super().to_data()
-        data[core.KEY_TYPE] = core.TYPE_VECTOR_GRAPHICS
+    def _build_data(self) -> Dict[str, Any]:
+        data = super()._build_data()
         data[core.KEY_COMMANDS] = self.commands
         
         # Use custom key if provided, otherwise generate one based on ID and version
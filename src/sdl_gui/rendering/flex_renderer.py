@@ -57,7 +57,7 @@ class FlexRenderer:
         self._render_flex_node_children(root_node, item, viewport)
 
     def _build_flex_tree(self, item: Dict[str, Any], parent_w: int, parent_h: int) -> FlexNode:
-        style = FlexStyle()
+        style = FlexStyle.default()
 
         # Map Flex Properties
         style.direction = FlexDirection(item.get(core.KEY_FLEX_DIRECTION, "row"))
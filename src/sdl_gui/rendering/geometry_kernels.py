@@ -0,0 +1,101 @@
+"""
+Compiled vertex kernels for batched geometry.
+
+The records of a RectBatch are read as a flat int32 buffer of five words
+per rectangle: x, y, w, h and the RGBA bytes. rect_vertices() turns the
+records that overlap a clip box into four vertices each, in the layout
+SDL_RenderGeometryRaw takes, so that a whole batch is one draw call
+whatever its colors. Numba and NumPy are optional, as for the spatial
+kernels: without them the kernel runs as plain Python over array.array
+buffers. It is then only faster than filling same-color runs for dense,
+many-colored batches, so callers should keep filling rects.
+"""
+
+from array import array
+from typing import Any, Callable, Tuple, TypeVar
+
+# A packed buffer: a NumPy array, or an array.array without NumPy
+Buffer = Any
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]:
+        """No-op stand-in for numba.njit."""
+        def decorator(func: _F) -> _F:
+            return func
+        return decorator
+
+# int32 words per record of core.RECT_RECORD_FORMAT
+RECORD_WORDS = 5
+
+
+def record_words(records: bytes) -> Buffer:
+    """View packed rect records as a flat int32 buffer."""
+    if np is not None:
+        return np.frombuffer(records, dtype=np.int32)
+    words = array("i")
+    words.frombytes(records)
+    return words
+
+
+def new_vertex_buffers(count: int) -> Tuple[Buffer, Buffer, Buffer]:
+    """
+    Allocate the xy, color and index buffers for count rectangles.
+
+    The indices never change: rectangle k is the triangles (0, 1, 2) and
+    (2, 1, 3) over its vertices 4k to 4k + 3.
+    """
+    if np is not None:
+        xy = np.empty(8 * count, dtype=np.float32)
+        colors = np.empty(4 * count, dtype=np.int32)
+        base = np.repeat(np.arange(count, dtype=np.int32) * 4, 6)
+        indices = base + np.tile(np.array([0, 1, 2, 2, 1, 3], dtype=np.int32), count)
+        return xy, colors, indices
+    indices = array("i", (4 * k + v for k in range(count) for v in (0, 1, 2, 2, 1, 3)))
+    return array("f", bytes(32 * count)), array("i", bytes(16 * count)), indices
+
+
+@njit(cache=True)
+def rect_vertices(words: Buffer, ox: float, oy: float,
+                  cx0: float, cy0: float, cx1: float, cy1: float,
+                  xy: Buffer, colors: Buffer) -> int:
+    """
+    Write the vertices of the visible, non-transparent records.
+
+    Records are offset by (ox, oy); those not overlapping the clip box
+    (cx0, cy0)-(cx1, cy1) or with zero alpha are skipped. Returns the
+    number of rectangles written.
+    """
+    n = 0
+    for i in range(len(words) // 5):
+        x = words[5 * i] + ox
+        y = words[5 * i + 1] + oy
+        w = words[5 * i + 2]
+        h = words[5 * i + 3]
+        color = words[5 * i + 4]
+        if (color >> 24) & 255 == 0 or x >= cx1 or y >= cy1 or x + w <= cx0 or y + h <= cy0:
+            continue
+        v = 8 * n
+        xy[v] = x
+        xy[v + 1] = y
+        xy[v + 2] = x + w
+        xy[v + 3] = y
+        xy[v + 4] = x
+        xy[v + 5] = y + h
+        xy[v + 6] = x + w
+        xy[v + 7] = y + h
+        c = 4 * n
+        colors[c] = color
+        colors[c + 1] = color
+        colors[c + 2] = color
+        colors[c + 3] = color
+        n += 1
+    return n
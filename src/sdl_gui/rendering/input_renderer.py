@@ -21,6 +21,8 @@ class InputRenderer:
         self._cursor_blink_rate = 0.5
         # Cache for input state to avoid re-rendering unchanged inputs
         self._input_state_cache: Dict[str, Tuple[Any, ...]] = {}
+        # Set when a blinking cursor is drawn; the Renderer clears it per frame
+        self.animating = False
 
     def _get_input_state_key(self, item: Dict[str, Any], rect: Tuple[int, int, int, int]) -> Tuple:
         """Generate a cache key based on input state that affects rendering."""
@@ -162,6 +164,7 @@ class InputRenderer:
 
         # --- 4. Render Cursor ---
         if item.get("focused") and not show_placeholder:
+             self.animating = True
              self._draw_cursor(item, lines, start_x, start_y, line_height, font_path, font_size)
 
         # Restore clip
@@ -1,44 +1,50 @@
-
-from typing import Any, Dict, List, Optional, Tuple
+import ctypes
+import struct
+from typing import Any, Dict, Optional, Tuple
 
 import sdl2
 import sdl2.ext
 from sdl2 import sdlgfx
 
 from sdl_gui import core
+from sdl_gui.rendering import geometry_kernels
+
+RECT_RECORD = struct.Struct(core.RECT_RECORD_FORMAT)
+RECT_QUEUE_SIZE = 1000
+
+# With a compiled vertex kernel and SDL_RenderGeometryRaw (SDL 2.0.18),
+# a rect batch is one geometry call; otherwise same-color runs are filled
+USE_GEOMETRY = geometry_kernels.NUMBA_AVAILABLE and sdl2.dll.version >= 2018
 
 
 class PrimitiveRenderer:
     """
     Handles rendering of primitive shapes (rectangles, rounded boxes, borders).
     Maintains its own render queue for batching solid rectangles.
+
+    Queued rectangles are written straight into the first entries of a
+    preallocated SDL_Rect array, which flush() hands to SDL as is.
     """
 
     def __init__(self, renderer: sdl2.ext.Renderer):
         self.renderer = renderer
-        self._render_queue: List[sdl2.SDL_Rect] = []
+        self._render_queue = (sdl2.SDL_Rect * RECT_QUEUE_SIZE)()
+        self._render_queue_len = 0
         self._render_queue_color: Optional[Tuple[int, int, int, int]] = None
-
-        # Simple rect pool to reduce allocations
-        self._rect_pool = [sdl2.SDL_Rect() for _ in range(1000)]
-        self._rect_pool_idx = 0
+        self._geometry_buffers: Tuple[Any, ...] = geometry_kernels.new_vertex_buffers(0)
 
     def flush(self) -> None:
         """Flush the batched render queue."""
-        if not self._render_queue:
+        if not self._render_queue_len:
             return
 
-        count = len(self._render_queue)
-
-        # Create array of rects
-        rects_array = (sdl2.SDL_Rect * count)(*self._render_queue)
-
         if self._render_queue_color:
             r, g, b, a = self._render_queue_color
             sdl2.SDL_SetRenderDrawColor(self.renderer.sdlrenderer, r, g, b, a)
-            sdl2.SDL_RenderFillRects(self.renderer.sdlrenderer, rects_array, count)
+            sdl2.SDL_RenderFillRects(self.renderer.sdlrenderer, self._render_queue,
+                                     self._render_queue_len)
 
-        self._render_queue = []
+        self._render_queue_len = 0
         self._render_queue_color = None
 
     def draw_rect_primitive(
@@ -65,23 +71,71 @@ class PrimitiveRenderer:
             self._draw_aa_rounded_box(rect, radius, color)
         else:
             # Skip fill if fully transparent
-            if color[3] == 0:
-                pass
-            elif self._render_queue_color == color:
-                self._render_queue.append(self._get_pooled_rect(x, y, w, h))
-            else:
-                self.flush()
-                self._render_queue_color = color
-                self._render_queue.append(self._get_pooled_rect(x, y, w, h))
+            if color[3] != 0:
+                self._queue_rect(int(x), int(y), int(w), int(h), color)
 
         self._draw_border(item, rect, radius)
 
-    def _get_pooled_rect(self, x: int, y: int, w: int, h: int) -> sdl2.SDL_Rect:
-        """Get a pooled SDL_Rect."""
-        rect = self._rect_pool[self._rect_pool_idx % len(self._rect_pool)]
-        rect.x, rect.y, rect.w, rect.h = int(x), int(y), int(w), int(h)
-        self._rect_pool_idx += 1
-        return rect
+    def draw_rect_batch(
+        self,
+        item: Dict[str, Any],
+        rect: Tuple[int, int, int, int],
+        clip: Optional[Tuple[int, int, int, int]] = None
+    ) -> None:
+        """
+        Draw the packed records of a rect batch, offset by the batch origin.
+        Records outside clip are skipped; consecutive records of the same
+        color go into one fill call, or the whole batch into one geometry
+        call when the vertex kernel is compiled.
+        """
+        ox, oy = rect[0], rect[1]
+        cx0, cy0, cw, ch = clip or (-2**31, -2**31, 2**32, 2**32)
+        cx1, cy1 = cx0 + cw, cy0 + ch
+        if USE_GEOMETRY:
+            self._draw_rect_batch_geometry(item.get(core.KEY_RECORDS, b""), ox, oy, (cx0, cy0, cx1, cy1))
+            return
+        queue_rect = self._queue_rect
+        for x, y, w, h, r, g, b, a in RECT_RECORD.iter_unpack(item.get(core.KEY_RECORDS, b"")):
+            x += ox
+            y += oy
+            if a == 0 or x >= cx1 or y >= cy1 or x + w <= cx0 or y + h <= cy0:
+                continue
+            queue_rect(x, y, w, h, (r, g, b, a))
+
+    def _draw_rect_batch_geometry(
+        self,
+        records: bytes,
+        ox: int,
+        oy: int,
+        clip: Tuple[int, int, int, int]
+    ) -> None:
+        """Draw the records as triangles in a single SDL_RenderGeometryRaw call."""
+        capacity = len(records) // RECT_RECORD.size
+        if len(self._geometry_buffers[2]) < 6 * capacity:
+            self._geometry_buffers = geometry_kernels.new_vertex_buffers(capacity)
+        xy, colors, indices = self._geometry_buffers
+        count = geometry_kernels.rect_vertices(geometry_kernels.record_words(records), ox, oy, *clip, xy, colors)
+        if not count:
+            return
+
+        self.flush()
+        sdl2.SDL_RenderGeometryRaw(
+            self.renderer.sdlrenderer, None,
+            (ctypes.c_float * len(xy)).from_buffer(xy), 8,
+            ctypes.cast((ctypes.c_int32 * len(colors)).from_buffer(colors), ctypes.POINTER(sdl2.SDL_Color)), 4,
+            None, 0, 4 * count,
+            ctypes.addressof((ctypes.c_int32 * len(indices)).from_buffer(indices)), 6 * count, 4
+        )
+
+    def _queue_rect(self, x: int, y: int, w: int, h: int,
+                    color: Tuple[int, int, int, int]) -> None:
+        """Queue a solid rectangle, flushing on a color change or a full queue."""
+        if self._render_queue_color != color or self._render_queue_len == RECT_QUEUE_SIZE:
+            self.flush()
+            self._render_queue_color = color
+        rect = self._render_queue[self._render_queue_len]
+        rect.x, rect.y, rect.w, rect.h = x, y, w, h
+        self._render_queue_len += 1
 
     def _to_sdlgfx_color(self, color: Tuple[int, int, int, int]) -> int:
         """Convert RGBA tuple to ABGR integer for sdlgfx."""
@@ -130,6 +184,8 @@ class PrimitiveRenderer:
 
         x, y, w, h = rect
         color_int = self._to_sdlgfx_color(border_color)
+        # The border goes over the fill, which may still be queued
+        self.flush()
 
         if radius > 0:
             # Rounded border
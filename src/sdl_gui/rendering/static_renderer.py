@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+import sdl2
+import sdl2.ext
+
+from sdl_gui import core
+from sdl_gui.rendering.primitive_renderer import PrimitiveRenderer
+from sdl_gui.rendering.texture import RawTexture
+
+if TYPE_CHECKING:
+    from sdl_gui.window.renderer import Renderer
+
+Rect = Tuple[int, int, int, int]
+
+# Baked content is premultiplied by alpha (drawn with BLEND onto a transparent
+# target), so it is composited with ONE / ONE_MINUS_SRC_ALPHA
+PREMULTIPLIED_BLEND = sdl2.SDL_ComposeCustomBlendMode(
+    sdl2.SDL_BLENDFACTOR_ONE, sdl2.SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, sdl2.SDL_BLENDOPERATION_ADD,
+    sdl2.SDL_BLENDFACTOR_ONE, sdl2.SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, sdl2.SDL_BLENDOPERATION_ADD)
+
+
+class StaticRenderer:
+    """
+    Renders items marked static (set_static(True)) through a baked texture.
+
+    The first time an item is drawn at a given rect, its subtree is rendered
+    once into a target texture; later frames copy that texture in one call.
+    An entry is keyed by the content of the subtree and the rect: to_data()
+    hands out a new dict on every call, so the dict identity cannot be the
+    key. A changed item gets a new key; the old texture is simply not drawn
+    again and is released at the end of the frame, as are textures of items
+    that went off screen.
+
+    Renderers without target textures or custom blend modes (the software
+    renderer) draw static items like any other item.
+    """
+
+    def __init__(self, renderer_proxy: 'Renderer', renderer: sdl2.ext.Renderer,
+                 primitive_renderer: PrimitiveRenderer):
+        self.renderer_proxy = renderer_proxy  # To render the subtree when baking
+        self.renderer = renderer
+        self.primitive_renderer = primitive_renderer
+        # (subtree hash, rect) -> (texture, hit list entries of the subtree)
+        self._baked: Dict[Tuple[int, Rect],
+                          Tuple[Any, List[Tuple[Rect, Dict[str, Any]]]]] = {}
+        self._drawn: Set[Tuple[int, Rect]] = set()
+        self._supported = True
+
+    def clear_cache(self):
+        self._baked.clear()
+        self._drawn.clear()
+
+    def render_static(self, item: Dict[str, Any], rect: Rect) -> None:
+        """Draw a static item from its baked texture, baking it if needed."""
+        if not self._supported:
+            self.renderer_proxy._render_content(item, rect, rect)
+            return
+        key = (self._subtree_hash(item), tuple(rect))
+        entry = self._baked.get(key)
+        if entry is None:
+            entry = self._bake(item, rect)
+            if entry is None:
+                self.renderer_proxy._render_content(item, rect, rect)
+                return
+            self._baked[key] = entry
+        self._drawn.add(key)
+        self.primitive_renderer.flush()
+        self.renderer.copy(entry[0], dstrect=rect)
+        self.renderer_proxy._hit_list.extend(entry[1])
+
+    def end_frame(self) -> None:
+        """Release the textures that were not drawn during this frame."""
+        for key in set(self._baked) - self._drawn:
+            del self._baked[key]
+        self._drawn.clear()
+
+    def _subtree_hash(self, item: Dict[str, Any]) -> int:
+        """Hash the item and its descendants, each dict at most once per frame."""
+        item_hash = self.renderer_proxy._hash_item_cached(item)
+        children = item.get(core.KEY_CHILDREN)
+        if not children:
+            return item_hash
+        return hash((item_hash, tuple(self._subtree_hash(child) for child in children)))
+
+    def _bake(self, item: Dict[str, Any], rect: Rect):
+        """Render the item at the origin of a new target texture."""
+        x, y, w, h = rect
+        sdl_renderer = self.renderer.sdlrenderer
+        if w <= 0 or h <= 0:
+            return None
+        target = sdl2.SDL_CreateTexture(sdl_renderer, sdl2.SDL_PIXELFORMAT_RGBA8888,
+                                        sdl2.SDL_TEXTUREACCESS_TARGET, w, h)
+        if not target or sdl2.SDL_SetTextureBlendMode(target, PREMULTIPLIED_BLEND) != 0:
+            if target:
+                sdl2.SDL_DestroyTexture(target)
+            self._supported = False
+            return None
+
+        self.primitive_renderer.flush()
+        old_target = sdl2.SDL_GetRenderTarget(sdl_renderer)
+        sdl2.SDL_SetRenderTarget(sdl_renderer, target)
+        sdl2.SDL_SetRenderDrawColor(sdl_renderer, 0, 0, 0, 0)
+        sdl2.SDL_RenderClear(sdl_renderer)
+
+        hit_list = self.renderer_proxy._hit_list
+        start = len(hit_list)
+        # The texture is not redrawn, so its text cannot wait for a worker
+        text_renderer = self.renderer_proxy.text_renderer
+        rasterizer, text_renderer.rasterizer = text_renderer.rasterizer, None
+        try:
+            self.renderer_proxy._render_content(item, (0, 0, w, h), (0, 0, w, h))
+        finally:
+            text_renderer.rasterizer = rasterizer
+        self.primitive_renderer.flush()
+        sdl2.SDL_SetRenderTarget(sdl_renderer, old_target)
+
+        # Hit rects were recorded relative to the texture; render_static adds them back
+        hits = [((hx + x, hy + y, hw, hh), hit_item) for (hx, hy, hw, hh), hit_item in hit_list[start:]]
+        del hit_list[start:]
+        return RawTexture(self.renderer, target), hits
@@ -0,0 +1,123 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+import sdl2
+
+
+class TextRasterizer:
+    """
+    Rasterizes text surfaces on a worker thread.
+
+    SDL_ttf can render to surfaces off the main thread, but textures must
+    be created on it. request() submits a raster job on its first call for
+    a key and returns the surface once the job is done; the caller turns
+    it into a texture. Until then the text is simply not drawn. Jobs not
+    requested again by the next frame are dropped at end_frame(), and a
+    job that gives no surface is not submitted again until discard().
+
+    Font objects are not safe to use from two threads at once, so jobs
+    run under the lock the text renderer holds for its own SDL_ttf calls,
+    on a single worker. A finished job pushes an SDL_USEREVENT so that
+    event-driven loops draw another frame.
+    """
+
+    def __init__(self, ttf_lock: threading.Lock):
+        self._ttf_lock = ttf_lock
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sdl_gui_text")
+        self._pending: Dict[Hashable, Future] = {}
+        # Keys requested since the last end_frame()
+        self._requested: Set[Hashable] = set()
+        # Jobs nobody waits for any more, still running
+        self._orphans: List[Future] = []
+        # Keys whose job gave no surface: not submitted again
+        self._failed: Set[Hashable] = set()
+
+    def request(self, key: Hashable, render: Callable[[], Any]) -> Optional[Any]:
+        """
+        Return the rasterized surface for key, or None while it is pending.
+
+        Args:
+            key: Identifies the text, font and color being rendered.
+            render: Renders the surface; called on the worker thread.
+        """
+        if key in self._failed:
+            return None
+        self._requested.add(key)
+        future = self._pending.get(key)
+        if future is None:
+            self._pending[key] = self._executor.submit(self._run, render)
+            return None
+        if not future.done():
+            return None
+        del self._pending[key]
+        surface = future.result()
+        if surface is None:
+            self._failed.add(key)
+        return surface
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Return True if the surface for key has been requested but not collected."""
+        return key in self._pending
+
+    def has_pending(self) -> bool:
+        """Return True while surfaces wanted by the last frame are not collected."""
+        return bool(self._pending)
+
+    def end_frame(self) -> None:
+        """
+        Drop the jobs the frame did not request, e.g. text scrolled away.
+
+        Their surfaces are freed, now or once rendered, so only the text
+        still being drawn keeps has_pending() true.
+        """
+        self._free_done(self._orphans)
+        for key in [k for k in self._pending if k not in self._requested]:
+            future = self._pending.pop(key)
+            if not future.cancel():
+                self._orphans.append(future)
+        self._free_done(self._orphans)
+        self._requested.clear()
+
+    def discard(self) -> None:
+        """Drop the pending jobs, freeing the surfaces already rendered."""
+        for future in list(self._pending.values()) + self._orphans:
+            if not future.cancel():
+                self._free(future.result())
+        self._pending.clear()
+        self._orphans.clear()
+        self._requested.clear()
+        self._failed.clear()
+
+    @staticmethod
+    def _free(surface: Optional[Any]) -> None:
+        """Free a rendered surface; failed jobs have none."""
+        if surface:
+            sdl2.SDL_FreeSurface(surface)
+
+    def _free_done(self, futures: List[Future]) -> None:
+        """Free the surfaces of the finished futures, keeping the others."""
+        running = []
+        for future in futures:
+            if future.done():
+                self._free(future.result())
+            else:
+                running.append(future)
+        futures[:] = running
+
+    def shutdown(self) -> None:
+        """Wait for the worker to stop and release every pending surface."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.discard()
+
+    def _run(self, render: Callable[[], Any]) -> Optional[Any]:
+        """Render one surface, then wake the event loop."""
+        try:
+            with self._ttf_lock:
+                return render()
+        except Exception:
+            return None
+        finally:
+            event = sdl2.SDL_Event()
+            event.type = sdl2.SDL_USEREVENT
+            sdl2.SDL_PushEvent(event)
@@ -1,4 +1,5 @@
-
+import ctypes
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 import sdl2
@@ -7,12 +8,25 @@ from sdl2 import sdlttf
 
 from sdl_gui import core, markdown, utils
 from sdl_gui.rendering.primitive_renderer import PrimitiveRenderer
+from sdl_gui.rendering.text_rasterizer import TextRasterizer
+
+# Entries kept per word cache; feeds keep producing new words (counts, times)
+GLYPH_CACHE_LIMIT = 4096
 
 
 class TextRenderer:
     """
     Handles rendering of text and rich text.
     Manages font caches and text texture caches.
+
+    Word textures and measurements are kept in least-recently-used order
+    and bounded by GLYPH_CACHE_LIMIT. Measuring asks SDL_ttf for the size
+    without rasterizing the text.
+
+    With asynchronous rasterization enabled, words missing from the
+    texture cache are rendered by a TextRasterizer and drawn from the
+    first frame after they are ready. Every SDL_ttf call goes through
+    _ttf_lock so that the worker and the main thread never share a font.
     """
 
     def __init__(self, renderer: sdl2.ext.Renderer, primitive_renderer: PrimitiveRenderer):
@@ -32,10 +46,38 @@ class TextRenderer:
         self._rich_text_layout_cache: Dict[Tuple, Any] = {}
         self._plain_text_layout_cache: Dict[Tuple, Any] = {}
 
-    def clear_caches(self):
-        """Clear all text-related caches."""
-        self._text_texture_cache.clear()
-        self._text_measurement_cache.clear()
+        self._ttf_lock = threading.Lock()
+        self.rasterizer: Optional[TextRasterizer] = None
+
+    def set_async_rasterization(self, enabled: bool) -> None:
+        """Rasterize missing words on a worker thread instead of while drawing."""
+        if enabled and self.rasterizer is None:
+            self.rasterizer = TextRasterizer(self._ttf_lock)
+        elif not enabled and self.rasterizer is not None:
+            self.rasterizer.shutdown()
+            self.rasterizer = None
+
+    def end_frame(self) -> None:
+        """Drop the rasterization jobs of the text the frame did not draw."""
+        if self.rasterizer is not None:
+            self.rasterizer.end_frame()
+
+    def has_pending_text(self) -> bool:
+        """Return True while some words are still being rasterized."""
+        return self.rasterizer is not None and self.rasterizer.has_pending()
+
+    def clear_caches(self, keep_glyphs: bool = False):
+        """
+        Clear all text-related caches.
+
+        With keep_glyphs, the rendered word textures and their measurements
+        are kept: unlike wrapped layouts they do not depend on the width.
+        """
+        if not keep_glyphs:
+            self._text_texture_cache.clear()
+            self._text_measurement_cache.clear()
+            if self.rasterizer is not None:
+                self.rasterizer.discard()
         self._rich_text_layout_cache.clear()
         self._plain_text_layout_cache.clear()
         # Note: We keep font managers as they are expensive to reload
@@ -47,11 +89,12 @@ class TextRenderer:
         hit_list: List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]]
     ) -> None:
         """Render text item (plain or rich)."""
-        # Note: flush() is handled by the main renderer for batching efficiency
-
         if not self.ttf_available or not item.get(core.KEY_TEXT, ""):
             return
 
+        # Queued fills (e.g. the background under this text) must land first
+        self.primitive_renderer.flush()
+
         if item.get(core.KEY_MARKUP, True):
             self._render_rich_text(item, rect, hit_list)
         else:
@@ -64,6 +107,12 @@ class TextRenderer:
         w, _ = self._measure_text_cached(text, font_path, font_size)
         return w
 
+    def measure_runs_width(self, runs: Tuple[Tuple[str, str], ...], font_path: str = None, font_size: int = 16) -> int:
+        """Measure styled runs, bold runs with the bold font."""
+        font_path = font_path or "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+        return sum(self._measure_text_cached(text, font_path, font_size, style == "bold")[0]
+                   for style, text in runs)
+
     def _get_font_manager(self, font_path: str, size: int, color: Tuple[int, int, int, int], bold: bool = False) -> Optional[sdl2.ext.FontManager]:
         cache_key = f"{font_path}_{size}_{color}_{bold}"
         font_manager = self._font_cache.get(cache_key)
@@ -73,9 +122,11 @@ class TextRenderer:
                 c_tuple = tuple(color) if isinstance(color, (list, tuple)) else (0,0,0,255)
                 # SDL2 FontManager expects color as specific type or tuple?
                 # Usually it takes (r,g,b,a) or Color object.
-                font_manager = sdl2.ext.FontManager(font_path, size=size, color=c_tuple)
-                if bold and hasattr(font_manager, "font"):
-                    sdlttf.TTF_SetFontStyle(font_manager.font, sdlttf.TTF_STYLE_BOLD)
+                with self._ttf_lock:
+                    font_manager = sdl2.ext.FontManager(font_path, size=size, color=c_tuple)
+                    if bold and hasattr(font_manager, "font"):
+                        sdlttf.TTF_SetFontStyle(font_manager.font,
+                                                sdlttf.TTF_STYLE_BOLD)
                 self._font_cache[cache_key] = font_manager
             except Exception:
                 return None
@@ -85,24 +136,44 @@ class TextRenderer:
         self, text: str, font_path: str, size: int, bold: bool = False
     ) -> Tuple[int, int]:
         cache_key = (font_path, size, text, bold)
-        cached = self._text_measurement_cache.get(cache_key)
+        cached = self._lru_get(self._text_measurement_cache, cache_key)
         if cached is not None:
             return cached
 
         # Use a neutral color for measurement
         fm = self._get_font_manager(font_path, size, (0, 0, 0, 255), bold)
-        if fm:
-            try:
-                 surface = fm.render(text)
-                 result = (surface.w, surface.h) if surface else (0, 0)
-            except Exception:
-                 result = (0, 0)
-        else:
-            result = (0, 0)
-
-        self._text_measurement_cache[cache_key] = result
+        result = (0, 0)
+        if fm and text:
+            w, h = ctypes.c_int(), ctypes.c_int()
+            font = fm.fonts[fm.default_font][fm.size]
+            with self._ttf_lock:
+                ok = sdlttf.TTF_SizeUTF8(font, text.encode("utf-8"), ctypes.byref(w), ctypes.byref(h)) == 0
+            if ok:
+                result = (w.value, h.value)
+
+        self._lru_put(self._text_measurement_cache, cache_key, result)
         return result
 
+    def _rasterize(self, cache_key: Tuple, fm: sdl2.ext.FontManager, text: str) -> Optional[Any]:
+        """Render text to a surface, or return None while it is rasterized asynchronously."""
+        if self.rasterizer is not None:
+            return self.rasterizer.request(cache_key, lambda: fm.render(text))
+        with self._ttf_lock:
+            return fm.render(text)
+
+    def _lru_get(self, cache: Dict[Tuple, Any], key: Tuple) -> Any:
+        """Return a cached value, moving it to the most recent end."""
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value
+        return value
+
+    def _lru_put(self, cache: Dict[Tuple, Any], key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used one when full."""
+        if len(cache) >= GLYPH_CACHE_LIMIT:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
     def _get_resolved_font_size(self, item, parent_h):
         raw = item.get(core.KEY_FONT_SIZE, 16)
         s = utils.resolve_val(raw, parent_h) if parent_h > 0 else (raw if isinstance(raw, int) else 16)
@@ -183,16 +254,20 @@ class TextRenderer:
         for line in lines:
             if cy > max_y: break
             cache_key = (settings["font_path"], settings["size"], color_key, line)
-            cached = self._text_texture_cache.get(cache_key)
+            cached = self._lru_get(self._text_texture_cache, cache_key)
 
             if cached:
                 texture, (tw, th) = cached
             else:
-                s = settings["fm"].render(line)
-                if not s: continue
+                s = self._rasterize(cache_key, settings["fm"], line)
+                if not s:
+                    # A line still being rasterized keeps its place
+                    if self.rasterizer and self.rasterizer.is_pending(cache_key): cy += settings["line_h"]
+                    continue
                 texture = sdl2.ext.Texture(self.renderer, s)
+                sdl2.SDL_FreeSurface(s)
                 tw, th = texture.size
-                self._text_texture_cache[cache_key] = (texture, (tw, th))
+                self._lru_put(self._text_texture_cache, cache_key, (texture, (tw, th)))
 
             tx = rect[0]
             if settings["align"] == "center": tx += (rect[2] - tw) // 2
@@ -212,15 +287,18 @@ class TextRenderer:
         base_color = item.get(core.KEY_COLOR, (0, 0, 0, 255))
         if len(base_color) == 3: base_color = (*base_color, 255)
         text_content = item.get(core.KEY_TEXT, "")
+        runs = item.get(core.KEY_RUNS)
 
         # Check cache
-        cache_key = (text_content, rect[2], font_path, size, tuple(base_color))
+        cache_key = (text_content, runs, rect[2], font_path, size, tuple(base_color))
         cached = self._rich_text_layout_cache.get(cache_key)
         if cached:
             return cached
 
-        parser = markdown.MarkdownParser(default_color=base_color)
-        segments = parser.parse(text_content)
+        if runs:
+            segments = markdown.segments_from_runs(runs, tuple(base_color))
+        else:
+            segments = markdown.parse_markup(text_content, tuple(base_color))
 
         def measure_chunk(text_str, seg):
             return self._measure_text_cached(text_str, font_path, size, seg.bold)
@@ -288,7 +366,7 @@ class TextRenderer:
         # Cache key needs to account for color tuple
         msg_color = tuple(seg.color) if isinstance(seg.color, list) else seg.color
         cache_key = (settings["font_path"], settings["size"], msg_color, txt, seg.bold)
-        cached = self._text_texture_cache.get(cache_key)
+        cached = self._lru_get(self._text_texture_cache, cache_key)
 
         if cached:
             texture, tex_size = cached
@@ -297,11 +375,12 @@ class TextRenderer:
             tex_size = None
             fm = self._get_font_manager(settings["font_path"], settings["size"], seg.color, seg.bold)
             if fm:
-                surf = fm.render(txt)
+                surf = self._rasterize(cache_key, fm, txt)
                 if surf:
                     texture = sdl2.ext.Texture(self.renderer.sdlrenderer, surf)
+                    sdl2.SDL_FreeSurface(surf)
                     tex_size = texture.size
-                    self._text_texture_cache[cache_key] = (texture, tex_size)
+                    self._lru_put(self._text_texture_cache, cache_key, (texture, tex_size))
 
         if texture:
             self.renderer.copy(texture, dstrect=(x, y, *tex_size))
@@ -149,6 +149,12 @@ class VectorRenderer:
                      sdlgfx.thickLineColor(renderer, int(current_x), int(current_y), int(tx), int(ty), int(stroke_width), stroke_color)
                  current_x, current_y = tx, ty
 
+            elif ctype == core.CMD_POLYLINE:
+                 points = [(current_x, current_y)]
+                 points.extend(zip(map(res_x, cmd.get("xs", ())), map(res_y, cmd.get("ys", ()))))
+                 self._draw_polyline(renderer, points, stroke_width, stroke_color)
+                 current_x, current_y = points[-1]
+
             elif ctype == core.CMD_RECT:
                  rx = res_x(cmd.get("x", 0)); ry = res_y(cmd.get("y", 0))
                  rw = res_w(cmd.get("w", 0)); rh = res_h(cmd.get("h", 0))
@@ -190,6 +196,14 @@ class VectorRenderer:
                   if stroke_width > 0:
                       sdlgfx.pieColor(renderer, cx, cy, r, start, end, stroke_color)
 
+    def _draw_polyline(self, renderer, points: List[Tuple[int, int]], stroke_width: int, stroke_color: int) -> None:
+        """Draw the segments joining consecutive points, as line_to does."""
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            if stroke_width <= 1:
+                sdlgfx.aalineColor(renderer, int(x1), int(y1), int(x2), int(y2), stroke_color)
+            else:
+                sdlgfx.thickLineColor(renderer, int(x1), int(y1), int(x2), int(y2), int(stroke_width), stroke_color)
+
     def _to_sdlgfx_color(self, color: Union[Tuple, List]) -> int:
         if isinstance(color, list): color = tuple(color)
         if len(color) == 3: color = (*color, 255)
@@ -1,5 +1,53 @@
 
-from typing import Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Canonical instances of the small tuples (colors, spacing) widgets carry.
+_TUPLE_POOL: Dict[Tuple, Tuple] = {}
+_TUPLE_POOL_LIMIT = 4096
+
+
+def intern_tuple(value: Any) -> Any:
+    """
+    Return the pooled instance equal to a tuple value.
+
+    UIs repeat a handful of colors and paddings across many widgets;
+    sharing one instance avoids keeping thousands of equal tuples alive.
+    Non-tuples are returned unchanged, and once the pool is full new
+    values are no longer added.
+    """
+    if type(value) is not tuple:
+        return value
+    try:
+        pooled = _TUPLE_POOL.get(value)
+    except TypeError:  # Unhashable member
+        return value
+    if pooled is not None:
+        return pooled
+    if len(_TUPLE_POOL) < _TUPLE_POOL_LIMIT:
+        _TUPLE_POOL[value] = value
+    return value
+
+
+@lru_cache(maxsize=1024)
+def parse_dimension(val: str) -> Tuple[Optional[float], int]:
+    """
+    Parse a dimension string into (fraction of the parent, pixels).
+
+    "50%" gives (0.5, 0); "10px" and "10" give (None, 10); strings that
+    do not parse give (None, 0). A UI uses a handful of distinct strings
+    resolved on every frame, so each one is parsed only once.
+    """
+    if val.endswith("%"):
+        try:
+            return float(val[:-1]) / 100.0, 0
+        except ValueError:
+            return None, 0
+    try:
+        return None, int(val[:-2] if val.endswith("px") else val)
+    except ValueError:
+        return None, 0
+
 
 def resolve_val(val: Union[int, float, str], parent_len: int) -> int:
     """
@@ -14,23 +62,9 @@ def resolve_val(val: Union[int, float, str], parent_len: int) -> int:
     """
     if isinstance(val, (int, float)):
         return int(val)
-    
+
     if isinstance(val, str):
-        if val.endswith("%"):
-            try:
-                pct = float(val[:-1])
-                return int((pct / 100.0) * parent_len)
-            except ValueError:
-                return 0
-        elif val.endswith("px"):
-            try:
-                return int(val[:-2])
-            except ValueError:
-                return 0
-        else:
-            try:
-                return int(val)
-            except ValueError:
-                return 0
-                
+        fraction, pixels = parse_dimension(val)
+        return pixels if fraction is None else int(fraction * parent_len)
+
     return 0
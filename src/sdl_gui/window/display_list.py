@@ -0,0 +1,80 @@
+from typing import Any, Dict, List, Optional, Set, Union, cast
+
+from sdl_gui.primitives.base import BasePrimitive
+
+
+class DisplayList:
+    """
+    A retained display list.
+
+    Holds the root entries of a scene. Primitives are asked for their data
+    on every build and hand back their cached dict until they change, so a
+    frame only pays serialization for the parts of the scene that changed.
+    Plain dicts are used as-is. Other objects with a to_data() method are
+    serialized once and reused until marked dirty.
+    """
+
+    def __init__(self, entries: Optional[List[Any]] = None):
+        self.entries: List[Any] = []
+        self._data: List[Optional[Dict[str, Any]]] = []
+        self._dirty: Set[int] = set()
+        for entry in entries or []:
+            self.append(entry)
+
+    def append(self, entry: Any) -> None:
+        """Add a root entry on top of the existing ones."""
+        self.entries.append(entry)
+        self._data.append(None)
+        self._dirty.add(len(self.entries) - 1)
+
+    def mark_dirty(self, entry: Union[int, Any]) -> None:
+        """
+        Re-serialize an entry, given by index or identity, on the next build.
+
+        Primitives track their own changes: this is only needed for other
+        objects with a to_data() method.
+
+        Raises IndexError for an index out of range and ValueError for an
+        entry that is not in the list.
+        """
+        count = len(self.entries)
+        if isinstance(entry, int):
+            if not -count <= entry < count:
+                raise IndexError(f"index {entry} out of range for {count} entries")
+            index = entry % count
+        else:
+            for index, e in enumerate(self.entries):
+                if e is entry:
+                    break
+            else:
+                raise ValueError(f"{entry!r} is not in the display list")
+        self._dirty.add(index)
+
+    def mark_all_dirty(self) -> None:
+        """Re-serialize every entry on the next build."""
+        self._dirty.update(range(len(self.entries)))
+
+    def build(self) -> List[Dict[str, Any]]:
+        """Return the display list, serializing only what changed."""
+        data = self._data
+        for index in self._dirty:
+            entry = self.entries[index]
+            if not isinstance(entry, BasePrimitive):
+                data[index] = entry if isinstance(entry, dict) else entry.to_data()
+        self._dirty.clear()
+        # A new list each time: the renderer keeps the previous one for diffing
+        built: List[Dict[str, Any]] = []
+        for entry, entry_data in zip(self.entries, data):
+            if not isinstance(entry, BasePrimitive):
+                # Serialized above while it was dirty
+                built.append(cast(Dict[str, Any], entry_data))
+            elif type(entry).to_data is BasePrimitive.to_data:
+                # The cache itself: the same dict until the entry changes
+                built.append(entry._get_data())
+            else:
+                built.append(entry.to_data())
+        return built
+
+    def __len__(self) -> int:
+        """Return the number of root entries."""
+        return len(self.entries)
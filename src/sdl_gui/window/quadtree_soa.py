@@ -0,0 +1,205 @@
+"""
+Quadtree stored as a structure of arrays.
+
+Instead of one Python object per node, node and item data live in
+parallel typed arrays indexed by node or item number. Traversal is an
+explicit stack over integers, so a query reads contiguous memory rather
+than chasing node objects, and the same layout can be handed to compiled
+kernels.
+"""
+
+from array import array
+from typing import Dict, List, Set, Tuple
+
+
+class QuadTreeSoA:
+    """
+    Quadtree with the interface of QuadTreeNode, backed by flat arrays.
+
+    Nodes: bounds columns ``_x0``/``_y0``/``_x1``/``_y1``, ``_first_child``
+    (index of the first of four consecutive children, -1 for a leaf) and
+    ``_depth``. Items: bounds columns ``_ix0``/``_iy0``/``_ix1``/``_iy1``
+    and ``_ids``. Leaf contents are compiled lazily into the flat
+    ``_items`` array addressed by ``_item_start``/``_item_count``.
+    """
+
+    def __init__(
+        self,
+        bounds: Tuple[int, int, int, int],
+        max_items: int = 8,
+        max_depth: int = 6
+    ):
+        """
+        Initialize an empty tree.
+
+        Args:
+            bounds: The world bounds (x, y, width, height).
+            max_items: Maximum items in a leaf before splitting.
+            max_depth: Maximum tree depth.
+        """
+        self.bounds = bounds
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all items and nodes but the root."""
+        x, y, w, h = self.bounds
+        self._x0, self._y0 = array("d", (x,)), array("d", (y,))
+        self._x1, self._y1 = array("d", (x + w,)), array("d", (y + h,))
+        self._first_child = array("i", (-1,))
+        self._depth = array("i", (0,))
+        self._node_items: List[List[int]] = [[]]
+        self._ix0, self._iy0 = array("d"), array("d")
+        self._ix1, self._iy1 = array("d"), array("d")
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._items = array("i")
+        self._item_start = array("i")
+        self._item_count = array("i")
+        self._compiled = False
+
+    def _intersects(self, rect: Tuple[int, int, int, int]) -> bool:
+        """Check if a rectangle intersects the tree bounds."""
+        rx, ry, rw, rh = rect
+        return (rx + rw > self._x0[0] and rx < self._x1[0] and
+                ry + rh > self._y0[0] and ry < self._y1[0])
+
+    def _node_overlaps_item(self, node: int, item: int) -> bool:
+        return (self._ix1[item] > self._x0[node] and self._ix0[item] < self._x1[node] and
+                self._iy1[item] > self._y0[node] and self._iy0[item] < self._y1[node])
+
+    def insert(self, item_id: str, rect: Tuple[int, int, int, int]) -> bool:
+        """
+        Insert an item.
+
+        Args:
+            item_id: Unique identifier for the item.
+            rect: Bounding rectangle (x, y, width, height).
+
+        Returns:
+            True if the item lies within the tree bounds and was inserted.
+        """
+        if not self._intersects(rect):
+            return False
+        x, y, w, h = rect
+        item = len(self._ids)
+        self._ix0.append(x)
+        self._iy0.append(y)
+        self._ix1.append(x + w)
+        self._iy1.append(y + h)
+        self._ids.append(item_id)
+        self._index[item_id] = item
+        self._place(0, item)
+        self._compiled = False
+        return True
+
+    def _place(self, node: int, item: int) -> None:
+        """Add an item to every leaf under node that it overlaps."""
+        ix0, iy0, ix1, iy1 = self._ix0[item], self._iy0[item], self._ix1[item], self._iy1[item]
+        x0, y0, x1, y1, first_child = self._x0, self._y0, self._x1, self._y1, self._first_child
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if not (ix1 > x0[n] and ix0 < x1[n] and iy1 > y0[n] and iy0 < y1[n]):
+                continue
+            first = first_child[n]
+            if first >= 0:
+                stack.extend(range(first, first + 4))
+                continue
+            items = self._node_items[n]
+            items.append(item)
+            if len(items) > self.max_items and self._depth[n] < self.max_depth:
+                self._subdivide(n)
+
+    def _subdivide(self, node: int) -> None:
+        """Split a leaf into 4 quadrants and redistribute its items."""
+        x, y = self._x0[node], self._y0[node]
+        w, h = self._x1[node] - x, self._y1[node] - y
+        hw, hh = w // 2, h // 2
+        first = len(self._first_child)
+        depth = self._depth[node] + 1
+        for qx, qy, qw, qh in ((x, y, hw, hh), (x + hw, y, w - hw, hh),
+                               (x, y + hh, hw, h - hh), (x + hw, y + hh, w - hw, h - hh)):
+            self._x0.append(qx)
+            self._y0.append(qy)
+            self._x1.append(qx + qw)
+            self._y1.append(qy + qh)
+            self._first_child.append(-1)
+            self._depth.append(depth)
+            self._node_items.append([])
+        self._first_child[node] = first
+        moved, self._node_items[node] = self._node_items[node], []
+        for item in moved:
+            for child in range(first, first + 4):
+                self._place(child, item)
+
+    def remove(self, item_id: str) -> bool:
+        """
+        Remove an item.
+
+        Its slot in the item arrays is only reclaimed by clear(), which
+        the renderer calls before every index rebuild.
+
+        Args:
+            item_id: The item ID to remove.
+
+        Returns:
+            True if the item was found and removed.
+        """
+        item = self._index.pop(item_id, None)
+        if item is None:
+            return False
+        stack = [0]
+        while stack:
+            n = stack.pop()
+            if not self._node_overlaps_item(n, item):
+                continue
+            first = self._first_child[n]
+            if first >= 0:
+                stack.extend(range(first, first + 4))
+            elif item in self._node_items[n]:
+                self._node_items[n].remove(item)
+        self._compiled = False
+        return True
+
+    def _compile(self) -> None:
+        """Flatten the per-leaf item lists into the _items array."""
+        self._items = array("i")
+        self._item_start = array("i")
+        self._item_count = array("i")
+        for items in self._node_items:
+            self._item_start.append(len(self._items))
+            self._item_count.append(len(items))
+            self._items.extend(items)
+        self._compiled = True
+
+    def query(self, rect: Tuple[int, int, int, int], result: Set[str]) -> None:
+        """
+        Query items intersecting a rectangle.
+
+        Args:
+            rect: Query rectangle (x, y, width, height).
+            result: Set to add matching item IDs to.
+        """
+        if not self._compiled:
+            self._compile()
+        qx, qy, qw, qh = rect
+        qx1, qy1 = qx + qw, qy + qh
+        x0, y0, x1, y1 = self._x0, self._y0, self._x1, self._y1
+        ix0, iy0, ix1, iy1 = self._ix0, self._iy0, self._ix1, self._iy1
+        first_child, ids = self._first_child, self._ids
+        items, starts, counts = self._items, self._item_start, self._item_count
+        stack = [0]
+        while stack:
+            n = stack.pop()
+            if not (qx1 > x0[n] and qx < x1[n] and qy1 > y0[n] and qy < y1[n]):
+                continue
+            first = first_child[n]
+            if first >= 0:
+                stack.extend(range(first, first + 4))
+                continue
+            start = starts[n]
+            for item in items[start:start + counts[n]]:
+                if ix1[item] > qx and ix0[item] < qx1 and iy1[item] > qy and iy0[item] < qy1:
+                    result.add(ids[item])
@@ -1,7 +1,7 @@
 
 import ctypes
 import threading
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import sdl2
 import sdl2.ext
@@ -11,10 +11,14 @@ from sdl_gui.rendering.flex_renderer import FlexRenderer
 from sdl_gui.rendering.image_renderer import ImageRenderer
 from sdl_gui.rendering.input_renderer import InputRenderer
 from sdl_gui.rendering.primitive_renderer import PrimitiveRenderer
+from sdl_gui.rendering.static_renderer import StaticRenderer
 from sdl_gui.rendering.text_renderer import TextRenderer
 from sdl_gui.rendering.vector_renderer import VectorRenderer
 from sdl_gui.window.spatial_index import SpatialIndex
 
+# Value types written to debug dumps as they are, matched by exact type
+_DUMP_SCALAR_TYPES = frozenset((int, float, str, bool, type(None)))
+
 
 class Renderer:
     """
@@ -24,6 +28,9 @@ class Renderer:
 
     def __init__(self, window: sdl2.ext.Window, flags: int = sdl2.SDL_RENDERER_ACCELERATED):
         self.window = window
+        # Let SDL coalesce consecutive draws sharing the same state; must be
+        # set before the renderer is created
+        sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b"1")
         # Create SDL renderer
         try:
              self.renderer = sdl2.ext.Renderer(window, flags=flags)
@@ -40,6 +47,7 @@ class Renderer:
         self.vector_renderer = VectorRenderer(self.renderer, self.primitive_renderer)
         self.flex_renderer = FlexRenderer(self, self.primitive_renderer) # Pass self as proxy
         self.input_renderer = InputRenderer(self.primitive_renderer, self.text_renderer)
+        self.static_renderer = StaticRenderer(self, self.renderer, self.primitive_renderer)
 
         # State
         self._incremental_mode = False
@@ -47,12 +55,15 @@ class Renderer:
         self._last_window_size = window.size
         self._display_list_lock = threading.RLock()
         self._last_display_list: List[Dict[str, Any]] = []
+        # Sanitized copy of _last_display_list, built on the first request
+        self._last_display_dump: Optional[List[Dict[str, Any]]] = None
         self._prev_display_list: List[Dict[str, Any]] = []
         self._hit_list: List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]] = []
 
         # Caches managed by Renderer (Layout & Indexing)
         self._layout_cache: Dict[Tuple, Any] = {}
-        self._item_hash_cache: Dict[str, int] = {}
+        # id(item) -> (item, hash); holding the item keeps its id from being reused
+        self._item_hash_cache: Dict[int, Tuple[Dict[str, Any], int]] = {}
         self._spatial_index = SpatialIndex()
         self._display_list_hash = 0
 
@@ -68,19 +79,21 @@ class Renderer:
 
         self.clean_caches()
 
-    def clean_caches(self):
-        """Clear all caches."""
+    def clean_caches(self, keep_text_glyphs: bool = False):
+        """Clear all caches, optionally keeping the size-independent text glyphs."""
         self._layout_cache = {}
         self._item_hash_cache = {}
-        self.text_renderer.clear_caches()
+        self.text_renderer.clear_caches(keep_glyphs=keep_text_glyphs)
         self.image_renderer.clear_cache()
         self.vector_renderer.clear_cache()
         self.flex_renderer.clear_cache()
+        self.static_renderer.clear_cache()
         self._spatial_index.clear()
 
     def destroy(self) -> None:
         """Release SDL renderer resources. Call before SDL quit."""
         # Clear caches that may hold SDL resources (textures)
+        self.text_renderer.set_async_rasterization(False)
         self.clean_caches()
         # Destroy SDL renderer if it exists
         if self.renderer:
@@ -105,7 +118,15 @@ class Renderer:
 
     def get_last_display_list(self) -> List[Dict[str, Any]]:
         with self._display_list_lock:
-            return self._sanitize_list(self._last_display_list)
+            if self._last_display_dump is None:
+                self._last_display_dump = self._sanitize_list(self._last_display_list)
+            return self._last_display_dump
+
+    def _set_last_display_list(self, display_list: List[Dict[str, Any]]) -> None:
+        """Record the list being rendered, for the debug server."""
+        with self._display_list_lock:
+            self._last_display_list = display_list
+            self._last_display_dump = None
 
     def get_culling_stats(self) -> Dict[str, int]:
         return self._culling_stats.copy()
@@ -118,6 +139,27 @@ class Renderer:
         if not enabled:
             self._force_full_render = True
 
+    def has_pending_redraw(self) -> bool:
+        """Return True if the next frame must be drawn in full, e.g. after mark_dirty()."""
+        return self._force_full_render
+
+    def is_animating(self) -> bool:
+        """
+        Return True if the last frame drew content that changes with time.
+
+        A focused input's cursor blinks without any change to the display
+        list, so such a frame must be drawn again even if its list is not.
+        """
+        return self.input_renderer.animating
+
+    def content_hash(self, display_list: List[Dict[str, Any]]) -> int:
+        """Hash the content of a display list, nested items included."""
+        return hash(self._make_hashable(display_list))
+
+    def set_async_text(self, enabled: bool) -> None:
+        """Rasterize new text on a worker thread; it appears once ready."""
+        self.text_renderer.set_async_rasterization(enabled)
+
     def mark_dirty(self, rect: Tuple[int, int, int, int] = None) -> None:
         # Simplified: always force full render for now or track dirty regions
         if rect is None:
@@ -161,8 +203,9 @@ class Renderer:
             del self._perf_timers[name]
 
     def _get_layout_cache_key(self, item: Dict[str, Any], parent_rect: Tuple[int, int, int, int]) -> Tuple:
+        # Layouts are relative to the box, so only its size is part of the key
         children_hash = tuple(self._hash_item_cached(c) for c in item.get(core.KEY_CHILDREN, []))
-        return (self._hash_item_cached(item), parent_rect, children_hash)
+        return (self._hash_item_cached(item), parent_rect[2:], children_hash)
 
     def _make_hashable(self, value: Any) -> Any:
         # Re-implemented locally or use helper? It's specific to dict structure.
@@ -204,13 +247,19 @@ class Renderer:
         return hash(hash_structure(display_list))
 
     def _hash_item_cached(self, item: Dict[str, Any]) -> int:
-        item_id = item.get(core.KEY_ID)
-        if item_id and item_id in self._item_hash_cache:
-            return self._item_hash_cache[item_id]
+        """
+        Hash an item once per frame.
+
+        Keyed by the dict itself rather than its KEY_ID: items without an id
+        are cached too, and the previous frame's item with the same id keeps
+        its own hash for dirty-region comparison.
+        """
+        cached = self._item_hash_cache.get(id(item))
+        if cached is not None and cached[0] is item:
+            return cached[1]
 
         result = self._hash_item(item)
-        if item_id:
-            self._item_hash_cache[item_id] = result
+        self._item_hash_cache[id(item)] = (item, result)
         return result
 
     def _invalidate_hash_cache(self) -> None:
@@ -286,11 +335,18 @@ class Renderer:
     def _sanitize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         sanitized = {}
         for k, v in item.items():
-            if k == core.KEY_CHILDREN and isinstance(v, list): sanitized[k] = self._sanitize_list(v)
+            # Most values are plain numbers, strings and rect or color
+            # sequences: handle those before the isinstance chain.
+            value_type = type(v)
+            if value_type in _DUMP_SCALAR_TYPES: sanitized[k] = v
+            elif value_type is tuple or (value_type is list and k != core.KEY_CHILDREN): sanitized[k] = list(v)
+            elif k == core.KEY_CHILDREN and isinstance(v, list): sanitized[k] = self._sanitize_list(v)
             elif isinstance(v, (bytes, bytearray)): sanitized[k] = f"<bytes: {len(v)}>"
             elif callable(v): sanitized[k] = f"<callable: {v.__name__ if hasattr(v, '__name__') else 'anonymous'}>"
             elif isinstance(v, (tuple, list)): sanitized[k] = list(v)
             elif isinstance(v, (int, float, str, bool)) or v is None: sanitized[k] = v
+            # NumPy values and array.array: kept as numbers rather than their repr
+            elif hasattr(v, "tolist"): sanitized[k] = v.tolist()
             else: sanitized[k] = str(v)
         return sanitized
 
@@ -320,12 +376,16 @@ class Renderer:
         self._invalidate_hash_cache()
 
         if (width, height) != self._last_window_size:
-             self.clean_caches() # Includes invalidate hash cache
+             # Wrapped text is re-laid out, words are not re-rasterized
+             self.clean_caches(keep_text_glyphs=True) # Includes invalidate hash cache
              self._last_window_size = (width, height)
              self._force_full_render = True
 
         self._culling_stats = {"rendered": 0, "skipped": 0}
-        do_full_render = force_full or self._force_full_render or not self._incremental_mode
+        # Dirty regions only follow display list changes, not a blinking cursor
+        do_full_render = (force_full or self._force_full_render
+                          or not self._incremental_mode
+                          or self.input_renderer.animating)
         self._dirty_regions = []
 
         if not do_full_render:
@@ -349,8 +409,7 @@ class Renderer:
              self._force_full_render = False
 
         self._hit_list = []
-        with self._display_list_lock:
-            self._last_display_list = display_list
+        self._set_last_display_list(display_list)
 
         # Spatial Index (Simplified: always rebuild if changed)
         current_display_hash = self._compute_structural_hash(display_list)
@@ -361,10 +420,16 @@ class Renderer:
 
         self._prev_display_list = display_list
 
+        self.input_renderer.animating = False
         self._perf_start("render_items")
         for item in display_list:
             self._render_item(item, root_rect, root_viewport)
         self._perf_end("render_items")
+        self.static_renderer.end_frame()
+        self.text_renderer.end_frame()
+        # Text still rasterizing is drawn by the next frame, whatever changed
+        if self.text_renderer.has_pending_text():
+            self._force_full_render = True
 
         self.primitive_renderer.flush()
         sdl2.SDL_RenderSetClipRect(self.renderer.sdlrenderer, None)
@@ -406,6 +471,8 @@ class Renderer:
             self.input_renderer.render_input(item, rect)
         elif item_type == core.TYPE_RECT:
             self.primitive_renderer.draw_rect_primitive(item, rect)
+        elif item_type == core.TYPE_RECT_BATCH:
+            self.primitive_renderer.draw_rect_batch(item, rect, (0, 0, *self._last_window_size))
         elif item_type == core.TYPE_IMAGE:
             self.image_renderer.render_image(item, rect)
         elif item_type == core.TYPE_FLEXBOX:
@@ -431,6 +498,13 @@ class Renderer:
 
         self._culling_stats["rendered"] += 1
         self._hit_list.append((current_rect, item))
+        if item.get(core.KEY_STATIC):
+            self.static_renderer.render_static(item, current_rect)
+        else:
+            self._render_content(item, current_rect, viewport)
+
+    def _render_content(self, item: Dict[str, Any], current_rect: Tuple[int, int, int, int], viewport: Tuple[int, int, int, int] = None) -> None:
+        """Draw an item and its children at an already resolved rect."""
         item_type = item.get(core.KEY_TYPE)
 
         if item_type == core.TYPE_LAYER:
@@ -442,7 +516,7 @@ class Renderer:
         elif item_type == core.TYPE_HBOX:
             self._render_hbox(item, current_rect, viewport)
         # Delegate primitives and others
-        elif item_type in [core.TYPE_RECT, core.TYPE_TEXT, core.TYPE_IMAGE, core.TYPE_INPUT, core.TYPE_FLEXBOX, core.TYPE_VECTOR_GRAPHICS]:
+        elif item_type in [core.TYPE_RECT, core.TYPE_RECT_BATCH, core.TYPE_TEXT, core.TYPE_IMAGE, core.TYPE_INPUT, core.TYPE_FLEXBOX, core.TYPE_VECTOR_GRAPHICS]:
              self.render_item_direct(item, current_rect)
 
     # Legacy Layout Containers (VBox/HBox) kept in Renderer as orchestrators of their children
@@ -451,27 +525,46 @@ class Renderer:
         x, y, w, h = rect
         if item.get(core.KEY_COLOR): self.primitive_renderer.draw_rect_primitive(item, rect)
 
-        # Layout Caching Logic (Kept here as it's layout orchestration)
-        cache_key = self._get_layout_cache_key(item, rect)
-        cached_layout = self._layout_cache.get(cache_key)
-        if cached_layout:
-             self._layout_cache_stats["hits"] += 1
-             for c_rect, child in cached_layout:
-                 # Standard checks
-                 if viewport and c_rect[1] > viewport[1] + viewport[3]: break
-                 if viewport and c_rect[1] + c_rect[3] < viewport[1]: continue
-                 self._render_element_at(child, c_rect, viewport)
-             return
+        # Child rects are cached relative to the box, so scrolling it reuses the layout
+        layout = self._get_cached_layout(item, rect, self._layout_vbox)
+        for (cx, cy, cw, ch), child in layout:
+            c_rect = (x + cx, y + cy, cw, ch)
+            if viewport and c_rect[1] > viewport[1] + viewport[3]: break
+            if viewport and c_rect[1] + c_rect[3] < viewport[1]: continue
+            self._render_element_at(child, c_rect, viewport)
+
+    def _render_hbox(self, item: Dict[str, Any], rect: Tuple[int, int, int, int], viewport: Tuple[int, int, int, int] = None) -> None:
+        x, y, w, h = rect
+        if item.get(core.KEY_COLOR): self.primitive_renderer.draw_rect_primitive(item, rect)
+
+        layout = self._get_cached_layout(item, rect, self._layout_hbox)
+        for (cx, cy, cw, ch), child in layout:
+            c_rect = (x + cx, y + cy, cw, ch)
+            if viewport and c_rect[0] > viewport[0] + viewport[2]: break
+            if viewport and c_rect[0] + c_rect[2] < viewport[0]: continue
+            self._render_element_at(child, c_rect, viewport)
 
+    def _get_cached_layout(self, item: Dict[str, Any], rect: Tuple[int, int, int, int], layout_fn) -> List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]]:
+        """Return the (relative rect, child) layout of a box, computing it on a cache miss."""
+        cache_key = self._get_layout_cache_key(item, rect)
+        layout = self._layout_cache.get(cache_key)
+        if layout is not None:
+            self._layout_cache_stats["hits"] += 1
+            return layout
         self._layout_cache_stats["misses"] += 1
+        layout = layout_fn(item, rect[2], rect[3])
+        self._layout_cache[cache_key] = layout
+        return layout
+
+    def _layout_vbox(self, item: Dict[str, Any], w: int, h: int) -> List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]]:
+        """Stack the children of a VBox, with rects relative to the box origin."""
         raw_padding = item.get(core.KEY_PADDING, (0, 0, 0, 0))
         pt = self._resolve_val(raw_padding[0], h); pr = self._resolve_val(raw_padding[1], w)
         pb = self._resolve_val(raw_padding[2], h); pl = self._resolve_val(raw_padding[3], w)
 
-        cursor_y = y + pt
+        cursor_y = pt
         av_w = w - pr - pl; av_h = h - pt - pb
 
-        # First pass: compute layout for ALL children (for correct cache)
         layout_results = []
         for child in item.get(core.KEY_CHILDREN, []):
             raw_margin = child.get(core.KEY_MARGIN, (0, 0, 0, 0))
@@ -483,40 +576,17 @@ class Renderer:
             cw = self._resolve_val(cw_raw[2], av_w)
             ch = self._measure_item(child, cw, av_h)
 
-            c_rect = (x + pl + ml, cursor_y + mt, cw, ch)
-            layout_results.append((c_rect, child))
+            layout_results.append(((pl + ml, cursor_y + mt, cw, ch), child))
             cursor_y += mt + ch + mb
+        return layout_results
 
-        # Cache the complete layout
-        self._layout_cache[cache_key] = layout_results
-
-        # Second pass: render only visible children
-        for c_rect, child in layout_results:
-            if viewport and c_rect[1] > viewport[1] + viewport[3]: break
-            if viewport and c_rect[1] + c_rect[3] < viewport[1]: continue
-            self._render_element_at(child, c_rect, viewport)
-
-    def _render_hbox(self, item: Dict[str, Any], rect: Tuple[int, int, int, int], viewport: Tuple[int, int, int, int] = None) -> None:
-        # Similar simplification
-        x, y, w, h = rect
-        if item.get(core.KEY_COLOR): self.primitive_renderer.draw_rect_primitive(item, rect)
-
-        cache_key = self._get_layout_cache_key(item, rect)
-        cached_layout = self._layout_cache.get(cache_key)
-        if cached_layout:
-             self._layout_cache_stats["hits"] += 1
-             for c_rect, child in cached_layout:
-                 if viewport and c_rect[0] > viewport[0] + viewport[2]: break
-                 if viewport and c_rect[0] + c_rect[2] < viewport[0]: continue
-                 self._render_element_at(child, c_rect, viewport)
-             return
-
-        self._layout_cache_stats["misses"] += 1
+    def _layout_hbox(self, item: Dict[str, Any], w: int, h: int) -> List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]]:
+        """Line up the children of an HBox, with rects relative to the box origin."""
         raw_padding = item.get(core.KEY_PADDING, (0, 0, 0, 0))
         pt = self._resolve_val(raw_padding[0], h); pr = self._resolve_val(raw_padding[1], w)
         pb = self._resolve_val(raw_padding[2], h); pl = self._resolve_val(raw_padding[3], w)
 
-        cursor_x = x + pl
+        cursor_x = pl
         av_w = w - pr - pl; av_h = h - pt - pb
 
         layout_results = []
@@ -530,18 +600,9 @@ class Renderer:
             cw = self._measure_item_width(child, av_h) if cw_raw[2] == "auto" else self._resolve_val(cw_raw[2], av_w)
             ch = self._measure_item(child, cw, av_h)
 
-            c_rect = (cursor_x + ml, y + pt + mt, cw, ch)
-            layout_results.append((c_rect, child))
-
-            if viewport and (cursor_x + ml > viewport[0] + viewport[2]): break
-            if viewport and (cursor_x + ml + cw < viewport[0]):
-                cursor_x += ml + cw + mr
-                continue
-
-            self._render_element_at(child, c_rect, viewport)
+            layout_results.append(((cursor_x + ml, pt + mt, cw, ch), child))
             cursor_x += ml + cw + mr
-
-        self._layout_cache[cache_key] = layout_results
+        return layout_results
 
     def _render_element_at(self, item: Dict[str, Any], rect: Tuple[int, int, int, int], viewport: Tuple[int, int, int, int] = None) -> None:
         typ = item.get(core.KEY_TYPE)
@@ -596,6 +657,10 @@ class Renderer:
     def _measure_item_width(self, item: Dict[str, Any], available_width: int, available_height: int = 0) -> int:
         typ = item.get(core.KEY_TYPE)
         if typ == core.TYPE_TEXT:
+             if item.get(core.KEY_RUNS):
+                 return self.text_renderer.measure_runs_width(item[core.KEY_RUNS],
+                                        item.get(core.KEY_FONT),
+                                        item.get(core.KEY_FONT_SIZE, 16))
              return self.text_renderer.measure_text_width(item.get(core.KEY_TEXT, ""),
                                     item.get(core.KEY_FONT),
                                     item.get(core.KEY_FONT_SIZE, 16))
@@ -7,6 +7,14 @@ rendering by efficiently querying elements within viewport regions.
 
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from sdl_gui.window import spatial_kernels
+from sdl_gui.window.quadtree_soa import QuadTreeSoA
+
+# With Numba, a compiled linear scan over packed rectangles beats walking
+# the quadtree in Python, and the quadtree is not maintained at all; without
+# it the quadtree is used.
+USE_KERNELS = spatial_kernels.NUMBA_AVAILABLE
+
 
 class QuadTreeNode:
     """
@@ -185,8 +193,10 @@ class SpatialIndex:
     """
     Spatial index for efficient viewport queries and dirty tracking.
     
-    Uses a quadtree for O(log n) spatial queries and tracks dirty
-    elements for incremental rendering optimization.
+    Uses a quadtree (stored as flat arrays, see QuadTreeSoA) for O(log n)
+    spatial queries and tracks dirty elements for incremental rendering
+    optimization. With Numba, queries are instead a compiled O(n) scan of
+    the packed rectangles, repacked on the first query after a change.
     """
     
     def __init__(
@@ -203,9 +213,14 @@ class SpatialIndex:
         """
         self._bounds = bounds
         self._max_depth = max_depth
-        self._root = QuadTreeNode(bounds, max_depth=max_depth)
+        self._root = QuadTreeSoA(bounds, max_depth=max_depth)
         self._item_rects: Dict[str, Tuple[int, int, int, int]] = {}
         self._dirty_items: Set[str] = set()
+        # Packed copy of the rectangles for the compiled kernels,
+        # rebuilt lazily after any change.
+        self._packed_ids: Optional[List[str]] = None
+        self._packed: Optional[Tuple[Any, Any, Any, Any]] = None
+        self._packed_out: Any = None
         
         # Statistics
         self._stats: Dict[str, int] = {
@@ -225,12 +240,14 @@ class SpatialIndex:
             item_id: Unique identifier for the item.
             rect: Bounding rectangle (x, y, width, height).
         """
-        # Remove old entry if exists
-        if item_id in self._item_rects:
-            self._root.remove(item_id)
+        if not USE_KERNELS:
+            # Remove old entry if exists
+            if item_id in self._item_rects:
+                self._root.remove(item_id)
+            self._root.insert(item_id, rect)
         
         self._item_rects[item_id] = rect
-        self._root.insert(item_id, rect)
+        self._packed_ids = None
         self._stats["inserts"] += 1
     
     def remove(self, item_id: str) -> bool:
@@ -246,7 +263,9 @@ class SpatialIndex:
         if item_id in self._item_rects:
             del self._item_rects[item_id]
             self._dirty_items.discard(item_id)
-            self._root.remove(item_id)
+            if not USE_KERNELS:
+                self._root.remove(item_id)
+            self._packed_ids = None
             self._stats["removes"] += 1
             return True
         return False
@@ -261,10 +280,32 @@ class SpatialIndex:
         Returns:
             Set of item IDs intersecting the rectangle.
         """
-        result: Set[str] = set()
-        self._root.query(rect, result)
+        if USE_KERNELS:
+            result = self._query_packed(rect)
+        else:
+            result = set()
+            self._root.query(rect, result)
         self._stats["queries"] += 1
         return result
+
+    def _query_packed(self, rect: Tuple[int, int, int, int]) -> Set[str]:
+        """Query through the compiled kernel over the packed rectangles."""
+        if self._packed_ids is None:
+            self._pack()
+        x, y, w, h = rect
+        count = spatial_kernels.query_aabbs(*self._packed, x, y, x + w, y + h, self._packed_out)
+        ids = self._packed_ids
+        out = self._packed_out
+        return {ids[out[i]] for i in range(count)}
+
+    def _pack(self) -> None:
+        """Pack the rectangles within bounds, those a quadtree would hold."""
+        root = self._root
+        entries = [(item_id, rect) for item_id, rect in self._item_rects.items()
+                   if root._intersects(rect)]
+        self._packed_ids = [item_id for item_id, _ in entries]
+        self._packed = spatial_kernels.pack_aabbs(rect for _, rect in entries)
+        self._packed_out = spatial_kernels.new_index_buffer(len(entries))
     
     def mark_dirty(self, item_id: str) -> None:
         """
@@ -316,9 +357,10 @@ class SpatialIndex:
     
     def clear(self) -> None:
         """Clear all items from the index."""
-        self._root = QuadTreeNode(self._bounds, max_depth=self._max_depth)
+        self._root = QuadTreeSoA(self._bounds, max_depth=self._max_depth)
         self._item_rects.clear()
         self._dirty_items.clear()
+        self._packed_ids = None
     
     def rebuild(self, bounds: Tuple[int, int, int, int] = None) -> None:
         """
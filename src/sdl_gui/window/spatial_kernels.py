@@ -0,0 +1,70 @@
+"""
+Compiled geometry kernels for the spatial index.
+
+Rectangles are stored as flat structure-of-arrays (x0, y0, x1, y1 columns)
+so that Numba can scan them in a tight native loop. Numba and NumPy are
+optional: without them the kernels run as plain Python over array.array
+columns and callers should prefer the quadtree instead.
+"""
+
+from array import array
+from typing import Any, Callable, Iterable, Tuple, TypeVar
+
+# A packed column: a NumPy array, or an array.array without NumPy
+Column = Any
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]:
+        """No-op stand-in for numba.njit."""
+        def decorator(func: _F) -> _F:
+            return func
+        return decorator
+
+
+def pack_aabbs(
+    rects: Iterable[Tuple[Any, Any, Any, Any]],
+) -> Tuple[Column, Column, Column, Column]:
+    """Pack (x, y, w, h) rectangles into contiguous x0, y0, x1, y1 columns."""
+    x0, y0, x1, y1 = array("d"), array("d"), array("d"), array("d")
+    for x, y, w, h in rects:
+        x0.append(x)
+        y0.append(y)
+        x1.append(x + w)
+        y1.append(y + h)
+    if np is not None:
+        return (np.frombuffer(x0, dtype=np.float64), np.frombuffer(y0, dtype=np.float64),
+                np.frombuffer(x1, dtype=np.float64), np.frombuffer(y1, dtype=np.float64))
+    return x0, y0, x1, y1
+
+
+def new_index_buffer(size: int) -> Column:
+    """Allocate an output buffer for query_aabbs()."""
+    if np is not None:
+        return np.empty(size, dtype=np.int64)
+    return array("q", bytes(8 * size))
+
+
+@njit(cache=True)
+def query_aabbs(x0: Column, y0: Column, x1: Column, y1: Column,
+                qx0: float, qy0: float, qx1: float, qy1: float, out: Column) -> int:
+    """
+    Write into out the indices of the boxes overlapping the query box.
+
+    Boxes touching only by an edge do not overlap, as in QuadTreeNode.
+    Returns the number of indices written.
+    """
+    n = 0
+    for i in range(len(x0)):
+        if x1[i] > qx0 and x0[i] < qx1 and y1[i] > qy0 and y0[i] < qy1:
+            out[n] = i
+            n += 1
+    return n
@@ -1,6 +1,6 @@
 
 import ctypes
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 import sdl2
 import sdl2.ext
@@ -8,19 +8,35 @@ import sdl2.ext
 from sdl_gui import context, core
 from sdl_gui.debug.server import DebugServer
 from sdl_gui.window.debug import Debug
+from sdl_gui.window.display_list import DisplayList
 from sdl_gui.window.renderer import Renderer
 
+# SDL event types no widget consumes, for Window.ignore_unused_events()
+UNUSED_EVENT_TYPES = (
+    sdl2.SDL_JOYAXISMOTION, sdl2.SDL_JOYBALLMOTION, sdl2.SDL_JOYHATMOTION,
+    sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP,
+    sdl2.SDL_CONTROLLERAXISMOTION, sdl2.SDL_CONTROLLERBUTTONDOWN,
+    sdl2.SDL_CONTROLLERBUTTONUP,
+    sdl2.SDL_FINGERDOWN, sdl2.SDL_FINGERUP, sdl2.SDL_FINGERMOTION,
+    sdl2.SDL_DOLLARGESTURE, sdl2.SDL_MULTIGESTURE,
+    sdl2.SDL_DROPFILE, sdl2.SDL_DROPTEXT,
+    sdl2.SDL_TEXTEDITING, sdl2.SDL_SENSORUPDATE,
+)
+
 
 class Window:
     """SDL Window wrapper that delegates rendering and debug to sub-components."""
 
-    def __init__(self, title: str, width: int, height: int, debug: bool = False, renderer_flags: int = sdl2.SDL_RENDERER_ACCELERATED):
+    def __init__(self, title: str, width: int, height: int, debug: bool = False,
+                 renderer_flags: int = sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_PRESENTVSYNC,
+                 async_text: bool = False):
         sdl2.ext.init()
 
         self.window = sdl2.ext.Window(title, size=(width, height), flags=sdl2.SDL_WINDOW_RESIZABLE)
 
         # Sub-components
         self.renderer = Renderer(self.window, flags=renderer_flags)
+        self.renderer.set_async_text(async_text)
         self.debug_system = Debug(enabled=debug)
 
         # Debug Server
@@ -36,6 +52,30 @@ class Window:
         self.focused_element_id = None
         self.mouse_capture_id = None
 
+        # SDL events are drained into one reusable buffer and dispatched by type
+        self._event_buffer = (sdl2.SDL_Event * 64)()
+        self._event_handlers = {
+            sdl2.SDL_QUIT: self._handle_quit,
+            sdl2.SDL_MOUSEWHEEL: self._handle_scroll,
+            sdl2.SDL_MOUSEBUTTONDOWN: self._handle_click,
+            sdl2.SDL_MOUSEBUTTONUP: self._handle_mouse_up,
+            sdl2.SDL_MOUSEMOTION: self._handle_mouse_motion,
+            sdl2.SDL_TEXTINPUT: self._handle_text_input,
+            sdl2.SDL_KEYDOWN: self._handle_key_down,
+            sdl2.SDL_WINDOWEVENT: self._handle_window_event,
+        }
+        # Debug server actions, by the tag DebugServer queues them with
+        self._debug_action_handlers = {
+            "event": self._handle_debug_event,
+            "command": self._handle_debug_command,
+            "get_pixel": self._handle_debug_get_pixel,
+            "benchmark": self._handle_debug_benchmark,
+            "get_perf_stats": self._handle_debug_perf_stats,
+            "get_spatial_stats": self._handle_debug_spatial_stats,
+        }
+        # (window size and display list ids, content hash) of the last frame
+        self._last_frame = (None, None)
+
         sdl2.SDL_StartTextInput()
 
     def __enter__(self):
@@ -66,6 +106,19 @@ class Window:
         # Quit SDL
         sdl2.ext.quit()
 
+    def ignore_unused_events(self, text_input: bool = True,
+                             event_types: Iterable[int] = UNUSED_EVENT_TYPES) -> None:
+        """
+        Stop SDL from queuing event types no widget consumes.
+
+        Ignored events never reach the queue that SDL_PumpEvents fills
+        every frame. Pass text_input=False for a UI without text inputs.
+        """
+        for event_type in event_types:
+            sdl2.SDL_EventState(event_type, sdl2.SDL_IGNORE)
+        if not text_input:
+            sdl2.SDL_StopTextInput()
+
     def add_child(self, child: Any) -> None:
         """Allow adding children directly to window (e.g. for implicit context)."""
         if not hasattr(self, 'root_children'):
@@ -90,14 +143,22 @@ class Window:
         """Helper to measure text width, used for input processing."""
         return self.renderer.measure_text_width(text, font, size)
 
-    def render(self, display_list: List[Dict[str, Any]], force_full: bool = False) -> None:
+    def render(self, display_list: Union[List[Dict[str, Any]], DisplayList], force_full: bool = False) -> None:
         """
         Render the display list.
         
         Args:
-            display_list: The list of display items to render.
+            display_list: The list of display items to render, or a retained
+                DisplayList whose dirty entries are serialized first.
             force_full: If True, force a full render ignoring incremental mode.
         """
+        if isinstance(display_list, DisplayList):
+            display_list = display_list.build()
+
+        if not force_full and self._frame_unchanged(display_list):
+            # The window still shows this exact frame
+            return
+
         # Always do full clear - render_list handles partial clearing internally
         self.renderer.clear()
 
@@ -110,12 +171,34 @@ class Window:
 
         self.renderer.present()
 
+    def _frame_unchanged(self, display_list: List[Dict[str, Any]]) -> bool:
+        """
+        Return True if display_list would draw the frame last presented.
+
+        Lists of other dict objects, as produced by to_data() after any
+        change, are taken as changed without looking further. The same
+        objects may still have been edited in place, so their content is
+        hashed and compared with the previous frame's. A frame that drew
+        time-driven content (a blinking cursor) is never taken as unchanged.
+        """
+        if self.debug_system.enabled:
+            # The overlay changes on its own
+            return False
+        identity = (self.window.size, tuple(map(id, display_list)))
+        last_identity, last_hash = self._last_frame
+        content_hash = None
+        if identity == last_identity:
+            content_hash = self.renderer.content_hash(display_list)
+        self._last_frame = (identity, content_hash)
+        if self.renderer.has_pending_redraw() or self.renderer.is_animating():
+            return False
+        return content_hash is not None and content_hash == last_hash
+
     def get_ui_events(self) -> List[Dict[str, Any]]:
         """
         Process SDL events and translate them into UI events based on hit tests.
         Returns a list of high-level UI events.
         """
-        sdl_events = sdl2.ext.get_events()
         ui_events = []
 
         # Always emit Tick
@@ -123,83 +206,64 @@ class Window:
 
         # Process Debug Server Actions
         if self.debug_server:
+            action_handlers = self._debug_action_handlers
             for action_type, data in self.debug_server.get_pending_actions():
-                if action_type == "event":
-                    ui_events.append(data)
-                elif action_type == "get_pixel":
-                    # data is (x, y, res_queue)
-                    x, y, res_queue = data
-                    try:
-                        color = self.renderer.get_pixel(x, y)
-                        res_queue.put(color)
-                    except Exception as e:
-                        res_queue.put(e)
-                elif action_type == "benchmark":
-                    # data is (frames, res_queue)
-                    frames, res_queue = data
-                    try:
-                        result = self._run_benchmark(frames)
-                        res_queue.put(result)
-                    except Exception as e:
-                        res_queue.put(e)
-                elif action_type == "get_perf_stats":
-                    res_queue = data
-                    try:
-                        stats = self.renderer.get_perf_stats()
-                        res_queue.put(stats)
-                    except Exception as e:
-                        res_queue.put(e)
-                elif action_type == "command":
-                    val = data.get("action")
-                    if val == "quit":
-                        ui_events.append({"type": core.EVENT_QUIT})
-                    else:
-                        self._handle_debug_command(data, ui_events)
-
-        for event in sdl_events:
-            # Handle Quit
-            if event.type == sdl2.SDL_QUIT:
-                ui_events.append({"type": core.EVENT_QUIT})
-
-            # Handle Scroll
-            elif event.type == sdl2.SDL_MOUSEWHEEL:
-                self._handle_scroll(event, ui_events)
-
-            # Handle Click (Down)
-            elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                self._handle_click(event, ui_events)
-
-            # Handle Mouse Up
-            elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                self._handle_mouse_up(event, ui_events)
-
-            # Handle Mouse Motion
-            elif event.type == sdl2.SDL_MOUSEMOTION:
-                self._handle_mouse_motion(event, ui_events)
-
-            # Handle Text Input
-            elif event.type == sdl2.SDL_TEXTINPUT:
-                if self.focused_element_id:
-                     ui_events.append({
-                         "type": core.EVENT_TEXT_INPUT,
-                         "target": self.focused_element_id,
-                         "text": event.text.text.decode('utf-8')
-                     })
-
-            # Handle Key Down
-            elif event.type == sdl2.SDL_KEYDOWN:
-                if self.focused_element_id:
-                    ui_events.append({
-                        "type": core.EVENT_KEY_DOWN,
-                        "target": self.focused_element_id,
-                        "key_sym": event.key.keysym.sym,
-                        "mod": event.key.keysym.mod
-                    })
+                handler = action_handlers.get(action_type)
+                if handler:
+                    handler(data, ui_events)
+
+        handlers = self._event_handlers
+        for event in self._drain_sdl_events():
+            handler = handlers.get(event.type)
+            if handler:
+                handler(event, ui_events)
 
         return ui_events
 
 
 
+    def _drain_sdl_events(self) -> Iterator[Any]:
+        """
+        Yield the pending SDL events, read into the reusable event buffer.
+
+        An event is only valid until the next one is requested: a full
+        buffer is refilled in place.
+        """
+        sdl2.SDL_PumpEvents()
+        buffer = self._event_buffer
+        while True:
+            count = sdl2.SDL_PeepEvents(buffer, len(buffer), sdl2.SDL_GETEVENT,
+                                        sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+            for i in range(count):
+                yield buffer[i]
+            if count < len(buffer):
+                return
+
+    def _handle_quit(self, event, ui_events):
+        ui_events.append({"type": core.EVENT_QUIT})
+
+    def _handle_window_event(self, event, ui_events):
+        # Uncovered window content must be drawn again, even if unchanged
+        if event.window.event == sdl2.SDL_WINDOWEVENT_EXPOSED:
+            self.renderer.mark_dirty()
+
+    def _handle_text_input(self, event, ui_events):
+        if self.focused_element_id:
+            ui_events.append({
+                "type": core.EVENT_TEXT_INPUT,
+                "target": self.focused_element_id,
+                "text": event.text.text.decode('utf-8')
+            })
+
+    def _handle_key_down(self, event, ui_events):
+        if self.focused_element_id:
+            ui_events.append({
+                "type": core.EVENT_KEY_DOWN,
+                "target": self.focused_element_id,
+                "key_sym": event.key.keysym.sym,
+                "mod": event.key.keysym.mod
+            })
+
     def _handle_scroll(self, event, ui_events):
         x, y = ctypes.c_int(0), ctypes.c_int(0)
         sdl2.mouse.SDL_GetMouseState(ctypes.byref(x), ctypes.byref(y))
@@ -341,10 +405,37 @@ class Window:
                     return item
         return None
 
+    def _handle_debug_event(self, data: Dict[str, Any], ui_events: List[Dict[str, Any]]) -> None:
+        ui_events.append(data)
+
+    def _handle_debug_get_pixel(self, data: Tuple[int, int, Any], ui_events: List[Dict[str, Any]]) -> None:
+        x, y, res_queue = data
+        self._reply_debug(res_queue, lambda: self.renderer.get_pixel(x, y))
+
+    def _handle_debug_benchmark(self, data: Tuple[int, Any], ui_events: List[Dict[str, Any]]) -> None:
+        frames, res_queue = data
+        self._reply_debug(res_queue, lambda: self._run_benchmark(frames))
+
+    def _handle_debug_perf_stats(self, res_queue: Any, ui_events: List[Dict[str, Any]]) -> None:
+        self._reply_debug(res_queue, self.renderer.get_perf_stats)
+
+    def _handle_debug_spatial_stats(self, res_queue: Any, ui_events: List[Dict[str, Any]]) -> None:
+        self._reply_debug(res_queue, self.renderer.get_spatial_stats)
+
+    @staticmethod
+    def _reply_debug(res_queue: Any, compute: Callable[[], Any]) -> None:
+        """Answer a debug request waiting on res_queue with a result or the error raised."""
+        try:
+            res_queue.put(compute())
+        except Exception as e:
+            res_queue.put(e)
+
     def _handle_debug_command(self, data: Dict[str, Any], ui_events: List[Dict[str, Any]]) -> None:
         """Handle debug commands that affect the window state."""
         action = data.get("action")
-        if action == "resize":
+        if action == "quit":
+            ui_events.append({"type": core.EVENT_QUIT})
+        elif action == "resize":
              w = data.get("width")
              h = data.get("height")
              if w and h:
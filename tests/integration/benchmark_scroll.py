@@ -35,9 +35,9 @@ class TestBenchmarkScroll(unittest.TestCase):
 
             # Content Layer: Pre-populate with items.
             with ScrollableLayer(0, 50, "100%", 750, id="feed") as scroll_layer:
-                with VBox(0, 0, "100%", "auto", padding=(0, 10, 0, 10)) as content_vbox:
+                with VBox(0, 0, "100%", "auto", padding=(0, 10, 0, 10)):
                     for i in range(50):
-                       content_vbox.add_child(create_post_card(i))
+                       create_post_card(i) # Implicitly adds to the VBox
                        
             
             running = True
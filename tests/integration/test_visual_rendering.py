@@ -80,5 +80,32 @@ class TestVisualRendering(unittest.TestCase):
         # Clean up SDL resources
         window.close()
 
+    def test_batched_fill_stays_below_later_items(self):
+        """A queued solid fill must not be drawn over the border and text after it."""
+        window = Window("Visual Test", 200, 100, renderer_flags=sdl2.SDL_RENDERER_SOFTWARE)
+        display_list = [
+            {
+                core.KEY_TYPE: core.TYPE_RECT,
+                core.KEY_RECT: [0, 0, 200, 100],
+                core.KEY_COLOR: (0, 0, 255, 255),
+                core.KEY_BORDER_WIDTH: 1,
+                core.KEY_BORDER_COLOR: (255, 255, 255, 255)
+            },
+            {
+                core.KEY_TYPE: core.TYPE_TEXT,
+                core.KEY_RECT: [10, 10, 180, 80],
+                core.KEY_TEXT: "\u2588\u2588\u2588",
+                core.KEY_FONT_SIZE: 40,
+                core.KEY_COLOR: (255, 0, 0, 255)
+            }
+        ]
+
+        window.render(display_list)
+
+        self.assertEqual(window.renderer.get_pixel(0, 50), (255, 255, 255, 255))
+        self.assertEqual(window.renderer.get_pixel(20, 30), (255, 0, 0, 255))
+        self.assertEqual(window.renderer.get_pixel(190, 50), (0, 0, 255, 255))
+        window.close()
+
 if __name__ == '__main__':
     unittest.main()
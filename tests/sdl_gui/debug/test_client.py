@@ -49,6 +49,31 @@ class TestDebugClientIntegration(unittest.TestCase):
         self.assertEqual(payload["action"], "test_cmd")
         self.assertEqual(payload["foo"], "bar")
 
+    def test_send_commands_pipelined(self):
+        self.client.connect()
+        resps = self.client.send_commands([
+            {"action": "first"},
+            {"action": "second", "foo": "bar"},
+        ])
+        self.assertEqual([r.get("status") for r in resps], ["ok", "ok"])
+
+        actions = self.server.get_pending_actions()
+        self.assertEqual([p["action"] for _, p in actions], ["first", "second"])
+        # The connection is still usable after a pipelined exchange
+        self.assertEqual(self.client.send_command("third").get("status"), "ok")
+
+    def test_recv_response_keeps_bytes_after_newline(self):
+        # Two responses arriving in the same packet are returned one by one
+        local, remote = socket.socketpair()
+        self.client.sock = local
+        self.client._rfile = local.makefile('rb')
+        try:
+            remote.sendall(b'{"status": "ok", "n": 1}\n{"status": "ok", "n": 2}\n')
+            self.assertEqual(self.client._recv_response(), '{"status": "ok", "n": 1}')
+            self.assertEqual(self.client._recv_response(), '{"status": "ok", "n": 2}')
+        finally:
+            remote.close()
+
     def test_send_event(self):
         self.client.connect()
         resp = self.client.send_event("click", x=10, y=20)
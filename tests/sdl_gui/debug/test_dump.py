@@ -2,6 +2,7 @@
 import json
 import socket
 import unittest
+from array import array
 from unittest.mock import MagicMock, patch
 
 from sdl_gui import core
@@ -51,6 +52,33 @@ class TestDebugDump(unittest.TestCase):
         json_str = json.dumps(sanitized)
         self.assertIsInstance(json_str, str)
 
+    @patch("sdl_gui.window.renderer.sdl2.ext")
+    @patch("sdl_gui.rendering.text_renderer.sdlttf")
+    def test_sanitization_keeps_array_values_numeric(self, mock_ttf, mock_rend_ext):
+        """Array values (NumPy, array.array) are dumped as lists of numbers."""
+        renderer = Renderer(MagicMock())
+
+        sanitized = renderer._sanitize_item({core.KEY_TYPE: core.TYPE_RECT, "points": array("i", [1, 2, 3])})
+
+        self.assertEqual(sanitized["points"], [1, 2, 3])
+        self.assertEqual(sanitized[core.KEY_TYPE], core.TYPE_RECT)
+
+    @patch("sdl_gui.window.renderer.sdl2.ext")
+    @patch("sdl_gui.rendering.text_renderer.sdlttf")
+    def test_dump_is_sanitized_once_per_frame(self, mock_ttf, mock_rend_ext):
+        """Repeated dumps of one frame share a copy; a new frame is sanitized again."""
+        renderer = Renderer(MagicMock())
+        rect = {core.KEY_TYPE: core.TYPE_RECT, core.KEY_COLOR: (255, 0, 0, 255)}
+
+        renderer._set_last_display_list([rect])
+        first = renderer.get_last_display_list()
+        self.assertIs(renderer.get_last_display_list(), first)
+
+        renderer._set_last_display_list([dict(rect, **{core.KEY_COLOR: (0, 255, 0, 255)})])
+        second = renderer.get_last_display_list()
+        self.assertIsNot(second, first)
+        self.assertEqual(second[0][core.KEY_COLOR], [0, 255, 0, 255])
+
     def test_debug_server_dump_command(self):
         """Test that DebugServer handles dump_display_list correctly."""
         server = DebugServer(port=9999)
@@ -62,10 +90,14 @@ class TestDebugDump(unittest.TestCase):
         
         # Simulate dump command
         cmd_data = json.dumps({"type": "dump_display_list"}).encode('utf-8') + b'\n'
-        mock_conn.recv.side_effect = [cmd_data, b'']
+
+        def recv_into(view):
+            view[:len(cmd_data)] = cmd_data
+            return len(cmd_data)
+        mock_conn.recv_into.side_effect = recv_into
         
         server.running = True
-        server._handle_client(mock_conn)
+        server._read_client(mock_conn, bytearray())
         
         # Verify provider was called
         server.display_list_provider.assert_called_once()
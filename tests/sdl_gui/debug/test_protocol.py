@@ -0,0 +1,22 @@
+import unittest
+
+from sdl_gui.debug.protocol import DecodeError, decode_message, encode_message
+
+
+class TestProtocol(unittest.TestCase):
+    def test_round_trip_is_one_line(self):
+        payload = {"type": "command", "action": "type", "text": "two\nlines"}
+        line = encode_message(payload)
+
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(decode_message(line), payload)
+        self.assertEqual(decode_message(line.decode("utf-8").strip()), payload)
+
+    def test_invalid_line_raises_decode_error(self):
+        with self.assertRaises(DecodeError):
+            decode_message(b"invalid json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,25 @@
 
 import json
 import socket
+import threading
 import unittest
-from unittest.mock import MagicMock
+from queue import Empty
+from unittest.mock import MagicMock, patch
 
-from sdl_gui.debug.server import DebugServer
+from sdl_gui.debug.client import DebugClient
+from sdl_gui.debug.protocol import encode_message
+from sdl_gui.debug.server import DebugServer, ResultSlot
+
+
+def recv_chunks(chunks):
+    """Return a recv_into side effect delivering each chunk in turn."""
+    chunks = iter(chunks)
+
+    def recv_into(view):
+        chunk = next(chunks)
+        view[:len(chunk)] = chunk
+        return len(chunk)
+    return recv_into
 
 
 class TestDebugServer(unittest.TestCase):
@@ -12,12 +27,23 @@ class TestDebugServer(unittest.TestCase):
     def setUp(self):
         self.mock_socket = MagicMock()
         self.mock_socket_factory = MagicMock(return_value=self.mock_socket)
-        # Default accept behavior: timeout so the serving loop just spins quietly
-        self.mock_socket.accept.side_effect = socket.timeout
+        # A real descriptor that never becomes readable, so the serving loop just waits
+        self._idle_fd, self._idle_peer = socket.socketpair()
+        self.mock_socket.fileno.return_value = self._idle_fd.fileno()
         self.server = DebugServer(port=9999, socket_factory=self.mock_socket_factory)
 
     def tearDown(self):
         self.server.stop()
+        if self.server.thread:
+            self.server.thread.join(timeout=2.0)
+        self._idle_fd.close()
+        self._idle_peer.close()
+
+    def _serve(self, conn):
+        """Feed a client to the server until it disconnects."""
+        buffer = bytearray()
+        while self.server._read_client(conn, buffer):
+            pass
 
     def test_init(self):
         """Test server initialization."""
@@ -47,10 +73,10 @@ class TestDebugServer(unittest.TestCase):
 
         # Simulate incoming data: valid command then close
         cmd_data = json.dumps({"type": "command", "action": "test_cmd"}).encode('utf-8') + b'\n'
-        mock_conn.recv.side_effect = [cmd_data, b'']
+        mock_conn.recv_into.side_effect = recv_chunks([cmd_data, b''])
 
         self.server.running = True
-        self.server._handle_client(mock_conn)
+        self._serve(mock_conn)
 
         # Verify queue
         self.assertFalse(self.server.command_queue.empty())
@@ -58,9 +84,10 @@ class TestDebugServer(unittest.TestCase):
         self.assertEqual(cmd_type, "command")
         self.assertEqual(data["action"], "test_cmd")
 
-        # Check response
-        expected_resp = json.dumps({"status": "ok"}).encode('utf-8') + b'\n'
-        mock_conn.sendall.assert_called_with(expected_resp)
+        # Check response (compared decoded: orjson and json space differently)
+        sent = mock_conn.sendall.call_args.args[0]
+        self.assertTrue(sent.endswith(b'\n'))
+        self.assertEqual(json.loads(sent), {"status": "ok"})
 
     def test_handle_client_event(self):
         """Test handling a valid event from a client."""
@@ -69,32 +96,74 @@ class TestDebugServer(unittest.TestCase):
 
         event_payload = {"type": "event", "event": {"type": "click", "x": 10}}
         data = json.dumps(event_payload).encode('utf-8') + b'\n'
-        mock_conn.recv.side_effect = [data, b'']
+        mock_conn.recv_into.side_effect = recv_chunks([data, b''])
 
         self.server.running = True
-        self.server._handle_client(mock_conn)
+        self._serve(mock_conn)
 
         cmd_type, data = self.server.command_queue.get()
         self.assertEqual(cmd_type, "event")
         self.assertEqual(data["type"], "click")
 
+    def test_handle_client_split_and_pipelined_lines(self):
+        """Messages split across chunks or sharing one are all processed in order."""
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value = mock_conn
+
+        lines = b"".join(
+            json.dumps({"type": "command", "action": f"cmd{i}"}).encode('utf-8') + b'\n'
+            for i in range(3)
+        )
+        mock_conn.recv_into.side_effect = recv_chunks([lines[:10], lines[10:], b''])
+
+        self.server.running = True
+        self._serve(mock_conn)
+
+        actions = [self.server.command_queue.get()[1]["action"] for _ in range(3)]
+        self.assertEqual(actions, ["cmd0", "cmd1", "cmd2"])
+        self.assertEqual(mock_conn.sendall.call_count, 3)
+
+    def test_handle_client_byte_at_a_time(self):
+        """A message received one byte per recv is processed once complete."""
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value = mock_conn
+
+        line = json.dumps({"type": "command", "action": "slow"}).encode('utf-8') + b'\n'
+        mock_conn.recv_into.side_effect = recv_chunks([line[i:i + 1] for i in range(len(line))] + [b''])
+
+        self.server.running = True
+        self._serve(mock_conn)
+
+        self.assertEqual(self.server.command_queue.get()[1]["action"], "slow")
+        self.assertTrue(self.server.command_queue.empty())
+
     def test_handle_invalid_json(self):
         """Test handling invalid JSON."""
         mock_conn = MagicMock()
         mock_conn.__enter__.return_value = mock_conn
 
-        mock_conn.recv.side_effect = [b"invalid json\n", b'']
+        mock_conn.recv_into.side_effect = recv_chunks([b"invalid json\n", b''])
 
         self.server.running = True
-        self.server._handle_client(mock_conn)
+        self._serve(mock_conn)
 
         self.assertTrue(self.server.command_queue.empty())
 
         # Check error response
-        expected_resp = json.dumps({"status": "error", "message": "Invalid JSON"}).encode('utf-8') + b'\n'
-        # Note: the exact error message might vary depending on impl, checking generic "error" status is safer or exact match if known.
-        # My impl says: self._send_response(conn, "error", "Invalid JSON")
-        mock_conn.sendall.assert_called_with(expected_resp)
+        sent = mock_conn.sendall.call_args.args[0]
+        self.assertEqual(json.loads(sent), {"status": "error", "message": "Invalid JSON"})
+
+    def test_fixed_responses_encoded_once(self):
+        """Repeated acks reuse one encoded message; data responses are encoded each time."""
+        conn = MagicMock()
+        with patch('sdl_gui.debug.server.encode_message', wraps=encode_message) as encode:
+            with patch.dict('sdl_gui.debug.server._FIXED_RESPONSES', clear=True):
+                for _ in range(3):
+                    self.server._send_response(conn, "ok")
+                self.server._send_response(conn, "ok", data=[1])
+        self.assertEqual(encode.call_count, 2)
+        self.assertEqual(json.loads(conn.sendall.call_args_list[0].args[0]), {"status": "ok"})
+        self.assertEqual(json.loads(conn.sendall.call_args.args[0]), {"status": "ok", "data": [1]})
 
     def test_get_pending_actions(self):
         """Test retrieving pending actions."""
@@ -107,5 +176,81 @@ class TestDebugServer(unittest.TestCase):
         self.assertEqual(actions[1][0], "event")
         self.assertTrue(self.server.command_queue.empty())
 
+    def test_get_pending_actions_when_empty(self):
+        """An empty queue yields no actions, and the queue stays usable after a drain."""
+        self.assertEqual(self.server.get_pending_actions(), [])
+
+        self.server.command_queue.put(("command", {"a": 1}))
+        self.server.get_pending_actions()
+        self.server.command_queue.put(("event", {"b": 2}))
+        self.assertEqual(self.server.get_pending_actions(), [("event", {"b": 2})])
+
+
+class TestResultSlot(unittest.TestCase):
+    """The one-shot result channel used for main-thread requests."""
+
+    def test_result_from_another_thread(self):
+        slot = ResultSlot()
+        threading.Timer(0.01, slot.put, args=((1, 2, 3, 255),)).start()
+        self.assertEqual(slot.get(timeout=2.0), (1, 2, 3, 255))
+
+    def test_timeout_raises_empty(self):
+        with self.assertRaises(Empty):
+            ResultSlot().get(timeout=0.01)
+
+
+class TestDebugServerSockets(unittest.TestCase):
+    """Serving real sockets from the selector loop."""
+
+    def setUp(self):
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+        self.server = DebugServer(port=port)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.server.thread.join(timeout=2.0)
+
+    def test_clients_served_concurrently(self):
+        """A second client is answered while the first stays connected."""
+        clients = [socket.create_connection(('127.0.0.1', self.server.port), timeout=2.0)
+                   for _ in range(2)]
+        try:
+            for i, client in enumerate(reversed(clients)):
+                client.sendall(json.dumps({"type": "command", "action": f"c{i}"}).encode('utf-8') + b'\n')
+                self.assertEqual(json.loads(client.makefile('rb').readline()), {"status": "ok"})
+        finally:
+            for client in clients:
+                client.close()
+        self.assertEqual([a[1]["action"] for a in self.server.get_pending_actions()], ["c0", "c1"])
+
+    def test_stop_ends_thread_with_client_connected(self):
+        """stop() is noticed even while a client is connected but idle."""
+        client = socket.create_connection(('127.0.0.1', self.server.port), timeout=2.0)
+        try:
+            self.server.stop()
+            self.server.thread.join(timeout=2.0)
+            self.assertFalse(self.server.thread.is_alive())
+        finally:
+            client.close()
+
+    def test_events_without_acks(self):
+        """After a hello without acks, events get no reply but commands still do."""
+        client = DebugClient(port=self.server.port)
+        client.connect()
+        try:
+            self.assertEqual(client.set_event_acks(False), {"status": "ok"})
+            for x in range(3):
+                self.assertIsNone(client.send_event("click", x=x))
+            # The next line read is the command's reply, not an event ack
+            self.assertEqual(client.send_command("noop"), {"status": "ok"})
+        finally:
+            client.close()
+        actions = self.server.get_pending_actions()
+        self.assertEqual([a[0] for a in actions], ["event"] * 3 + ["command"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,11 @@
+import copy
+import gc
 import unittest
+from unittest import mock
+
+from sdl_gui.layout_engine import flex_kernels
+from sdl_gui.layout_engine import node as node_module
+from sdl_gui.layout_engine import style as style_module
 from sdl_gui.layout_engine.definitions import FlexDirection, JustifyContent, AlignItems
 from sdl_gui.layout_engine.style import FlexStyle
 from sdl_gui.layout_engine.node import FlexNode
@@ -96,5 +103,299 @@ class TestFlexNode(unittest.TestCase):
         self.assertEqual(child1.layout_rect, (0, 0, 100, 20))
         self.assertEqual(child2.layout_rect, (0, 20, 100, 30))
 
+    def test_auto_child_measured_once_per_pass(self):
+        """An auto-sized child is measured once when its parent prepares the line."""
+        calls = []
+        root = FlexNode(style=FlexStyle(width=100, height=100, direction=FlexDirection.ROW))
+        leaf = FlexNode(style=FlexStyle())
+        leaf.measure_func = lambda w, h: calls.append((w, h)) or (30, 10)
+        root.add_child(leaf)
+
+        root.calculate_layout(100, 100)
+
+        # The same measurement gives both its flex basis and its cross size
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(leaf.layout_rect[2:], (30, 100))  # Stretched
+
+    def test_dimensions_reparsed_on_assignment(self):
+        """Percentages assigned after construction are used by the next layout."""
+        root = FlexNode(style=FlexStyle(width=200, height=100, direction=FlexDirection.ROW))
+        child = FlexNode(style=FlexStyle(width=80, height=20))
+        root.add_child(child)
+
+        child.style.width = "25%"
+        root.calculate_layout(200, 100)
+        self.assertEqual(child.layout_rect, (0, 0, 50, 20))
+
+        child.style.width = "auto"
+        self.assertIsNone(child.style.width_dim)
+
+    def test_cross_size_forms(self):
+        """A plain 0 cross size stretches; percentages and other strings are resolved."""
+        root = FlexNode(style=FlexStyle(width=100, height=80, direction=FlexDirection.ROW))
+        heights = [0, "50%", "0%", "bad", None]
+        children = [FlexNode(style=FlexStyle(width=10, height=h)) for h in heights]
+        for child in children:
+            root.add_child(child)
+        root.calculate_layout(100, 80)
+        self.assertEqual([c.layout_rect[3] for c in children], [80, 40, 0, 0, 80])
+
+    def test_direction_change_switches_main_axis(self):
+        """Assigning a new direction is picked up by the next layout."""
+        root = FlexNode(style=FlexStyle(width=100, height=100, direction=FlexDirection.ROW))
+        child1 = FlexNode(style=FlexStyle(width=50, height=20))
+        child2 = FlexNode(style=FlexStyle(width=50, height=20))
+        root.add_child(child1)
+        root.add_child(child2)
+
+        root.style.direction = FlexDirection.COLUMN
+        root.calculate_layout(100, 100)
+
+        self.assertFalse(root.style.is_row)
+        self.assertEqual(child2.layout_rect, (0, 20, 50, 20))
+
+    def test_justify_and_align_positions(self):
+        """Each justify_content and align_items value places two 10px children in 100px."""
+        expected = {
+            JustifyContent.FLEX_START: [0, 10],
+            JustifyContent.CENTER: [40, 50],
+            JustifyContent.FLEX_END: [80, 90],
+            JustifyContent.SPACE_BETWEEN: [0, 90],
+            JustifyContent.SPACE_AROUND: [20, 70],
+            JustifyContent.SPACE_EVENLY: [26, 63],
+        }
+        aligns = {AlignItems.FLEX_START: 0, AlignItems.CENTER: 45, AlignItems.FLEX_END: 90}
+        for (justify, xs), (align, y) in zip(expected.items(), list(aligns.items()) * 2):
+            root = FlexNode(style=FlexStyle(width=100, height=100, direction=FlexDirection.ROW,
+                                            justify_content=justify, align_items=align))
+            children = [FlexNode(style=FlexStyle(width=10, height=10)) for _ in range(2)]
+            for child in children:
+                root.add_child(child)
+            root.calculate_layout(100, 100)
+            self.assertEqual([c.layout_rect[:2] for c in children], [(x, y) for x in xs], justify)
+
+    def test_default_styles_are_independent(self):
+        """Nodes built without a style get equal but separate default styles."""
+        first, second = FlexNode(), FlexNode()
+        self.assertEqual(first.style, FlexStyle())
+        self.assertIsNot(first.style, second.style)
+
+        first.style.width = 30
+        first.style.direction = FlexDirection.COLUMN
+        self.assertEqual(first.style.width_dim, (None, 30))
+        self.assertFalse(first.style.is_row)
+        self.assertIsNone(second.style.width_dim)
+        self.assertTrue(second.style.is_row)
+        # Derived fields stay out of the repr
+        self.assertNotIn("is_row", repr(second.style))
+        nodes = style_module._STYLE_NODES[id(second.style)]
+        self.assertEqual(list(nodes), [second])
+
+    def test_style_copies_do_not_share_nodes(self):
+        """Copies of a style do not share its nodes, which it does not keep alive."""
+        node = FlexNode(style=FlexStyle(width=10, height=10))
+        node.calculate_layout(100, 100)
+        clone = copy.copy(node.style)
+        clone.width = 50
+        self.assertIsNotNone(node._layout_key)
+        node.style.width = 50
+        self.assertIsNone(node._layout_key)
+
+        style = node.style
+        del node
+        gc.collect()
+        self.assertEqual(len(style_module._STYLE_NODES[id(style)]), 0)
+
+    def test_margins_follow_axes(self):
+        """Each direction reads the main and cross margins from its own edges."""
+        second_rects = {FlexDirection.ROW: (16, 0, 10, 20), FlexDirection.COLUMN: (0, 24, 10, 20)}
+        for direction, second_rect in second_rects.items():
+            root = FlexNode(style=FlexStyle(width=100, height=100, direction=direction,
+                                            align_items=AlignItems.FLEX_START))
+            first = FlexNode(style=FlexStyle(width=10, height=20, margin=(1, 2, 3, 4)))
+            second = FlexNode(style=FlexStyle(width=10, height=20))
+            root.add_child(first)
+            root.add_child(second)
+            root.calculate_layout(100, 100)
+
+            self.assertEqual(first.layout_rect, (4, 1, 10, 20))
+            self.assertEqual(second.layout_rect, second_rect)
+
+    def test_grow_change_picked_up_after_layout(self):
+        """Children made flexible after a layout share the free space on the next one."""
+        root = FlexNode(style=FlexStyle(width=100, height=20, direction=FlexDirection.ROW))
+        children = [FlexNode(style=FlexStyle(width=10, height=20)) for _ in range(3)]
+        for child in children:
+            root.add_child(child)
+        root.calculate_layout(100, 20)
+        self.assertEqual([c.layout_rect[2] for c in children], [10, 10, 10])
+
+        children[1].style.grow = 1
+        children[2].style.grow = 1
+        root.calculate_layout(100, 20)
+        self.assertEqual([c.layout_rect[2] for c in children], [10, 45, 45])
+
+    def test_container_measure_reused_until_style_changes(self):
+        """A container's measured size is cached per available size until a style changes."""
+        calls = []
+        box = FlexNode(style=FlexStyle(direction=FlexDirection.COLUMN))
+        leaf = FlexNode(style=FlexStyle())
+        leaf.measure_func = lambda w, h: calls.append((w, h)) or (30, 10)
+        box.add_child(leaf)
+
+        self.assertEqual(box.measure(100, 100), (30, 10))
+        self.assertEqual(box.measure(100, 100), (30, 10))
+        self.assertEqual(len(calls), 1)
+
+        box.measure(200, 100)  # Another available size is measured again
+        self.assertEqual(len(calls), 2)
+
+        leaf.style.margin = (5, 5, 5, 5)
+        self.assertEqual(box.measure(100, 100), (40, 20))
+        self.assertEqual(len(calls), 3)
+
+    def test_auto_main_size_follows_margin_changes(self):
+        """The gaps and margins summed for an auto main size are redone after a margin change."""
+        column = FlexNode(style=FlexStyle(width=50, direction=FlexDirection.COLUMN, gap=4))
+        leaves = [FlexNode(style=FlexStyle(height=10, margin=(1, 0, 2, 0))) for _ in range(3)]
+        for leaf in leaves:
+            column.add_child(leaf)
+        column.calculate_layout(100, 100)
+        self.assertEqual(column.layout_rect[3], 3 * 13 + 2 * 4)
+
+        leaves[0].style.margin = (5, 0, 5, 0)
+        column.calculate_layout(100, 100)
+        self.assertEqual(column.layout_rect[3], 20 + 2 * 13 + 2 * 4)
+        self.assertEqual(leaves[1].layout_rect[1], 20 + 4 + 1)
+
+    def test_sized_child_with_basis_not_measured(self):
+        """A child with a basis and a set cross size is placed without measuring its subtree."""
+        calls = []
+        root = FlexNode(style=FlexStyle(width=200, height=100, direction=FlexDirection.ROW))
+        box = FlexNode(style=FlexStyle(basis=80, height=40, padding=(2, 0, 3, 0), direction=FlexDirection.COLUMN))
+        leaf = FlexNode(style=FlexStyle())
+        leaf.measure_func = lambda w, h: calls.append((w, h)) or (500, 10)
+        box.add_child(leaf)
+        root.add_child(box)
+
+        root.calculate_layout(200, 100)
+        self.assertEqual(box.layout_rect, (0, 0, 80, 40))
+        # Measured once, by the box laying out its own children
+        self.assertEqual(calls, [(80, 35)])
+
+    def test_measure_does_not_lay_out(self):
+        """Measuring a container sizes it without positioning anything."""
+        box = FlexNode(style=FlexStyle(direction=FlexDirection.ROW, padding=(1, 2, 3, 4), gap=5))
+        leaves = [FlexNode(style=FlexStyle(width=10, height=h, margin=(0, 1, 0, 1))) for h in (8, 12)]
+        for leaf in leaves:
+            box.add_child(leaf)
+
+        self.assertEqual(box.measure(100, 100), (2 * 12 + 5 + 4 + 2, 12 + 1 + 3))
+        self.assertEqual(box.layout_rect, (0, 0, 0, 0))
+        self.assertEqual([leaf.layout_rect for leaf in leaves], [(0, 0, 0, 0)] * 2)
+
+        box.calculate_layout(100, 100)
+        self.assertEqual(box.layout_rect[2:], box.measure(100, 100))
+
+    def test_deep_tree_laid_out_without_recursion(self):
+        """Layout depth is not bounded by the interpreter's recursion limit."""
+        root = node = FlexNode(style=FlexStyle(width=100, height=100))
+        for _ in range(3000):
+            child = FlexNode(style=FlexStyle(width=100, height=100, padding=(0, 0, 0, 0)))
+            node.add_child(child)
+            node = child
+        root.calculate_layout(100, 100, 5, 7)
+        self.assertEqual(node.layout_rect, (5, 7, 100, 100))
+
+    def test_relayout_only_remeasures_changed_subtree(self):
+        """After a style change in one subtree, the other subtree's sizes are reused."""
+        calls = {"left": 0, "right": 0}
+
+        def make_leaf(side):
+            leaf = FlexNode(style=FlexStyle())
+            leaf.measure_func = lambda w, h: calls.__setitem__(side, calls[side] + 1) or (30, 10)
+            return leaf
+
+        root = FlexNode(style=FlexStyle(width=200, height=100, direction=FlexDirection.ROW))
+        left, right = FlexNode(style=FlexStyle(direction=FlexDirection.COLUMN)), FlexNode(style=FlexStyle(direction=FlexDirection.COLUMN))
+        left.add_child(make_leaf("left"))
+        right_leaf = make_leaf("right")
+        right.add_child(right_leaf)
+        root.add_child(left)
+        root.add_child(right)
+        root.calculate_layout(200, 100)
+        calls.update(left=0, right=0)
+
+        right_leaf.style.margin = (0, 0, 0, 5)
+        root.calculate_layout(200, 100)
+        self.assertEqual(calls["left"], 0)
+        self.assertGreater(calls["right"], 0)
+        self.assertEqual(right_leaf.layout_rect[0], 35)
+
+        # Justification only moves children: nothing is measured again
+        calls.update(left=0, right=0)
+        root.style.justify_content = JustifyContent.FLEX_END
+        root.calculate_layout(200, 100)
+        self.assertEqual(calls, {"left": 0, "right": 0})
+        self.assertEqual(right.layout_rect[0] + right.layout_rect[2], 200)
+
+    def test_unchanged_subtrees_not_laid_out_again(self):
+        """Only the nodes whose layout arguments or styles changed are laid out again."""
+        root = FlexNode(style=FlexStyle(width=200, height=100, direction=FlexDirection.ROW))
+        left, right = FlexNode(style=FlexStyle(width=50)), FlexNode(style=FlexStyle(grow=1))
+        left.add_child(FlexNode(style=FlexStyle(height=10)))
+        right_leaf = FlexNode(style=FlexStyle(height=10))
+        right.add_child(right_leaf)
+        root.add_child(left)
+        root.add_child(right)
+        root.calculate_layout(200, 100)
+        rects = [n.layout_rect for n in (root, left, right, right_leaf)]
+
+        with mock.patch.object(FlexNode, "_layout_node", autospec=True, side_effect=FlexNode._layout_node) as layout:
+            root.calculate_layout(200, 100)
+            self.assertEqual([call.args[0] for call in layout.call_args_list], [root])
+
+            layout.reset_mock()
+            right_leaf.style.height = 20
+            root.calculate_layout(200, 100)
+            self.assertEqual([call.args[0] for call in layout.call_args_list], [root, left, right, right_leaf])
+
+            # More room for a fixed-size root: its children get the same arguments
+            layout.reset_mock()
+            root.calculate_layout(300, 100)
+            self.assertEqual([call.args[0] for call in layout.call_args_list], [root, left, right])
+
+        self.assertEqual([n.layout_rect for n in (root, left, right)], rects[:3])
+        self.assertEqual(right_leaf.layout_rect, (50, 0, 0, 20))
+
+
+class TestFlexKernels(unittest.TestCase):
+    """The compiled grow/shrink kernel gives the layout of the Python loop."""
+
+    def _layout(self, width):
+        root = FlexNode(style=FlexStyle(width=width, height=20, direction=FlexDirection.ROW))
+        for i in range(80):
+            root.add_child(FlexNode(style=FlexStyle(width=5 + i % 7, height=20, grow=i % 3, shrink=i % 4)))
+        root.calculate_layout(width, 20)
+        return [child.layout_rect for child in root.children]
+
+    def test_factors_packed_once_per_measurement(self):
+        """Moving a wide row reuses the factor columns packed when measuring its children."""
+        with mock.patch.object(node_module, "USE_FLEX_KERNELS", True), \
+                mock.patch.object(flex_kernels, "pack_factors", wraps=flex_kernels.pack_factors) as pack:
+            row = FlexNode(style=FlexStyle(direction=FlexDirection.ROW))
+            for _ in range(80):
+                row.add_child(FlexNode(style=FlexStyle(width=5, height=5)))
+            row.calculate_layout(300, 20, 0, 0, force_size=True)
+            row.calculate_layout(300, 20, 10, 0, force_size=True)
+        self.assertEqual(pack.call_count, 1)
+        self.assertEqual(row.children[-1].layout_rect, (int(10 + 79 * 3.75), 0, 3, 5))
+
+    def test_kernel_matches_python_loop(self):
+        for width in (1000, 300, 40):  # growing, shrinking, shrinking items to zero
+            expected = self._layout(width)
+            with mock.patch.object(node_module, "USE_FLEX_KERNELS", True):
+                self.assertEqual(self._layout(width), expected)
+
 if __name__ == '__main__':
     unittest.main()
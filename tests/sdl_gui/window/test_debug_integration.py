@@ -1,5 +1,6 @@
 
 import unittest
+from queue import Queue
 from unittest.mock import MagicMock, patch
 
 from sdl_gui import core
@@ -108,11 +109,11 @@ class TestWindowDebugIntegration(unittest.TestCase):
         mock_ext.Window.return_value = MagicMock()
         mock_rend_ext.Renderer.return_value = MagicMock()
 
-        # Mock SDL events to return empty list
-        mock_ext.get_events.return_value = []
-
         win = Window("Test", 800, 600, debug=True)
 
+        # Mock SDL events to return empty list
+        win._drain_sdl_events = MagicMock(return_value=[])
+
         # Setup Debug Server mock to return an event
         mock_server_instance = win.debug_server
         mock_server_instance.get_pending_actions.return_value = [
@@ -137,5 +138,30 @@ class TestWindowDebugIntegration(unittest.TestCase):
         quit_evt = next((e for e in events_quit if e.get("type") == core.EVENT_QUIT), None)
         self.assertIsNotNone(quit_evt)
 
+    @patch("sdl_gui.window.window.sdl2.ext")
+    @patch("sdl_gui.window.window.sdl2")
+    @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.window.renderer.sdl2.ext")
+    @patch("sdl_gui.window.renderer.sdl2")
+    def test_get_ui_events_answers_result_queues(self, mock_rend_sdl2, mock_rend_ext, mock_debug_cls, mock_sdl2, mock_ext):
+        """Requests carrying a result queue are answered, including spatial stats."""
+        mock_ext.Window.return_value = MagicMock()
+        mock_rend_ext.Renderer.return_value = MagicMock()
+
+        win = Window("Test", 800, 600, debug=True)
+        win._drain_sdl_events = MagicMock(return_value=[])
+        win.renderer.get_spatial_stats = MagicMock(return_value={"total_items": 3})
+        win.renderer.get_perf_stats = MagicMock(side_effect=RuntimeError("no stats"))
+
+        spatial_queue, perf_queue = Queue(), Queue()
+        win.debug_server.get_pending_actions.return_value = [
+            ("get_spatial_stats", spatial_queue),
+            ("get_perf_stats", perf_queue),
+        ]
+        win.get_ui_events()
+
+        self.assertEqual(spatial_queue.get_nowait(), {"total_items": 3})
+        self.assertIsInstance(perf_queue.get_nowait(), RuntimeError)
+
 if __name__ == '__main__':
     unittest.main()
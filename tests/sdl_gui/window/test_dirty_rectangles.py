@@ -174,6 +174,22 @@ class TestDirtyRectangles(unittest.TestCase):
         
         self.assertGreater(len(dirty), 0)
 
+    def test_compute_dirty_regions_changed_item_with_id(self):
+        """Test that an item keeping its id but changing creates dirty regions."""
+        old_item = {
+            core.KEY_TYPE: core.TYPE_RECT,
+            core.KEY_RECT: [0, 0, 100, 100],
+            core.KEY_ID: "button",
+            "color": (255, 0, 0, 255)
+        }
+        new_item = dict(old_item, color=(0, 255, 0, 255))
+
+        parent_rect = (0, 0, 800, 600)
+
+        dirty = self.renderer._compute_dirty_regions([new_item], [old_item], parent_rect)
+
+        self.assertGreater(len(dirty), 0)
+
     def test_compute_dirty_regions_different_lengths(self):
         """Test that different length lists produce dirty region covering parent."""
         item = {
@@ -137,6 +137,29 @@ class TestLayoutCaching(unittest.TestCase):
         self.assertEqual(stats["misses"], 1)
         self.assertEqual(stats["hits"], 1)
 
+    def test_vbox_layout_reused_when_moved(self):
+        """Test that a scrolled VBox reuses its layout and culls children out of view."""
+        item = {
+            core.KEY_TYPE: core.TYPE_VBOX,
+            core.KEY_RECT: [0, 0, 100, 300],
+            core.KEY_CHILDREN: [
+                {core.KEY_TYPE: core.TYPE_RECT, core.KEY_RECT: [0, 0, 100, 100]}
+                for _ in range(3)
+            ]
+        }
+        viewport = (0, 0, 100, 100)
+
+        with patch.object(self.renderer, '_render_element_at') as render_child:
+            self.renderer._render_vbox(item, (0, 0, 100, 300), viewport)
+            self.renderer._render_vbox(item, (0, -150, 100, 300), viewport)
+
+        stats = self.renderer.get_layout_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+        rects = [c.args[1] for c in render_child.call_args_list]
+        self.assertEqual(rects, [(0, 0, 100, 100), (0, 100, 100, 100),
+                                 (0, -50, 100, 100), (0, 50, 100, 100)])
+
     def test_layout_cache_invalidation_on_resize(self):
         """Test that layout cache is cleared on window resize."""
         # Compute a layout to populate cache
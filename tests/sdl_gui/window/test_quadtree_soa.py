@@ -0,0 +1,68 @@
+"""
+Unit tests for the structure-of-arrays quadtree.
+"""
+
+import unittest
+
+from sdl_gui.window.quadtree_soa import QuadTreeSoA
+from sdl_gui.window.spatial_index import QuadTreeNode
+
+
+class TestQuadTreeSoA(unittest.TestCase):
+    """Tests for the QuadTreeSoA class."""
+
+    def _fill(self, tree, count=300):
+        for i in range(count):
+            tree.insert(f"item{i}", ((i * 97) % 990, (i * 31) % 990, 10 + i % 40, 10 + i % 25))
+
+    def test_insert_outside_bounds_fails(self):
+        """Test inserting an item outside bounds returns False."""
+        tree = QuadTreeSoA((0, 0, 100, 100))
+        self.assertFalse(tree.insert("item1", (200, 200, 20, 20)))
+        self.assertTrue(tree.insert("item2", (10, 10, 20, 20)))
+
+    def test_subdivision(self):
+        """Test that a leaf splits into four children past max_items."""
+        tree = QuadTreeSoA((0, 0, 100, 100), max_items=2, max_depth=4)
+        tree.insert("item1", (10, 10, 10, 10))
+        tree.insert("item2", (60, 10, 10, 10))
+        self.assertEqual(tree._first_child[0], -1)
+
+        tree.insert("item3", (10, 60, 10, 10))
+        self.assertEqual(tree._first_child[0], 1)
+        self.assertEqual(len(tree._first_child), 5)
+        self.assertEqual(tree._node_items[0], [])
+
+    def test_queries_match_object_quadtree(self):
+        """Test results are identical to the object-per-node quadtree."""
+        soa = QuadTreeSoA((0, 0, 1000, 1000), max_depth=6)
+        nodes = QuadTreeNode((0, 0, 1000, 1000), max_depth=6)
+        self._fill(soa)
+        self._fill(nodes)
+
+        for rect in [(0, 0, 1000, 1000), (100, 100, 300, 200), (500, 0, 1, 1000), (990, 990, 50, 50)]:
+            expected, actual = set(), set()
+            nodes.query(rect, expected)
+            soa.query(rect, actual)
+            self.assertEqual(actual, expected)
+
+    def test_remove_and_clear(self):
+        """Test removed items disappear and clear empties the tree."""
+        tree = QuadTreeSoA((0, 0, 1000, 1000))
+        self._fill(tree, 50)
+        self.assertTrue(tree.remove("item3"))
+        self.assertFalse(tree.remove("item3"))
+
+        result = set()
+        tree.query((0, 0, 1000, 1000), result)
+        self.assertNotIn("item3", result)
+        self.assertEqual(len(result), 49)
+
+        tree.clear()
+        result = set()
+        tree.query((0, 0, 1000, 1000), result)
+        self.assertEqual(result, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,9 @@ Unit tests for the SpatialIndex quadtree implementation.
 
 import unittest
 
+from unittest import mock
+
+from sdl_gui.window import spatial_index, spatial_kernels
 from sdl_gui.window.spatial_index import SpatialIndex, QuadTreeNode
 
 
@@ -283,5 +286,35 @@ class TestSpatialIndex(unittest.TestCase):
         self.assertNotIn("offscreen", dirty)
 
 
+class TestSpatialKernels(unittest.TestCase):
+    """Tests for the packed AABB kernels and the index path using them."""
+
+    def test_query_aabbs_excludes_touching_edges(self):
+        """Test the kernel uses the same strict overlap as the quadtree."""
+        packed = spatial_kernels.pack_aabbs([(0, 0, 10, 10), (10, 0, 10, 10), (50, 50, 5, 5)])
+        out = spatial_kernels.new_index_buffer(3)
+        count = spatial_kernels.query_aabbs(*packed, 0, 0, 10, 10, out)
+        self.assertEqual([out[i] for i in range(count)], [0])
+
+    def test_kernel_query_matches_quadtree(self):
+        """Test the kernel path returns what the quadtree returns."""
+        index = SpatialIndex(bounds=(0, 0, 1000, 1000))
+        for i in range(200):
+            index.insert(f"item{i}", ((i * 97) % 990, (i * 31) % 990, 40, 40))
+        index.insert("outside", (2000, 2000, 10, 10))
+        index.remove("item7")
+
+        viewport = (100, 100, 400, 300)
+        expected = set()
+        index._root.query(viewport, expected)
+        with mock.patch.object(spatial_index, "USE_KERNELS", True):
+            self.assertEqual(index.query(viewport), expected)
+            index.insert("late", (150, 150, 10, 10))
+            self.assertIn("late", index.query(viewport))
+            # Only the packed rectangles are kept up to date
+            self.assertNotIn("late", index._root._index)
+            self.assertNotIn("outside", index.query((0, 0, 4000, 4000)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for static items drawn through baked textures.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui import core
+from sdl_gui.rendering.static_renderer import StaticRenderer
+
+
+class TestStaticRenderer(unittest.TestCase):
+    """Tests for StaticRenderer baking and reuse."""
+
+    def setUp(self):
+        self.proxy = MagicMock()
+        self.proxy._hit_list = []
+        self.static_renderer = StaticRenderer(self.proxy, MagicMock(), MagicMock())
+        self.item = {
+            core.KEY_TYPE: core.TYPE_LAYER,
+            core.KEY_RECT: [10, 20, 100, 50],
+            core.KEY_STATIC: True,
+            core.KEY_CHILDREN: [],
+        }
+
+        def render_content(item, rect, viewport):
+            # A child hit, recorded relative to the texture
+            self.proxy._hit_list.append(((5, 5, 10, 10), {"id": "child"}))
+
+        self.proxy._render_content.side_effect = render_content
+
+        def hash_item(item):
+            return hash(repr(sorted((k, v) for k, v in item.items()
+                                    if k != core.KEY_CHILDREN)))
+
+        self.proxy._hash_item_cached.side_effect = hash_item
+
+    @patch('sdl_gui.rendering.static_renderer.RawTexture')
+    @patch('sdl_gui.rendering.static_renderer.sdl2')
+    def test_subtree_is_rendered_once(self, mock_sdl2, mock_texture):
+        """The subtree is baked on the first frame and copied afterwards."""
+        mock_sdl2.SDL_SetTextureBlendMode.return_value = 0
+
+        for _ in range(3):
+            self.proxy._hit_list = []
+            self.static_renderer.render_static(self.item, (10, 20, 100, 50))
+            self.static_renderer.end_frame()
+
+        self.assertEqual(self.proxy._render_content.call_count, 1)
+        self.assertEqual(self.static_renderer.renderer.copy.call_count, 3)
+        # Hits are replayed in window coordinates
+        self.assertEqual(self.proxy._hit_list, [((15, 25, 10, 10), {"id": "child"})])
+
+    @patch('sdl_gui.rendering.static_renderer.RawTexture')
+    @patch('sdl_gui.rendering.static_renderer.sdl2')
+    def test_changed_or_undrawn_items_are_released(self, mock_sdl2, mock_texture):
+        """A changed item is baked again; textures not drawn in a frame are dropped."""
+        mock_sdl2.SDL_SetTextureBlendMode.return_value = 0
+
+        self.static_renderer.render_static(self.item, (10, 20, 100, 50))
+        self.static_renderer.end_frame()
+        # to_data() gives a new dict on every frame: equal content is reused
+        self.static_renderer.render_static(dict(self.item), (10, 20, 100, 50))
+        self.static_renderer.end_frame()
+        self.assertEqual(self.proxy._render_content.call_count, 1)
+
+        changed = dict(self.item)
+        changed[core.KEY_CHILDREN] = [{core.KEY_TYPE: core.TYPE_RECT}]
+        self.static_renderer.render_static(changed, (10, 20, 100, 50))
+        self.static_renderer.end_frame()
+        self.assertEqual(self.proxy._render_content.call_count, 2)
+        self.assertEqual(len(self.static_renderer._baked), 1)
+
+        self.static_renderer.end_frame()
+        self.assertEqual(len(self.static_renderer._baked), 0)
+
+    @patch('sdl_gui.rendering.static_renderer.sdl2')
+    def test_falls_back_without_blend_support(self, mock_sdl2):
+        """Renderers without custom blend modes draw the item directly."""
+        mock_sdl2.SDL_SetTextureBlendMode.return_value = -1
+
+        self.static_renderer.render_static(self.item, (10, 20, 100, 50))
+        self.static_renderer.render_static(self.item, (10, 20, 100, 50))
+
+        self.assertEqual(self.proxy._render_content.call_count, 2)
+        self.assertEqual(mock_sdl2.SDL_CreateTexture.call_count, 1)
+        self.static_renderer.renderer.copy.assert_not_called()
+        self.assertEqual(len(self.proxy._hit_list), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
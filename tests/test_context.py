@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from sdl_gui import context
@@ -69,5 +70,17 @@ class TestContext(unittest.TestCase):
         self.assertTrue(hasattr(w, 'root_children'))
         self.assertIn(l, w.root_children)
 
+    def test_stack_is_per_thread(self):
+        c = MockContainer(0,0,10,10)
+        seen = []
+
+        with c:
+            thread = threading.Thread(target=lambda: seen.append(context.get_current_parent()))
+            thread.start()
+            thread.join()
+            self.assertEqual(context.get_current_parent(), c)
+
+        self.assertEqual(seen, [None])
+
 if __name__ == '__main__':
     unittest.main()
@@ -86,5 +86,27 @@ class TestInputAdvanced(unittest.TestCase):
         self.assertEqual(input_box_single.text, "")
         self.assertTrue(submitted)
 
+    def test_edits_splice_text(self):
+        changes = []
+        input_box = Input(0, 0, 200, 30, text="hello big world")
+        input_box.on_change = changes.append
+        input_box.focused = True
+
+        def key(sym, mod=0):
+            input_box.handle_event({"type": core.EVENT_KEY_DOWN, "key_sym": sym, "mod": mod}, self.context)
+
+        input_box.cursor_pos = 9
+        key(sdl2.SDLK_BACKSPACE, sdl2.KMOD_CTRL) # word left
+        self.assertEqual((input_box.text, input_box.cursor_pos), ("hello  world", 6))
+        key(sdl2.SDLK_BACKSPACE)
+        key(sdl2.SDLK_DELETE)
+        self.assertEqual((input_box.text, input_box.cursor_pos), ("helloworld", 5))
+
+        # Typing over a selection replaces it
+        input_box.selection_start = 10
+        input_box._insert_text(", all", self.context)
+        self.assertEqual((input_box.text, input_box.cursor_pos), ("hello, all", 10))
+        self.assertEqual(changes[-1], "hello, all")
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,45 @@ class TestInputPrimitive(unittest.TestCase):
         self.context = MockContext()
         self.input_box.focused = True # Assume focused for key tests
 
+    def test_uses_slots(self):
+        """Input state is stored in slots, not a per-instance dict."""
+        self.assertFalse(hasattr(self.input_box, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.input_box.undeclared = 1
+
+    def test_dispatch_ignores_unhandled_events(self):
+        """Unknown event types are ignored; text and keys need focus."""
+        self.input_box.handle_event({"type": "unknown"}, self.context)
+        self.input_box.handle_event({}, self.context)
+        self.input_box.focused = False
+        self.input_box.handle_event({"type": core.EVENT_TEXT_INPUT, "text": "a"}, self.context)
+        self.input_box.handle_event({"type": core.EVENT_KEY_DOWN, "key_sym": sdl2.SDLK_RETURN}, self.context)
+        self.assertEqual(self.input_box.text, "")
+        self.input_box.handle_event({"type": core.EVENT_FOCUS}, self.context)
+        self.input_box.handle_event({"type": core.EVENT_TEXT_INPUT, "text": "a"}, self.context)
+        self.assertEqual(self.input_box.text, "a")
+
+    def test_dispatch_calls_subclass_handlers(self):
+        """A subclass overriding an event handler is dispatched to."""
+        class NoFocusInput(Input):
+            def _on_focus(self, event, context):
+                pass
+
+        box = NoFocusInput(0, 0, 200, 30)
+        box.handle_event({"type": core.EVENT_FOCUS}, self.context)
+        self.assertFalse(box.focused)
+
+    def test_shortcuts_need_ctrl(self):
+        """Letter shortcuts act only with Ctrl; Ctrl+Home still moves home."""
+        self.input_box.text = "hello"
+        self.input_box.cursor_pos = 5
+        self.input_box._handle_key(sdl2.SDLK_a, 0, self.context)
+        self.assertIsNone(self.input_box.selection_start)
+        self.input_box._handle_key(sdl2.SDLK_HOME, sdl2.KMOD_LCTRL, self.context)
+        self.assertEqual(self.input_box.cursor_pos, 0)
+        self.input_box._handle_key(sdl2.SDLK_a, sdl2.KMOD_LCTRL, self.context)
+        self.assertEqual((self.input_box.selection_start, self.input_box.cursor_pos), (0, 5))
+
     def test_text_entry(self):
         # Simulate typing "Hello"
         for char in "Hello":
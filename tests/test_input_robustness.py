@@ -42,5 +42,26 @@ class TestInputRobustness(unittest.TestCase):
         input_box._set_cursor_from_mouse(10, 40, self.context)
         self.assertEqual(input_box.cursor_pos, 13)
 
+    def test_mouse_click_on_long_line_measures_few_prefixes(self):
+        """The nearest column is found without measuring every prefix."""
+        widths = [7, 3, 12, 5, 9] * 40  # 200 chars of uneven widths
+
+        class CountingContext:
+            calls = 0
+
+            def measure_text_width(self, text, font, size):
+                CountingContext.calls += 1
+                return sum(widths[:len(text)])
+
+        edges = [sum(widths[:i]) for i in range(len(widths) + 1)]
+        input_box = Input(0, 0, 2000, 30)
+        input_box.text = "x" * len(widths)
+        for x in (-5, 0, 4, 6, 700, 1401, edges[-1], edges[-1] + 50):
+            CountingContext.calls = 0
+            input_box._set_cursor_from_mouse(x, 0, CountingContext())
+            nearest = min(range(len(edges)), key=lambda i: (abs(edges[i] - x), i))
+            self.assertEqual(input_box.cursor_pos, nearest, x)
+            self.assertLessEqual(CountingContext.calls, 12)
+
 if __name__ == '__main__':
     unittest.main()
@@ -69,5 +69,22 @@ class TestInputMultilineNav(unittest.TestCase):
         self.assertGreater(input_box.scroll_y, 0)
         self.assertLess(input_box.scroll_y, 200)
 
+    def test_line_col_conversions(self):
+        # Lines start at 0, 6 and 7: "ab cd", "", "xyz"
+        text = "ab cd\n\nxyz"
+        input_box = Input(0, 0, 100, 100, multiline=True, text=text)
+
+        self.assertEqual(input_box._get_line_col(text, 0), (0, 0))
+        self.assertEqual(input_box._get_line_col(text, 5), (0, 5)) # before newline
+        self.assertEqual(input_box._get_line_col(text, 6), (1, 0))
+        self.assertEqual(input_box._get_line_col(text, 7), (2, 0))
+        self.assertEqual(input_box._get_line_col(text, 10), (2, 3))
+        self.assertEqual(input_box._get_line_col(text, 50), (2, 3)) # past the end
+
+        self.assertEqual(input_box._get_cursor_from_line_col(text, 1, 4), 6) # empty line
+        self.assertEqual(input_box._get_cursor_from_line_col(text, 2, 2), 9)
+        self.assertEqual(input_box._get_cursor_from_line_col(text, 9, 9), 10)
+        self.assertEqual(input_box._get_cursor_from_line_col(text, -1, -1), 0)
+
 if __name__ == '__main__':
     unittest.main()
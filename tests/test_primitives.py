@@ -38,6 +38,17 @@ class TestBasePrimitiveSetters(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.prim.set_non_existent_prop(123)
 
+    def test_setters_defined_on_class(self):
+        """Allowed setters are class methods; properties added by a subclass still work."""
+        self.assertIn("set_padding", vars(BasePrimitive))
+        self.assertIs(self.prim.set_gap(4), self.prim)
+        self.assertEqual(self.prim.set_padding(2).extra["padding"], (2, 2, 2, 2))
+
+        class Extended(MockPrimitive):
+            ALLOWED_PROPERTIES = BasePrimitive.ALLOWED_PROPERTIES | {"opacity"}
+
+        self.assertEqual(Extended(0, 0, 1, 1).set_opacity(0.5).extra["opacity"], 0.5)
+
     def test_non_setter_method_missing(self):
         # Ensure normal attribute error for non-setter methods
         with self.assertRaises(AttributeError):
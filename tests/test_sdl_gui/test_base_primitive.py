@@ -1,7 +1,11 @@
 import unittest
 from typing import Any, Dict
 
+from sdl_gui import core
+from sdl_gui.layouts.vbox import VBox
 from sdl_gui.primitives.base import BasePrimitive
+from sdl_gui.primitives.input import Input
+from sdl_gui.primitives.rectangle import Rectangle
 
 
 class ConcretePrimitive(BasePrimitive):
@@ -24,6 +28,17 @@ class TestBasePrimitive(unittest.TestCase):
         self.assertEqual(p.padding, (1, 2, 3, 4))
         self.assertEqual(p.margin, (5, 6, 7, 8))
 
+    def test_spacing_shared_and_normalized(self):
+        """Equal spacings share one tuple; lists and non-int scalars normalize as before."""
+        a = ConcretePrimitive(x=0, y=0, width=1, height=1, padding=3, margin=[1, 2])
+        b = ConcretePrimitive(x=0, y=0, width=1, height=1, padding=(3, 3, 3, 3))
+        self.assertIs(a.padding, b.padding)
+        self.assertIs(a.margin, ConcretePrimitive(x=0, y=0, width=1, height=1, margin=(1, 2)).margin)
+        self.assertEqual(a.margin, (1, 2, 1, 2))
+        self.assertIs(ConcretePrimitive(x=0, y=0, width=1, height=1).padding, a._normalize_spacing(0))
+        self.assertEqual(a._normalize_spacing(1.5), (0, 0, 0, 0))
+        self.assertEqual(a._normalize_spacing(True), (True, True, True, True))
+
     def test_to_data(self):
         """Test base data generation."""
         p = ConcretePrimitive(x=10, y=20, width=30, height=40,
@@ -32,3 +47,84 @@ class TestBasePrimitive(unittest.TestCase):
         self.assertEqual(data["rect"], [10, 20, 30, 40])
         self.assertEqual(data["padding"], (1, 1, 1, 1))
         self.assertEqual(data["margin"], (2, 2, 2, 2))
+
+class TestDataCache(unittest.TestCase):
+    def setUp(self):
+        self.rect = Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255))
+        self.inner = VBox(0, 0, 100, "auto")
+        self.inner.add_child(self.rect)
+        self.outer = VBox(0, 0, 100, "auto")
+        self.outer.add_child(self.inner)
+
+    def test_static_tree_is_built_once(self):
+        """An unchanged subtree hands back the same cached child dicts."""
+        first = self.outer.to_data()
+        second = self.outer.to_data()
+        self.assertIsNot(first, second)
+        self.assertIs(first[core.KEY_CHILDREN], second[core.KEY_CHILDREN])
+
+    def test_attribute_change_propagates_to_ancestors(self):
+        """Assigning a public attribute deep in the tree invalidates its ancestors."""
+        self.outer.to_data()
+        self.rect.color = (0, 0, 255, 255)
+        rect_data = self.outer.to_data()[core.KEY_CHILDREN][0][core.KEY_CHILDREN][0]
+        self.assertEqual(rect_data[core.KEY_COLOR], (0, 0, 255, 255))
+
+    def test_setter_and_shared_child_invalidate_every_parent(self):
+        """A child shared by two parents invalidates both."""
+        other = VBox(0, 0, 100, "auto")
+        other.add_child(self.rect)
+        self.outer.to_data()
+        other.to_data()
+        self.rect.set_radius(4)
+        self.assertEqual(other.to_data()[core.KEY_CHILDREN][0][core.KEY_RADIUS], 4)
+        inner_data = self.outer.to_data()[core.KEY_CHILDREN][0]
+        self.assertEqual(inner_data[core.KEY_CHILDREN][0][core.KEY_RADIUS], 4)
+
+    def test_mark_dirty_after_in_place_mutation(self):
+        """In-place mutations are only seen after mark_dirty()."""
+        self.inner.to_data()
+        self.inner.listen_events.append(core.EVENT_CLICK)
+        self.assertNotIn(core.KEY_LISTEN_EVENTS, self.inner.to_data())
+        self.inner.mark_dirty()
+        self.assertEqual(self.inner.to_data()[core.KEY_LISTEN_EVENTS], [core.EVENT_CLICK])
+
+    def test_rect_list_kept_until_geometry_changes(self):
+        """A rebuild for another change reuses the rect list; a move replaces it."""
+        rect_list = self.inner.to_data()[core.KEY_RECT]
+        self.rect.color = (0, 0, 255, 255)
+        self.assertIs(self.inner.to_data()[core.KEY_RECT], rect_list)
+        self.inner.y = 30
+        self.assertEqual(self.inner.to_data()[core.KEY_RECT], [0, 30, 100, "auto"])
+        # Lists already handed out are never mutated
+        self.assertEqual(rect_list, [0, 0, 100, "auto"])
+
+    def test_to_data_override_is_serialized(self):
+        """A child overriding to_data() has its own data embedded."""
+        self.inner.add_child(ConcretePrimitive(0, 0, 10, 10))
+        self.inner.to_data()
+        self.assertEqual(self.inner.to_data()[core.KEY_CHILDREN][1]["type"], "concrete")
+
+    def test_removed_child_is_unlinked(self):
+        """A child removed from a container stops invalidating it."""
+        self.inner.to_data()
+        self.assertEqual(self.rect._parents, [self.inner])
+        self.inner.children = []
+        cached = self.inner._get_data()
+        self.assertEqual(self.rect._parents, [])
+        self.rect.color = (0, 0, 255, 255)
+        self.assertIs(self.inner._get_data(), cached)
+
+    def test_unrendered_state_keeps_cache(self):
+        """Input bookkeeping and unchanged blink ticks do not rebuild the data."""
+        box = Input(0, 0, 100, 30, text="abc")
+        self.inner.add_child(box)
+        cached = self.inner._get_data()
+        box.handle_event({"type": core.EVENT_MOUSE_UP})
+        box.handle_event({"type": core.EVENT_TICK, "ticks": 100})
+        box.last_mouse_x = 40
+        box.history.append(("", 0, None))
+        self.assertIs(self.inner._get_data(), cached)
+
+        box.handle_event({"type": core.EVENT_TICK, "ticks": 600})
+        self.assertEqual(self.inner.to_data()[core.KEY_CHILDREN][1]["cursor_visible"], False)
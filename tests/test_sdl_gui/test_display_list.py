@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui import core
+from sdl_gui.primitives.rectangle import Rectangle
+from sdl_gui.window.display_list import DisplayList
+from sdl_gui.window.window import Window
+
+
+class TestDisplayList(unittest.TestCase):
+    def test_build_reuses_clean_entries(self):
+        """Unchanged entries keep their dict across builds; changed ones are rebuilt."""
+        bg = Rectangle(0, 0, 100, 100, color=(0, 0, 0, 255))
+        box = Rectangle(10, 10, 20, 20, color=(255, 0, 0, 255))
+        display_list = DisplayList([bg, box])
+
+        first = display_list.build()
+        box.color = (0, 255, 0, 255)
+        second = display_list.build()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(second[1][core.KEY_COLOR], (0, 255, 0, 255))
+
+    def test_mark_dirty_reserializes_entry(self):
+        """Non-primitive entries are serialized again only once marked dirty."""
+        bg = Rectangle(0, 0, 100, 100, color=(0, 0, 0, 255))
+        chart = MagicMock()
+        chart.to_data.return_value = {core.KEY_TYPE: core.TYPE_RECT}
+        display_list = DisplayList([bg, chart])
+        first = display_list.build()
+        display_list.build()
+        chart.to_data.assert_called_once()
+
+        chart.to_data.return_value = {core.KEY_TYPE: core.TYPE_LAYER}
+        display_list.mark_dirty(chart)
+        second = display_list.build()
+
+        self.assertIs(first[0], second[0])
+        self.assertEqual(second[1][core.KEY_TYPE], core.TYPE_LAYER)
+
+    def test_mark_dirty_rejects_unknown_entries(self):
+        """Bad indices and unknown entries fail at call time."""
+        box = Rectangle(10, 10, 20, 20, color=(255, 0, 0, 255))
+        display_list = DisplayList([box])
+        display_list.build()
+
+        with self.assertRaises(IndexError):
+            display_list.mark_dirty(1)
+        with self.assertRaises(ValueError):
+            display_list.mark_dirty(Rectangle(0, 0, 1, 1, color=(0, 0, 0, 255)))
+
+        # Negative indices count from the end, as for lists
+        box.color = (0, 255, 0, 255)
+        display_list.mark_dirty(-1)
+        self.assertEqual(display_list.build()[0][core.KEY_COLOR], (0, 255, 0, 255))
+
+    def test_static_dict_entries(self):
+        """Plain dict entries are used as-is."""
+        data = {core.KEY_TYPE: core.TYPE_RECT, core.KEY_RECT: [0, 0, 1, 1]}
+        display_list = DisplayList([data])
+        self.assertIs(display_list.build()[0], data)
+        self.assertEqual(len(display_list), 1)
+
+    @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.window.window.Renderer")
+    @patch("sdl_gui.window.window.sdl2.ext")
+    @patch("sdl_gui.window.window.sdl2")
+    def test_window_renders_display_list(self, mock_sdl2, mock_ext, mock_renderer_cls, mock_debug):
+        """Window.render builds a DisplayList before handing it to the renderer."""
+        mock_ext.Window.return_value = MagicMock()
+        win = Window("Test", 800, 600)
+        box = Rectangle(10, 10, 20, 20, color=(255, 0, 0, 255))
+
+        win.render(DisplayList([box]))
+
+        rendered = mock_renderer_cls.return_value.render_list.call_args[0][0]
+        self.assertEqual(rendered, [box.to_data()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui import core
+from sdl_gui.rendering.input_renderer import InputRenderer
+
+
+@patch("sdl_gui.rendering.input_renderer.ctypes")
+@patch("sdl_gui.rendering.input_renderer.sdl2")
+class TestInputRendererAnimation(unittest.TestCase):
+    def setUp(self):
+        self.renderer = InputRenderer(MagicMock(), MagicMock())
+        self.renderer.text_renderer.measure_text_width.return_value = 0
+
+    def render(self, mock_sdl2, **item):
+        mock_sdl2.SDL_Rect.return_value.w = 0
+        item.setdefault(core.KEY_TEXT, "abc")
+        self.renderer.render_input(item, (0, 0, 100, 30))
+
+    def test_focused_input_is_animating(self, mock_sdl2, mock_ctypes):
+        """A focused input draws a blinking cursor: its frame changes with time."""
+        self.render(mock_sdl2)
+        self.assertFalse(self.renderer.animating)
+        self.render(mock_sdl2, focused=True)
+        self.assertTrue(self.renderer.animating)
+
+    def test_renderer_reports_animation(self, mock_sdl2, mock_ctypes):
+        """Renderer.is_animating() follows the inputs drawn by the last frame."""
+        from sdl_gui.window.renderer import Renderer
+
+        with patch("sdl_gui.window.renderer.sdl2.ext.Renderer"), \
+             patch("sdl_gui.rendering.text_renderer.sdlttf.TTF_Init"):
+            window = MagicMock()
+            window.size = (800, 600)
+            renderer = Renderer(window)
+        renderer.input_renderer.animating = True
+        self.assertTrue(renderer.is_animating())
+        with patch("sdl_gui.window.renderer.sdl2"):
+            renderer.render_list([])
+        self.assertFalse(renderer.is_animating())
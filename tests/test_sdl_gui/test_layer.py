@@ -19,3 +19,12 @@ class TestLayer(unittest.TestCase):
         self.assertEqual(data[core.KEY_RECT], [0, 0, 800, 600])
         self.assertEqual(len(data[core.KEY_CHILDREN]), 1)
         self.assertEqual(data[core.KEY_CHILDREN][0][core.KEY_TYPE], core.TYPE_RECT)
+
+    def test_set_static(self):
+        """set_static marks the layer data static."""
+        layer = Layer(x=0, y=0, width=800, height=600)
+        self.assertNotIn(core.KEY_STATIC, layer.to_data())
+
+        layer.set_static(True)
+
+        self.assertTrue(layer.to_data()[core.KEY_STATIC])
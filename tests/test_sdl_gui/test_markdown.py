@@ -1,6 +1,11 @@
 import unittest
 
-from sdl_gui.markdown import MarkdownParser
+from sdl_gui.markdown import (
+    MarkdownParser,
+    parse_color,
+    parse_markup,
+    segments_from_runs,
+)
 
 
 class TestMarkdownParser(unittest.TestCase):
@@ -59,3 +64,54 @@ class TestMarkdownParser(unittest.TestCase):
         self.assertEqual(segments[0].text, "Hello ")
         self.assertEqual(segments[1].text, "[")
         self.assertEqual(segments[2].text, "Broken")
+
+    def test_nested_brackets_and_literals(self):
+        """Nested blocks, bare brackets, unclosed bold and bad colors all parse as before."""
+        segments = self.parser.parse("[a [b]{#00FF00} [c]](t) **open [d]{#bad}")
+        self.assertEqual(
+            [(s.text, s.bold, s.color, s.link_target) for s in segments],
+            [("a ", False, (0, 0, 0, 255), "t"),
+             ("b", False, (0, 255, 0, 255), "t"),
+             (" ", False, (0, 0, 0, 255), "t"),
+             ("[", False, (0, 0, 0, 255), "t"),
+             ("c", False, (0, 0, 0, 255), "t"),
+             ("]", False, (0, 0, 0, 255), "t"),
+             (" ", False, (0, 0, 0, 255), None),
+             ("**", False, (0, 0, 0, 255), None),
+             ("open ", False, (0, 0, 0, 255), None),
+             ("d", False, (0, 0, 0, 255), None)])
+
+
+class TestParseColor(unittest.TestCase):
+    def test_parses_and_memoizes(self):
+        self.assertEqual(parse_color("#0A0B0C"), (10, 11, 12, 255))
+        self.assertEqual(parse_color("#0A0B0C80"), (10, 11, 12, 128))
+        self.assertIsNone(parse_color("#GG0000"))
+        self.assertIsNone(parse_color("red"))
+        self.assertIs(parse_color("#0A0B0C"), parse_color("#0A0B0C"))
+
+
+class TestParseMarkup(unittest.TestCase):
+    def test_matches_parser(self):
+        segments = parse_markup("Hello **Bold** World", (10, 20, 30, 255))
+        expected = MarkdownParser(default_color=(10, 20, 30, 255)).parse("Hello **Bold** World")
+        self.assertEqual(list(segments), expected)
+
+    def test_result_is_memoized(self):
+        first = parse_markup("**r/python**")
+        self.assertIs(parse_markup("**r/python**"), first)
+        self.assertIsNot(parse_markup("**r/python**", (255, 0, 0, 255)), first)
+
+
+class TestSegmentsFromRuns(unittest.TestCase):
+    def test_matches_equivalent_markup(self):
+        runs = (("bold", "Title"), ("normal", " by someone"))
+        self.assertEqual(list(segments_from_runs(runs, (10, 20, 30, 255))),
+                         list(parse_markup("**Title** by someone", (10, 20, 30, 255))))
+
+    def test_markup_characters_are_literal(self):
+        segments = segments_from_runs((("bold", "**[not a link](x)**"),))
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(segments[0].text, "**[not a link](x)**")
+        self.assertTrue(segments[0].bold)
+        self.assertIsNone(segments[0].link_target)
@@ -0,0 +1,109 @@
+import struct
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui import core
+from sdl_gui.primitives.rect_batch import RectBatch
+from sdl_gui.rendering import geometry_kernels
+from sdl_gui.rendering.primitive_renderer import RECT_QUEUE_SIZE, PrimitiveRenderer
+
+
+class TestRectBatch(unittest.TestCase):
+    def test_records_are_packed(self):
+        batch = RectBatch(0, 0, 100, 100, id="batch")
+        batch.add_rect(1, 2, 3, 4, (10, 20, 30, 40))
+        batch.add_rect(5, 6, 7, 8, (50, 60, 70))
+        data = batch.to_data()
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(data[core.KEY_TYPE], core.TYPE_RECT_BATCH)
+        self.assertEqual(list(RectBatch.RECORD.iter_unpack(data[core.KEY_RECORDS])),
+                         [(1, 2, 3, 4, 10, 20, 30, 40), (5, 6, 7, 8, 50, 60, 70, 255)])
+
+    def test_add_rect_invalidates_data(self):
+        batch = RectBatch(0, 0, 100, 100)
+        self.assertEqual(batch.to_data()[core.KEY_RECORDS], b"")
+        batch.add_rect(0, 0, 1, 1, (0, 0, 0, 255))
+        self.assertEqual(len(batch.to_data()[core.KEY_RECORDS]), RectBatch.RECORD.size)
+
+    def test_add_rects_appends_in_order(self):
+        batch = RectBatch(0, 0, 100, 100)
+        batch.add_rect(1, 2, 3, 4, (10, 20, 30, 40))
+        before = batch.to_data()
+        batch.add_rects([])
+        self.assertEqual(batch.to_data(), before)
+
+        batch.add_rects((i, 0, 1, 1, (i, i, i)) for i in range(3))
+        self.assertEqual(list(RectBatch.RECORD.iter_unpack(batch.to_data()[core.KEY_RECORDS])),
+                         [(1, 2, 3, 4, 10, 20, 30, 40)] + [(i, 0, 1, 1, i, i, i, 255) for i in range(3)])
+
+
+@patch("sdl_gui.rendering.primitive_renderer.USE_GEOMETRY", False)
+class TestDrawRectBatch(unittest.TestCase):
+    @patch("sdl_gui.rendering.primitive_renderer.sdl2")
+    def test_groups_colors_and_clips(self, mock_sdl2):
+        renderer = PrimitiveRenderer(MagicMock())
+        batch = RectBatch(0, 0, 100, 100)
+        batch.add_rect(0, 0, 10, 10, (255, 0, 0, 255))
+        batch.add_rect(10, 0, 10, 10, (255, 0, 0, 255))
+        batch.add_rect(500, 500, 10, 10, (255, 0, 0, 255))  # Outside the clip
+        batch.add_rect(20, 0, 10, 10, (0, 255, 0, 255))
+
+        renderer.draw_rect_batch(batch.to_data(), (5, 5, 100, 100), clip=(0, 0, 200, 200))
+        renderer.flush()
+
+        counts = [c.args[2] for c in mock_sdl2.SDL_RenderFillRects.call_args_list]
+        self.assertEqual(counts, [2, 1])
+        self.assertEqual(mock_sdl2.SDL_SetRenderDrawColor.call_args_list[0].args[1:], (255, 0, 0, 255))
+
+    def test_full_queue_is_flushed(self):
+        renderer = PrimitiveRenderer(MagicMock())
+        batch = RectBatch(0, 0, 100, 100)
+        for i in range(RECT_QUEUE_SIZE + 1):
+            batch.add_rect(i, 0, 1, 1, (255, 0, 0, 255))
+
+        with patch("sdl_gui.rendering.primitive_renderer.sdl2.SDL_RenderFillRects") as fill, \
+                patch("sdl_gui.rendering.primitive_renderer.sdl2.SDL_SetRenderDrawColor"):
+            renderer.draw_rect_batch(batch.to_data(), (0, 0, 100, 100))
+            renderer.flush()
+
+        counts = [c.args[2] for c in fill.call_args_list]
+        self.assertEqual(counts, [RECT_QUEUE_SIZE, 1])
+        # The last queued rectangle was written at the start of the queue again
+        self.assertEqual(fill.call_args_list[1].args[1][0].x, RECT_QUEUE_SIZE)
+
+
+class TestDrawRectBatchGeometry(unittest.TestCase):
+    def _batch(self):
+        batch = RectBatch(0, 0, 100, 100)
+        batch.add_rect(0, 0, 10, 20, (255, 0, 0, 255))
+        batch.add_rect(500, 500, 10, 10, (255, 0, 0, 255))  # Outside the clip
+        batch.add_rect(10, 0, 10, 10, (0, 0, 0, 0))  # Transparent
+        batch.add_rect(20, 0, 10, 10, (0, 255, 0, 128))
+        return batch
+
+    def test_vertices_of_visible_records(self):
+        words = geometry_kernels.record_words(self._batch().to_data()[core.KEY_RECORDS])
+        xy, colors, indices = geometry_kernels.new_vertex_buffers(4)
+
+        count = geometry_kernels.rect_vertices(words, 5, 5, 0, 0, 200, 200, xy, colors)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(list(xy[:8]), [5, 5, 15, 5, 5, 25, 15, 25])
+        self.assertEqual(list(indices[:12]), [0, 1, 2, 2, 1, 3, 4, 5, 6, 6, 5, 7])
+        red, green = struct.pack("<i", colors[0]), struct.pack("<i", colors[4])
+        self.assertEqual((red, green), (bytes((255, 0, 0, 255)), bytes((0, 255, 0, 128))))
+
+    @patch("sdl_gui.rendering.primitive_renderer.USE_GEOMETRY", True)
+    @patch("sdl_gui.rendering.primitive_renderer.sdl2.SDL_RenderGeometryRaw")
+    def test_batch_is_one_geometry_call(self, mock_geometry):
+        renderer = PrimitiveRenderer(MagicMock())
+        renderer.draw_rect_batch(self._batch().to_data(), (5, 5, 100, 100), clip=(0, 0, 200, 200))
+
+        mock_geometry.assert_called_once()
+        args = mock_geometry.call_args.args
+        self.assertEqual((args[8], args[10]), (8, 12))  # Vertices, indices
+
+
+if __name__ == '__main__':
+    unittest.main()
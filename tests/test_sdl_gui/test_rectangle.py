@@ -13,3 +13,25 @@ class TestRectangle(unittest.TestCase):
         self.assertEqual(data[core.KEY_TYPE], core.TYPE_RECT)
         self.assertEqual(data[core.KEY_RECT], [10, 20, 100, 200])
         self.assertEqual(data["color"], (255, 0, 0, 255))
+
+    def test_to_data_does_not_leak_template(self):
+        """Each to_data() call returns a fresh dict, never the shared class template."""
+        rect = Rectangle(x=0, y=0, width=10, height=10, color=(1, 2, 3, 255))
+        first = rect.to_data()
+        first["color"] = (0, 0, 0, 0)
+
+        self.assertIsNot(first, Rectangle._DATA_TEMPLATE)
+        self.assertEqual(Rectangle._DATA_TEMPLATE, {core.KEY_TYPE: core.TYPE_RECT})
+        self.assertEqual(rect.to_data()["color"], (1, 2, 3, 255))
+
+    def test_rectangle_uses_slots(self):
+        """Rectangle instances store their fields in slots, not a per-instance dict."""
+        rect = Rectangle(x=0, y=0, width=10, height=10, color=(1, 2, 3, 255))
+        self.assertFalse(hasattr(rect, "__dict__"))
+
+    def test_equal_colors_share_one_tuple(self):
+        """Equal color and margin tuples are interned across instances."""
+        a = Rectangle(0, 0, 10, 10, color=(12, 34, 56, 255), margin=(1, 2, 3, 4))
+        b = Rectangle(0, 0, 10, 10, color=tuple([12, 34, 56, 255]), margin=[1, 2, 3, 4])
+        self.assertIs(a.color, b.color)
+        self.assertIs(a.margin, b.margin)
@@ -33,5 +33,15 @@ class TestResponsiveText(unittest.TestCase):
         self.assertEqual(data[core.KEY_ID], "txt1")
         self.assertEqual(data[core.KEY_RECT], [10, 10, 100, 30])
 
+    def test_runs_to_data(self):
+        txt = ResponsiveText(x=0, y=0, width=100, height=30,
+                             runs=[("bold", "Title"), ("normal", " tail")], markup=False)
+        data = txt.to_data()
+
+        self.assertEqual(data[core.KEY_RUNS], (("bold", "Title"), ("normal", " tail")))
+        self.assertEqual(data[core.KEY_TEXT], "Title tail")
+        # Runs are always rendered as rich text
+        self.assertNotIn(core.KEY_MARKUP, data)
+
 if __name__ == '__main__':
     unittest.main()
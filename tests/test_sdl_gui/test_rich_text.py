@@ -7,12 +7,19 @@ from sdl_gui.window.window import Window
 
 class TestWindowRichText(unittest.TestCase):
     @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.rendering.text_renderer.sdlttf.TTF_SizeUTF8")
     @patch("sdl_gui.rendering.text_renderer.sdlttf.TTF_Init")
     @patch("sdl_gui.window.window.sdl2")
     @patch("sdl_gui.rendering.text_renderer.sdl2")
     @patch("sdl_gui.window.renderer.sdl2")
-    def test_render_rich_text_link_markdown(self, mock_rend_sdl2, mock_text_sdl2, mock_win_sdl2, mock_ttf, mock_debug):
+    def test_render_rich_text_link_markdown(self, mock_rend_sdl2, mock_text_sdl2, mock_win_sdl2, mock_ttf, mock_size, mock_debug):
         mock_renderer_cls = mock_rend_sdl2.ext.Renderer
+
+        # Every word measures 10x10
+        def size_utf8(font, text, w, h):
+            w._obj.value, h._obj.value = 10, 10
+            return 0
+        mock_size.side_effect = size_utf8
         mock_renderer = mock_renderer_cls.return_value
         
         # Mock FontManager
@@ -2,6 +2,7 @@ import unittest
 
 from sdl_gui import core
 from sdl_gui.layers.scrollable_layer import ScrollableLayer
+from sdl_gui.primitives.rectangle import Rectangle
 
 
 class TestScrollableLayer(unittest.TestCase):
@@ -19,3 +20,70 @@ class TestScrollableLayer(unittest.TestCase):
         layer.scroll_y = 100
         data = layer.to_data()
         self.assertEqual(data[core.KEY_SCROLL_Y], 100)
+
+    def test_children_data_reused_across_scroll(self):
+        layer = ScrollableLayer(0, 0, 100, 100)
+        layer.add_child(Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255)))
+        first = layer.to_data()
+        layer.scroll_y = 30
+        second = layer.to_data()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first[core.KEY_CHILDREN], second[core.KEY_CHILDREN])
+        self.assertEqual(first[core.KEY_SCROLL_Y], 0)
+        self.assertEqual(second[core.KEY_SCROLL_Y], 30)
+
+    def test_add_child_and_mark_dirty_invalidate_children(self):
+        layer = ScrollableLayer(0, 0, 100, 100)
+        child = Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255))
+        layer.add_child(child)
+        self.assertEqual(len(layer.to_data()[core.KEY_CHILDREN]), 1)
+
+        layer.add_child(Rectangle(0, 10, 10, 10, color=(0, 255, 0, 255)))
+        self.assertEqual(len(layer.to_data()[core.KEY_CHILDREN]), 2)
+
+        child.color = (0, 0, 255, 255)
+        layer.mark_dirty()
+        self.assertEqual(layer.to_data()[core.KEY_CHILDREN][0][core.KEY_COLOR], (0, 0, 255, 255))
+
+    def test_descendant_change_invalidates_children(self):
+        layer = ScrollableLayer(0, 0, 100, 100)
+        child = Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255))
+        layer.add_child(child)
+        layer.to_data()
+
+        child.color = (0, 0, 255, 255)
+        self.assertEqual(layer.to_data()[core.KEY_CHILDREN][0][core.KEY_COLOR], (0, 0, 255, 255))
+
+    def test_extend_children_invalidates_children(self):
+        layer = ScrollableLayer(0, 0, 100, 100)
+        layer.add_child(Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255)))
+        self.assertEqual(len(layer.to_data()[core.KEY_CHILDREN]), 1)
+
+        layer.extend_children(Rectangle(0, 10 * i, 10, 10, color=(0, 255, 0, 255)) for i in range(1, 4))
+        self.assertEqual(len(layer.children), 4)
+        self.assertEqual(len(layer.to_data()[core.KEY_CHILDREN]), 4)
+
+    def test_cull_offscreen_slices_sorted_children(self):
+        layer = ScrollableLayer(0, 0, 100, 100, cull_offscreen=True)
+        layer.extend_children(Rectangle(0, 50 * i, 100, 50, color=(0, 0, 0, 255), id=f"r{i}")
+                              for i in range(10))
+
+        def ids():
+            return [c[core.KEY_ID] for c in layer.to_data()[core.KEY_CHILDREN]]
+
+        self.assertEqual(ids(), ["r0", "r1"])
+
+        layer.scroll_y = 120
+        self.assertEqual(ids(), ["r2", "r3", "r4"])
+        first = layer.to_data()[core.KEY_CHILDREN]
+        layer.scroll_y = 130
+        self.assertIs(layer.to_data()[core.KEY_CHILDREN], first)
+
+    def test_cull_offscreen_keeps_order_and_unknown_geometry(self):
+        layer = ScrollableLayer(0, 0, 100, 100, scroll_y=200, cull_offscreen=True)
+        layer.add_child(Rectangle(0, 250, 10, 10, color=(0, 0, 0, 255), id="visible"))
+        layer.add_child(Rectangle(0, 0, 10, 10, color=(0, 0, 0, 255), id="above"))
+        layer.add_child(Rectangle(0, 0, 10, "auto", color=(0, 0, 0, 255), id="unknown"))
+        ids = [c[core.KEY_ID] for c in layer.to_data()[core.KEY_CHILDREN]]
+        self.assertEqual(ids, ["visible", "unknown"])
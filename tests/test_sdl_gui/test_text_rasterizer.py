@@ -0,0 +1,79 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui.rendering import text_rasterizer
+from sdl_gui.rendering.text_rasterizer import TextRasterizer
+
+
+@patch.object(text_rasterizer.sdl2, "SDL_PushEvent")
+class TestTextRasterizer(unittest.TestCase):
+    def setUp(self):
+        self.rasterizer = TextRasterizer(threading.Lock())
+
+    def tearDown(self):
+        self.rasterizer.shutdown()
+
+    def _wait(self, key):
+        self.rasterizer._pending[key].result(timeout=5)
+
+    def test_surface_is_returned_once_ready(self, mock_push):
+        """The first request submits the job; a later one collects the surface."""
+        surface = MagicMock()
+        render = MagicMock(return_value=surface)
+
+        self.assertIsNone(self.rasterizer.request("a", render))
+        self.assertTrue(self.rasterizer.is_pending("a"))
+        self._wait("a")
+
+        self.assertIs(self.rasterizer.request("a", render), surface)
+        self.assertFalse(self.rasterizer.has_pending())
+        render.assert_called_once()
+        mock_push.assert_called_once()
+
+    def test_render_errors_give_no_surface(self, mock_push):
+        """A failing render is collected as a missing surface."""
+        self.rasterizer.request("a", MagicMock(side_effect=RuntimeError))
+        self._wait("a")
+        self.assertIsNone(self.rasterizer.request("a", MagicMock()))
+        self.assertFalse(self.rasterizer.has_pending())
+
+    def test_failed_job_is_not_submitted_again(self, mock_push):
+        """A key whose render gave no surface is not rendered on every frame."""
+        render = MagicMock(return_value=None)
+        self.rasterizer.request("a", render)
+        self._wait("a")
+        self.assertIsNone(self.rasterizer.request("a", render))
+        self.assertIsNone(self.rasterizer.request("a", render))
+        self.assertFalse(self.rasterizer.is_pending("a"))
+        render.assert_called_once()
+
+    @patch.object(text_rasterizer.sdl2, "SDL_FreeSurface")
+    def test_end_frame_drops_unrequested_jobs(self, mock_free, mock_push):
+        """Jobs the frame did not request are dropped and their surfaces freed."""
+        surface = MagicMock()
+        self.rasterizer.request("a", MagicMock(return_value=surface))
+        self._wait("a")
+        self.rasterizer.end_frame()
+        self.assertTrue(self.rasterizer.has_pending())
+
+        self.rasterizer.end_frame()
+
+        self.assertFalse(self.rasterizer.has_pending())
+        mock_free.assert_called_once_with(surface)
+
+    @patch.object(text_rasterizer.sdl2, "SDL_FreeSurface")
+    def test_discard_frees_uncollected_surfaces(self, mock_free, mock_push):
+        """Surfaces nobody collected are freed when the jobs are dropped."""
+        surface = MagicMock()
+        self.rasterizer.request("a", MagicMock(return_value=surface))
+        self._wait("a")
+
+        self.rasterizer.discard()
+
+        mock_free.assert_called_once_with(surface)
+        self.assertFalse(self.rasterizer.has_pending())
+
+
+if __name__ == '__main__':
+    unittest.main()
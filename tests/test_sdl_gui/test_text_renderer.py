@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdl_gui.rendering import text_renderer
+from sdl_gui.rendering.text_renderer import TextRenderer
+
+
+class TestTextCaches(unittest.TestCase):
+    def setUp(self):
+        self.renderer = TextRenderer(MagicMock(), MagicMock())
+
+    @patch.object(text_renderer, "GLYPH_CACHE_LIMIT", 2)
+    def test_least_recently_used_entry_is_evicted(self):
+        """A full cache drops the entry used least recently."""
+        cache = self.renderer._text_texture_cache
+        self.renderer._lru_put(cache, ("a",), 1)
+        self.renderer._lru_put(cache, ("b",), 2)
+        self.assertEqual(self.renderer._lru_get(cache, ("a",)), 1)
+
+        self.renderer._lru_put(cache, ("c",), 3)
+
+        self.assertEqual(list(cache), [("a",), ("c",)])
+
+    def test_measure_does_not_rasterize(self):
+        """Text is measured from the font metrics and measured once."""
+        if not self.renderer.ttf_available:
+            self.skipTest("SDL_ttf unavailable")
+        with patch.object(text_renderer.sdl2.ext.FontManager, "render") as mock_render:
+            first = self.renderer.measure_text_width("Hello", font_size=14)
+            second = self.renderer.measure_text_width("Hello", font_size=14)
+        mock_render.assert_not_called()
+        self.assertGreater(first, 0)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.renderer._text_measurement_cache), 1)
+
+
+    def test_bold_style_set_under_ttf_lock(self):
+        """The bold style is set on a new font while holding the SDL_ttf lock."""
+        held = []
+
+        def set_style(*args):
+            held.append(self.renderer._ttf_lock.locked())
+
+        with patch.object(text_renderer.sdl2.ext, "FontManager"), \
+             patch.object(text_renderer.sdlttf, "TTF_SetFontStyle",
+                          side_effect=set_style):
+            self.renderer._get_font_manager("font.ttf", 12, (0, 0, 0, 255), bold=True)
+        self.assertEqual(held, [True])
+
+class TestAsyncRasterization(unittest.TestCase):
+    def setUp(self):
+        self.renderer = TextRenderer(MagicMock(), MagicMock())
+        self.renderer.set_async_rasterization(True)
+
+    def tearDown(self):
+        self.renderer.set_async_rasterization(False)
+
+    @patch.object(text_renderer.sdl2, "SDL_FreeSurface")
+    @patch.object(text_renderer.sdl2.ext, "Texture")
+    def test_line_is_drawn_once_rasterized(self, mock_texture, mock_free):
+        """A new line is skipped while rasterizing and drawn from the next frame."""
+        mock_texture.return_value.size = (40, 10)
+        fm = MagicMock()
+        settings = {"font_path": None, "size": 14, "color": (0, 0, 0, 255),
+                    "fm": fm, "align": "left", "line_h": 10}
+
+        with patch.object(text_renderer.sdl2, "SDL_PushEvent"):
+            self.renderer._draw_plain_text_lines(["Hello"], settings, (0, 0, 100, 20))
+            self.renderer.renderer.copy.assert_not_called()
+            self.assertTrue(self.renderer.has_pending_text())
+            self.renderer.rasterizer._pending[(None, 14, (0, 0, 0, 255), "Hello")].result(timeout=5)
+
+            self.renderer._draw_plain_text_lines(["Hello"], settings, (0, 0, 100, 20))
+
+        fm.render.assert_called_once_with("Hello")
+        self.renderer.renderer.copy.assert_called_once()
+        self.assertFalse(self.renderer.has_pending_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
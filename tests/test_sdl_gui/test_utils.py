@@ -0,0 +1,31 @@
+import unittest
+
+from sdl_gui.utils import parse_dimension, resolve_val
+
+
+class TestResolveVal(unittest.TestCase):
+    def test_numbers(self):
+        """Numbers are used as pixels."""
+        self.assertEqual(resolve_val(40, 800), 40)
+        self.assertEqual(resolve_val(12.7, 800), 12)
+
+    def test_strings(self):
+        """Percentages scale with the parent, pixel strings do not."""
+        self.assertEqual(resolve_val("50%", 801), 400)
+        self.assertEqual(resolve_val("12.5%", 80), 10)
+        self.assertEqual(resolve_val("10px", 800), 10)
+        self.assertEqual(resolve_val("25", 800), 25)
+        self.assertEqual(resolve_val("auto", 800), 0)
+        self.assertEqual(resolve_val("bad%", 800), 0)
+
+    def test_strings_are_parsed_once(self):
+        """Repeated strings are served from the parse cache."""
+        parse_dimension.cache_clear()
+        for parent in (100, 200, 300):
+            resolve_val("30%", parent)
+        info = parse_dimension.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
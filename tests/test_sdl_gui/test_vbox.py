@@ -20,3 +20,17 @@ class TestVBox(unittest.TestCase):
         self.assertEqual(data[core.KEY_TYPE], core.TYPE_VBOX)
         self.assertEqual(data[core.KEY_PADDING], (10, 10, 10, 10))
         self.assertEqual(len(data[core.KEY_CHILDREN]), 2)
+
+    def test_vbox_uses_slots(self):
+        """VBox instances store their fields in slots, not a per-instance dict."""
+        vbox = VBox(x=0, y=0, width="100%", height="auto")
+        self.assertFalse(hasattr(vbox, "__dict__"))
+
+    def test_extend_children_keeps_order(self):
+        """extend_children appends a batch in order, like repeated add_child."""
+        vbox = VBox(x=0, y=0, width="100%", height="auto")
+        rects = [Rectangle(x=0, y=0, width=10, height=i + 1, color=(0, 0, 0, 255)) for i in range(3)]
+        vbox.extend_children(rects)
+
+        heights = [child[core.KEY_RECT][3] for child in vbox.to_data()[core.KEY_CHILDREN]]
+        self.assertEqual(heights, [1, 2, 3])
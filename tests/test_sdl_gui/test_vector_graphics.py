@@ -0,0 +1,43 @@
+import unittest
+
+import sdl2
+
+from sdl_gui import core
+from sdl_gui.primitives.vector_graphics import VectorGraphics
+from sdl_gui.window.window import Window
+
+
+class TestPolyLine(unittest.TestCase):
+    def test_single_command(self):
+        """poly_line records all its points in one command."""
+        vg = VectorGraphics(0, 0, 100, 100)
+        vg.poly_line((10, "50%", 90), [20, 30, "100%"])
+
+        commands = vg.to_data()[core.KEY_COMMANDS]
+
+        self.assertEqual(commands, [{core.CMD_TYPE: core.CMD_POLYLINE,
+                                     "xs": [10, "50%", 90], "ys": [20, 30, "100%"]}])
+
+    def test_renders_like_line_to(self):
+        """A polyline draws the same pixels as the equivalent line_to calls."""
+        xs, ys = [40, 70, 90, 20], [80, 10, 60, 50]
+        with_lines = VectorGraphics(0, 0, 100, 100, id="lines").move_to(5, 5).stroke((255, 0, 0, 255), width=3)
+        for x, y in zip(xs, ys):
+            with_lines.line_to(x, y)
+        with_polyline = VectorGraphics(0, 0, 100, 100, id="polyline").move_to(5, 5).stroke((255, 0, 0, 255), width=3)
+        with_polyline.poly_line(xs, ys)
+
+        window = Window("Test", 100, 100, renderer_flags=sdl2.SDL_RENDERER_SOFTWARE)
+        self.addCleanup(window.close)
+        pixels = []
+        for vg in (with_lines, with_polyline):
+            window.renderer.clear((0, 0, 0, 255))
+            window.render([vg.to_data()])
+            pixels.append([window.renderer.get_pixel(x, y) for x in range(0, 100, 3) for y in range(0, 100, 3)])
+
+        self.assertIn((255, 0, 0, 255), pixels[0])
+        self.assertEqual(pixels[0], pixels[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
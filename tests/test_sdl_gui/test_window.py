@@ -252,3 +252,40 @@ class TestWindow(unittest.TestCase):
 
 
 
+    @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.window.window.Renderer")
+    @patch("sdl_gui.window.window.sdl2.ext")
+    @patch("sdl_gui.window.window.sdl2")
+    def test_unchanged_frame_is_not_redrawn(self, mock_sdl2, mock_ext, mock_renderer_cls, mock_debug):
+        """Rendering the same, unmodified display list again draws nothing."""
+        mock_renderer = mock_renderer_cls.return_value
+        mock_renderer.has_pending_redraw.return_value = False
+        mock_renderer.is_animating.return_value = False
+        mock_renderer.content_hash.side_effect = lambda items: hash(repr(items))
+        mock_ext.Window.return_value.size = (800, 600)
+        win = Window("Test", 800, 600)
+        rect = {"type": "rect", "rect": [10, 10, 50, 50], "color": (255, 0, 0, 255)}
+        display_list = [rect]
+
+        for _ in range(3):
+            win.render(display_list)
+        # The second frame records the content the third one is compared with
+        self.assertEqual(mock_renderer.render_list.call_count, 2)
+
+        rect["color"] = (0, 255, 0, 255)  # Edited in place
+        win.render(display_list)
+        self.assertEqual(mock_renderer.render_list.call_count, 3)
+
+        mock_renderer.has_pending_redraw.return_value = True
+        win.render(display_list)
+        win.render(display_list, force_full=True)
+        self.assertEqual(mock_renderer.render_list.call_count, 5)
+
+        # A blinking cursor is redrawn although the list is unchanged
+        mock_renderer.has_pending_redraw.return_value = False
+        mock_renderer.is_animating.return_value = True
+        win.render(display_list)
+        win.render(display_list)
+        self.assertEqual(mock_renderer.render_list.call_count, 7)
+
+
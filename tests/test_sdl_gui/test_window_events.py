@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import sdl2
+
 from sdl_gui import core
 from sdl_gui.window.window import Window
 
@@ -20,12 +22,12 @@ class TestWindowEvents(unittest.TestCase):
 
         win = Window("Test", 800, 600)
 
-        # Mock SDL get_events
+        # Mock the drained SDL events
         mock_event = MagicMock()
         mock_event.type = mock_sdl2.SDL_MOUSEBUTTONDOWN
         mock_event.button.x = 50
         mock_event.button.y = 50
-        mock_ext.get_events.return_value = [mock_event]
+        win._drain_sdl_events = MagicMock(return_value=[mock_event])
 
         # 1. Render a scene with a clickable rect
         display_list = [
@@ -72,12 +74,12 @@ class TestWindowEvents(unittest.TestCase):
 
         win = Window("Test", 800, 600)
 
-        # Mock SDL get_events (Click at 200, 200)
+        # Mock the drained SDL events (Click at 200, 200)
         mock_event = MagicMock()
         mock_event.type = mock_sdl2.SDL_MOUSEBUTTONDOWN
         mock_event.button.x = 200
         mock_event.button.y = 200
-        mock_ext.get_events.return_value = [mock_event]
+        win._drain_sdl_events = MagicMock(return_value=[mock_event])
 
         # Rect at (0,0) size 100x100
         display_list = [
@@ -96,3 +98,19 @@ class TestWindowEvents(unittest.TestCase):
         self.assertEqual(len(ui_events), 1)
         self.assertEqual(ui_events[0]["type"], core.EVENT_TICK)
 
+    def test_drain_reads_more_than_one_buffer(self):
+        """Queues longer than the event buffer are drained in full and in order."""
+        sdl2.SDL_Init(sdl2.SDL_INIT_EVENTS)
+        self.addCleanup(sdl2.SDL_QuitSubSystem, sdl2.SDL_INIT_EVENTS)
+        sdl2.SDL_FlushEvents(sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+        for code in range(100):
+            event = sdl2.SDL_Event()
+            event.type = sdl2.SDL_USEREVENT
+            event.user.code = code
+            sdl2.SDL_PushEvent(event)
+
+        win = Window.__new__(Window)
+        win._event_buffer = (sdl2.SDL_Event * 64)()
+        codes = [event.user.code for event in win._drain_sdl_events()]
+
+        self.assertEqual(codes, list(range(100)))
@@ -46,3 +46,29 @@ class TestWindowResize(unittest.TestCase):
         print(f"DEBUG: fill call count: {mock_renderer.fill.call_count}")
         # mock_rend_sdl2.SDL_RenderFillRects.assert_called()
         pass
+
+    @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.window.renderer.sdl2.ext")
+    @patch("sdl_gui.window.renderer.sdl2")
+    @patch("sdl_gui.rendering.text_renderer.sdlttf")
+    @patch("sdl_gui.window.window.sdl2.ext")
+    @patch("sdl_gui.window.window.sdl2")
+    def test_resize_keeps_text_glyphs(self, mock_sdl2, mock_ext, mock_ttf, mock_rend_sdl2, mock_rend_ext, mock_debug):
+        """A resize drops wrapped text layouts but keeps word textures and measurements."""
+        mock_window_instance = MagicMock()
+        mock_ext.Window.return_value = mock_window_instance
+        type(mock_window_instance).size = PropertyMock(return_value=(800, 600))
+        win = Window("Test", 800, 600)
+        win.render([])
+
+        text_renderer = win.renderer.text_renderer
+        text_renderer._text_texture_cache["word"] = (MagicMock(), (10, 10))
+        text_renderer._text_measurement_cache["word"] = (10, 10)
+        text_renderer._rich_text_layout_cache["para"] = ([], {})
+
+        type(mock_window_instance).size = PropertyMock(return_value=(1024, 768))
+        win.render([])
+
+        self.assertIn("word", text_renderer._text_texture_cache)
+        self.assertIn("word", text_renderer._text_measurement_cache)
+        self.assertNotIn("para", text_renderer._rich_text_layout_cache)
@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 # Ensure src is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
@@ -69,3 +69,20 @@ class TestWindowUtils(unittest.TestCase):
                  mock_push.assert_called_with(win)
 
              mock_pop.assert_called()
+
+    @patch("sdl_gui.window.window.DebugServer")
+    @patch("sdl_gui.window.window.Renderer")
+    @patch("sdl_gui.window.window.sdl2.ext")
+    @patch("sdl_gui.window.window.sdl2")
+    def test_ignore_unused_events(self, mock_sdl2, mock_ext, mock_renderer_cls,
+                                  mock_debug):
+        """Unused event types are ignored; text input stops only on request."""
+        win = Window("Events", 100, 100)
+
+        win.ignore_unused_events(event_types=(1, 2))
+        mock_sdl2.SDL_EventState.assert_has_calls(
+            [call(1, mock_sdl2.SDL_IGNORE), call(2, mock_sdl2.SDL_IGNORE)])
+        mock_sdl2.SDL_StopTextInput.assert_not_called()
+
+        win.ignore_unused_events(text_input=False, event_types=())
+        mock_sdl2.SDL_StopTextInput.assert_called_once()